@@ -6,6 +6,8 @@ class AlgorithmSubscriber:
     """
     Allows to subscribe to algorithm updates.
     """
+    # algorithms create neighbour states only for subscribers interested in them
+    tracks_neighbours: bool = False
 
     def __init__(self):
         self.__algorithm = None
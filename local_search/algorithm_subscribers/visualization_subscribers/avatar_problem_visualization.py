@@ -20,8 +20,8 @@ class AvatarProblemVisualization(VisualizationSubscriber):
 class AvatarStateDrawer(StateDrawer):
 
     def draw_state(self, screen, model: AvatarProblem, state: AvatarState):
-        mode, im_size, data = state.image.mode, state.image.size, state.image.tobytes()
-        py_image = pygame.image.fromstring(data, im_size, mode)
+        im_size = state.size
+        py_image = pygame.image.frombuffer(state.canvas.tobytes(), im_size, 'RGB')
         screen_size = screen.get_width(), screen.get_height()
         scaled_im_size = self._get_new_im_size(screen_size, im_size)
         scaled_image = self._scale_image(py_image, scaled_im_size)
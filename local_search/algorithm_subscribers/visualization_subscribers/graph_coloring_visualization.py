@@ -51,16 +51,14 @@ class GraphColoringStateDrawer(StateDrawer):
         self._draw_vertices(screen, model, state)
 
     def _draw_lines(self, screen, model: GraphColoringProblem):
-        graph = [list(model.graph[i]) for i in range(model.n_vertices)]
+        starts, ends = model.adjacency.edges()
         extremes = self._find_extremes()
 
-        for i in range(len(graph)):
-            for j in range(len(graph[i])):
-                pygame.draw.line(screen, EDGE_COLOR,
-                                 self._scale(self.coords[i], screen, extremes),
-                                 self._scale(
-                                     self.coords[graph[i][j]], screen, extremes),
-                                 3)
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            pygame.draw.line(screen, EDGE_COLOR,
+                             self._scale(self.coords[start], screen, extremes),
+                             self._scale(self.coords[end], screen, extremes),
+                             3)
 
     def _find_extremes(self):
         min_x = min(vertex[0] for vertex in self.coords)
@@ -75,7 +73,7 @@ class GraphColoringStateDrawer(StateDrawer):
         for i in range(len(self.coords)):
             x, y = self._scale(self.coords[i], screen, extremes)
             pygame.draw.circle(
-                screen, colors[state.coloring[i].color], (x, y), 10)
+                screen, colors[state.colors[i]], (x, y), 10)
             pygame.draw.circle(screen, (0, 0, 0), (x, y), 10, 2)
 
     def _get_colors(self, model: GraphColoringProblem):
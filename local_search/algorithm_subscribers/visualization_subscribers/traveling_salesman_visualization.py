@@ -37,7 +37,7 @@ class TravelingSalesmanStateDrawer(StateDrawer):
 
     def _scale(self, point, model: TravelingSalesmanProblem, screen):
         min_x, max_x, min_y, max_y = self._find_extreme(model)
-        x, y = point.x, point.y
+        x, y = point
         x -= min_x
         y -= min_y
         x = x * (screen.get_width() / (max_x - min_x))
@@ -53,10 +53,8 @@ class TravelingSalesmanStateDrawer(StateDrawer):
         return x, y
 
     def _find_extreme(self, model: TravelingSalesmanProblem):
-        min_x = min(point.x for point in model.points)
-        max_x = max(point.x for point in model.points)
-        min_y = min(point.y for point in model.points)
-        max_y = max(point.y for point in model.points)
+        min_x, min_y = model.points.min(axis=0)
+        max_x, max_y = model.points.max(axis=0)
 
         return min_x, max_x, min_y, max_y
 
@@ -14,27 +14,11 @@ class BestChoiceHillClimbing(HillClimbing):
     """
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
-        # - look first at the `first_choice_hill_climbing.py` and understand it
-        # - go trough all the neighbors :
-        #   [1] `self._get_neighbours` is your friend
-        # - find the worst, but still improving improving state 
-        #   [1] one with minimal model.improvement(....) > 0 
-        # return it (or the current state if there is no improving state)!
-
-        improvement=[state]
-
-        for neighbour in self._get_neighbours(model, state):
-            if model.improvement(neighbour, state) > 0:
-                improvement.append(neighbour)
-
-        n = len(improvement)
-
-        for i in range(n):
-            for j in range(0, n - 1):
-                if model.improvement(improvement[j], improvement[j+1]) > 0:
-                    improvement[j], improvement[j + 1] = improvement[j + 1], improvement[j]
-
-        
-        return improvement[-1]
-
-        raise NotImplementedError()
+        """
+                Returns the neighbor with the biggest improvement.
+                Otherwise stays in the current state (indicating local optimum)
+        """
+        best_move = self._best_improving_move(model, state)
+        if best_move is None:
+            return state
+        return best_move.make()
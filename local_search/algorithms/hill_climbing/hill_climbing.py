@@ -4,6 +4,7 @@ from typing import Union, Callable
 
 from local_search.algorithms.algorithm_config import AlgorithmConfig
 from local_search.algorithms.subscribable_algorithm import SubscribableAlgorithm
+from local_search.problems.base.moves import Move
 from local_search.problems.base.state import State
 from local_search.problems.base.problem import Problem
 from enum import IntEnum, auto
@@ -44,6 +45,22 @@ class HillClimbing(SubscribableAlgorithm, ABC):
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
         "there are many ways to climb the hill..."
 
+    def _best_improving_move(self, model: Problem, state: State, worst: bool = False) -> Union[Move[State], None]:
+        """
+        Returns the move with the biggest (or the smallest positive one, if `worst` is set) improvement,
+        None if no move improves the state.
+        The neighbourhood is evaluated in batch, if the move generator supports it and no subscriber tracks neighbours.
+        """
+        if model.move_generator.supports_batch_evaluation and not self._tracks_neighbours():
+            return model.move_generator.best_improving_move(state, model.goal, worst)
+        chosen_move, chosen_improvement = None, None
+        for move in self._get_moves(model, state):
+            improvement = model.move_improvement(move)
+            if improvement > 0 and (chosen_improvement is None
+                                    or (improvement < chosen_improvement if worst else improvement > chosen_improvement)):
+                chosen_move, chosen_improvement = move, improvement
+        return chosen_move
+
     def escape_local_optimum(self, model: Problem, state: State, best_state: State) -> Union[State, None]:
         self._local_optimum_escapes += 1
         if self._local_optimum_escapes > self.config.local_optimum_escapes_max >= 0:
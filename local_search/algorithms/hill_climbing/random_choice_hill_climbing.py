@@ -13,20 +13,11 @@ class RandomChoiceHillClimbing(HillClimbing):
     """
 
     def _climb_the_hill(self, model: Problem, state: State) -> Union[State, None]:
-        # - look first at the `first_choice_hill_climbing.py` and understand it
-        # - get single random neighbor:
-        #   [1] use `self._get_random_neighbours(model, state)`` instead of `self._get_neighbours(model, state)`;
-        #       it's an iterator over neighbors in random order
-        #   [2] in python `next(iterator)` takes a single element from iterator ;)
-        # - if the random state is better than the current one, return it
-        #   [1] `model.improvement` is your friend
-        # - otherwise return the current state
-        
-        n = iter(self._get_random_neighbours(model, state))
-        for neighbour in n:
-            n2 = next(n)
-            if model.improvement(n2, neighbour) > 0:
-                return n2
-            else:
-                return state
-        raise NotImplementedError()
\ No newline at end of file
+        """
+                Returns a random neighbor if it improves the current state.
+                Otherwise stays in the current state
+        """
+        move = next(self._get_random_moves(model, state), None)
+        if move is not None and model.move_improvement(move) > 0:
+            return move.make()
+        return state
@@ -50,48 +50,24 @@ class SimulatedAnnealing(SubscribableAlgorithm):
         super().__init__(config=config)
 
     def _find_next_state(self, model: Problem, state: State) -> Union[State, None]:
-        # TODO:
-        # — find random neighbour:
-        #   [1] `self._get_random_neighbours` creates a generator of the random neighbors
-        #   [2] use `next` to read a single element from a generator, e.g. `next(generator)`
+        # — find random move and check how much it improves the current state
         # — if the neighbour is better then mark is as the next state:
-        #   [1] use `model.improvement` to check for improvement
         # — otherwise calculate the probability of transition using `self._calculate_transition_probability`
-        #   [1] use random.random() to generate a random number from range [0,1];
-        #   [2] compare it to the probability to check if algorithm should go to the new state
-        # — update temperature using `self._update_temperature`
-        # — return the new state
-        #----------------my code start---------------------------------------
-        random_neighbours = self._get_random_neighbours(model, state)
-        next_state = next(random_neighbours)
-        if model.improvement(state, next_state) > 0:
+        # — update temperature using `self._update_temperature` if the move was accepted
+        move = next(self._get_random_moves(model, state), None)
+        if move is None:
+            return state
+        improvement = model.move_improvement(move)
+        if improvement > 0 or random.random() < self._calculate_transition_probability(improvement):
             self._update_temperature()
-            return next_state
-        else:
-            transition_probability = self._calculate_transition_probability(model, state, next_state)
-            if random.random() < transition_probability:
-                self._update_temperature()
-                return next_state
-            else:
-                return state
-        #----------------end my code---------------------------------------
-        #raise NotImplementedError()
-
-    def _calculate_transition_probability(self, model: Problem, old_state: State, new_state: State) -> float:
-        # TODO:
-        # - calculate probability of transition according to the metropolis function
-        #   p = exp(delta / temperature) [1]
-        # where: 
-        #   - delta is the improvement of the objective function[2]
-        #
-        # [1] `mpmath.exp` calculates `exp` function
-        # [2] `model.improvement` method
-        #----------------my code start---------------------------------------
-        delta = model.improvement(old_state, new_state)
-        p = mpmath.exp(delta / self.temperature)
-        return p
-        #----------------end my code---------------------------------------
-        #raise NotImplementedError()
+            return move.make()
+        return state
+
+    def _calculate_transition_probability(self, improvement: float) -> float:
+        # probability of transition according to the metropolis function
+        #   p = exp(delta / temperature)
+        # where delta is the (non-positive) improvement of the objective function
+        return mpmath.exp(improvement / self.temperature)
 
     def _update_temperature(self):
         # TODO:
@@ -7,6 +7,7 @@ from local_search.algorithm_subscribers.algorithm_subscriber import AlgorithmSub
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.algorithms.algorithm import Algorithm
 from local_search.algorithms.algorithm_config import DEFAULT_CONFIG, AlgorithmConfig
+from local_search.problems.base.moves import Move
 from local_search.problems.base.problem import Problem
 from local_search.problems.base.state import State
 from dataclasses import dataclass
@@ -85,6 +86,16 @@ class SubscribableAlgorithm(Algorithm):
             self._on_next_neighbour(model, state, neighbour)
             yield neighbour
 
+    def _get_moves(self, model: Problem, state: State) -> Generator[Move[State], None, None]:
+        for move in model.move_generator.available_moves(state):
+            self._on_next_move(model, state, move)
+            yield move
+
+    def _get_random_moves(self, model: Problem, state: State) -> Generator[Move[State], None, None]:
+        for move in model.move_generator.random_moves(state):
+            self._on_next_move(model, state, move)
+            yield move
+
     def _is_stuck_in_local_optimum(self):
         return self.steps_from_last_state_update >= self.config.local_optimum_moves_threshold
 
@@ -110,6 +121,12 @@ class SubscribableAlgorithm(Algorithm):
 
         return next_state
 
+    def solution_state(self, state: State) -> State:
+        """
+        Returns the state reported as the solution when the search is stopped at the state
+        """
+        return state
+
     def _update_algorithm_state(self, model: Problem, state, new_state: State):
         if self.best_state is None:
             self.best_state = new_state
@@ -134,6 +151,21 @@ class SubscribableAlgorithm(Algorithm):
             subscribtion.subscriber.on_next_neighbour(
                 model, from_state, next_neighbour)
 
+    def _tracks_neighbours(self) -> bool:
+        """Tells whether any subscriber needs to see every explored neighbour"""
+        return any(subscribtion.subscriber.tracks_neighbours for subscribtion in self._subscribtions)
+
+    def _on_next_move(self, model: Problem, from_state: State, move: Move[State]):
+        """Called when algorithm explores next move, neighbour is created only if some subscriber needs it"""
+        subscribtions = [subscribtion for subscribtion in self._subscribtions
+                         if subscribtion.subscriber.tracks_neighbours]
+        if not subscribtions:
+            return
+        next_neighbour = move.make()
+        for subscribtion in subscribtions:
+            subscribtion.subscriber.on_next_neighbour(
+                model, from_state, next_neighbour)
+
     def _on_solution(self, model: Problem, solution: State):
         for subscribtion in self._subscribtions:
             subscribtion.subscriber.on_solution(model=model, solution=solution)
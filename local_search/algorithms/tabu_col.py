@@ -0,0 +1,148 @@
+import random
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from local_search.algorithms import SubscribableAlgorithm, AlgorithmConfig
+from local_search.problems.base.problem import Problem
+from local_search.problems.graph_coloring_problem.models.conflict_table import ConflictTable
+from local_search.problems.graph_coloring_problem.moves.change_color import ChangeColorMove
+from local_search.problems.graph_coloring_problem.problem import GraphColoringProblem
+from local_search.problems.graph_coloring_problem.state import GraphColoringState
+
+
+@dataclass
+class TabuColConfig(AlgorithmConfig):
+    local_optimum_moves_threshold: int = 1000
+    tabu_tenure: int = 10
+    tabu_tenure_conflicts_ratio: float = 0.6
+
+
+DEFAULT_CONFIG = TabuColConfig()
+
+
+class TabuCol(SubscribableAlgorithm):
+    """
+    Implementation of the TabuCol tabu search for the graph coloring problem.
+
+    Every step recolors a conflicting vertex (one having a neighbour of the same color) to another used color,
+    choosing the move that removes the most conflicts. Moves giving a vertex its color back are tabu for
+    `tabu_tenure + tabu_tenure_conflicts_ratio * (number of conflicting vertices)` steps, unless they lead
+    to fewer conflicts than ever seen with the current number of colors. Once the coloring has no conflicts,
+    the smallest color class is dropped, its vertices getting the colors of their fewest neighbours,
+    and the search continues with one color less, so the last proper coloring with the fewest colors
+    is kept as the best state and returned when the search is stopped.
+
+    The problem's conflict table follows the current state, so evaluating the whole neighbourhood takes
+    O(conflicting vertices x colors) time. Works only for `GraphColoringProblem`.
+    """
+
+    def __init__(self, config: TabuColConfig = None):
+        self.config = config or DEFAULT_CONFIG
+        self._local_optimum_escapes = 0
+        self._step = 0
+        # step up to which giving the color back to the vertex is tabu
+        self._tabu_until = np.zeros((0, 0), dtype=np.int64)
+        self._best_conflicts: Union[int, None] = None
+        self._best_is_proper = False
+        super().__init__(config=self.config)
+
+    def _find_next_state(self, model: Problem, state: GraphColoringState) -> Union[GraphColoringState, None]:
+        conflicts: ConflictTable = model.conflicts
+        conflicts.sync(state)
+        if not conflicts.conflicting:
+            return self._drop_color(model, state)
+        self._step += 1
+        vertices = np.fromiter(conflicts.conflicting, dtype=np.int64, count=len(conflicts.conflicting))
+        colors = np.array(state.used_colors, dtype=np.int64)
+        self._ensure_tabu_size(len(state.colors), int(colors[-1]) + 1)
+        old_colors = state.colors[vertices]
+        # changes of the number of bad edges after recoloring the vertex (row) to the color (column)
+        deltas = conflicts.neighbour_colors[vertices[:, None], colors[None, :]] \
+            - conflicts.vertex_conflicts[vertices, None]
+        tabu = self._tabu_until[vertices[:, None], colors[None, :]] > self._step
+        aspiration = conflicts.n_bad_edges + deltas < self._best_conflicts
+        allowed = (~tabu | aspiration) & (colors[None, :] != old_colors[:, None])
+        if not allowed.any():
+            return state
+        deltas = np.where(allowed, deltas, np.iinfo(np.int64).max)
+        rows, columns = np.nonzero(deltas == deltas.min())
+        choice = random.randrange(len(rows))
+        vertex, color = int(vertices[rows[choice]]), int(colors[columns[choice]])
+        self._tabu_until[vertex, old_colors[rows[choice]]] = \
+            self._step + self.config.tabu_tenure + int(self.config.tabu_tenure_conflicts_ratio * len(vertices))
+        next_state = ChangeColorMove(state, vertex, color, model.adjacency, model.bitsets).make()
+        conflicts.sync(next_state, changed=(vertex,))
+        self._best_conflicts = min(self._best_conflicts, conflicts.n_bad_edges)
+        return next_state
+
+    def _drop_color(self, model: Problem, state: GraphColoringState) -> Union[GraphColoringState, None]:
+        """
+        Recolors vertices of the smallest color class to the other colors with the fewest neighbours of them
+        """
+        conflicts: ConflictTable = model.conflicts
+        colors = np.array(state.used_colors, dtype=np.int64)
+        if len(colors) <= 1:
+            return None
+        dropped = int(colors[np.argmin(conflicts.class_sizes[colors])])
+        colors = colors[colors != dropped]
+        vertices = np.flatnonzero(state.colors == dropped)
+        new_colors = colors[np.argmin(conflicts.neighbour_colors[vertices[:, None], colors[None, :]], axis=1)]
+        next_state = state.copy()
+        for vertex, color in zip(vertices.tolist(), new_colors.tolist()):
+            next_state.recolor(vertex, color,
+                               model.adjacency.neighbours_with_colors(next_state.colors, vertex, dropped, color))
+        conflicts.sync(next_state, changed=vertices.tolist())
+        self._best_conflicts = conflicts.n_bad_edges
+        return next_state
+
+    def _ensure_tabu_size(self, n_vertices: int, n_colors: int) -> None:
+        if self._tabu_until.shape[0] < n_vertices or self._tabu_until.shape[1] < n_colors:
+            self._tabu_until = np.pad(self._tabu_until, ((0, max(n_vertices - self._tabu_until.shape[0], 0)),
+                                                         (0, max(n_colors - self._tabu_until.shape[1], 0))))
+
+    def next_state(self, model: Problem, state: GraphColoringState) -> Union[GraphColoringState, None]:
+        if not isinstance(model, GraphColoringProblem):
+            raise ValueError(f'{type(self).__name__} works only for {GraphColoringProblem.__name__}, '
+                             f'not for {type(model).__name__}')
+        if self._best_conflicts is None:
+            model.conflicts.sync(state)
+            self._best_conflicts = model.conflicts.n_bad_edges
+            # the initial state becomes the first best state
+            self._best_is_proper = self.best_state is None and self._best_conflicts == 0
+        return super().next_state(model, state)
+
+    def _update_algorithm_state(self, model: Problem, state: GraphColoringState, new_state: GraphColoringState):
+        """
+        Keeps the proper coloring with the fewest colors as the best state, the objective decides
+        only until the first proper coloring is found. The conflict table follows the new state here.
+        """
+        if model.improvement(new_state, state) > 0:
+            self.steps_from_last_state_update = 0
+        else:
+            self.steps_from_last_state_update += 1
+        if model.conflicts.n_bad_edges == 0:
+            if not self._best_is_proper or len(new_state.used_colors) < len(self.best_state.used_colors):
+                self.best_obj, self.best_state = model.objective_for(new_state), new_state
+                self._best_is_proper = True
+        elif not self._best_is_proper and model.improvement(new_state, self.best_state) > 0:
+            self.best_obj, self.best_state = model.objective_for(new_state), new_state
+
+    def solution_state(self, state: GraphColoringState) -> GraphColoringState:
+        """
+        The current state has usually lost a color and has conflicts, so the best proper coloring is returned
+        """
+        return self.best_state if self._best_is_proper else state
+
+    def escape_local_optimum(self, model: Problem, state: GraphColoringState,
+                             best_state: GraphColoringState) -> Union[GraphColoringState, None]:
+        self._local_optimum_escapes += 1
+        if self._local_optimum_escapes > self.config.local_optimum_escapes_max >= 0:
+            return None
+        next_state = self._random_restart(model)
+        self._tabu_until[:] = 0
+        model.conflicts.sync(next_state)
+        self._best_conflicts = model.conflicts.n_bad_edges
+        self.steps_from_last_state_update = 0
+        return next_state
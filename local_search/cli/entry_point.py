@@ -2,6 +2,7 @@ import click
 from local_search.cli.compare import compare
 from local_search.cli.solve import solve
 from local_search.cli.describe_algorithm import describe_algorithm
+from local_search.cli.generate import generate
 from local_search.cli.show import show
 
 
@@ -16,3 +17,4 @@ entry_point.add_command(solve)
 entry_point.add_command(describe_algorithm)
 entry_point.add_command(show)
 entry_point.add_command(compare)
+entry_point.add_command(generate)
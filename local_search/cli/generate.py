@@ -0,0 +1,20 @@
+import click
+from local_search.problems.base.problem import Problem
+
+
+@click.command('generate')
+@click.argument('problem', required=True,
+                type=click.Choice([name for name, problem in Problem.problems.items() if problem.get_available_generators()]))
+@click.argument('spec', required=True)
+@click.argument('path', required=True, type=click.Path(dir_okay=False, writable=True))
+def generate(problem: str, spec: str, path: str):
+    """
+    Generates a synthetic benchmark and saves it to a file, which can be used as the benchmark of the problem.
+
+    SPEC names the generator and its parameters, e.g. "gnp:n=100000,p=0.0001,seed=1" for graph_coloring_problem
+    or "clustered:n=1000000,seed=1" for traveling_salesman_problem.
+    The same specification can be used as the benchmark directly.
+    """
+    model = Problem.problems[problem]
+    model.save_generated_benchmark(spec, path)
+    click.echo(f'Benchmark is saved to file {path}')
@@ -1,4 +1,5 @@
 import os
+import re
 from pathlib import Path
 
 import click
@@ -14,6 +15,9 @@ from local_search.cli.utils.prompt import \
 import random
 random.seed(42)
 
+# characters which are not allowed in file names on some systems, e.g. ":" of synthetic benchmark specifications
+UNSAFE_FILE_NAME_CHARACTERS = re.compile(r'[^A-Za-z0-9._=-]')
+
 
 @click.command('solve', cls=MarkdownCommand)
 @click.option('-c', '--config_file', type=click.Path(readable=True, exists=True), help='File that provides configuration for run')
@@ -32,7 +36,8 @@ def solve(config_file, **cli_options):
     Common params:
 
         - name: name problem in snake case. All available problems could be found in :see local_search.problems:
-        - benchmark: text file that describes problem
+        - benchmark: text file that describes problem, one of the bundled benchmarks or a path to a file,
+          or a specification of a synthetic benchmark (see the `generate` command)
         - move_generator: name of move generator responsible for generation of moves to generate neighbourhood
         - goal: goal that should be optimized
 
@@ -108,5 +113,5 @@ def create_path_to_save_solution(config):
     }
     for section in name_fragments:
         for key in name_fragments[section]:
-            file_name += f'_{config[section][key]}'
+            file_name += f'_{UNSAFE_FILE_NAME_CHARACTERS.sub("_", Path(str(config[section][key])).name)}'
     return solution_dir/f'{file_name}.json'
@@ -3,12 +3,14 @@ import click
 from local_search.algorithm_subscribers.visualization_subscribers.visualization_subscriber import VisualizationSubscriber
 from local_search.algorithms.hill_climbing.hill_climbing import HillClimbing
 from local_search.algorithms.subscribable_algorithm import SubscribableAlgorithm
+from local_search.algorithms.tabu_col import TabuCol
 from local_search.cli.utils.console import print_section_name
 from local_search.cli.utils.create_dataclass import create_dataclass
 from local_search.cli.utils.prompt import get_or_prompt_if_not_exists_or_invalid
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.helpers.get_type_for_param import get_type_for_param
 from local_search.problems.avatar_problem.problem import AvatarProblem
+from local_search.problems.graph_coloring_problem.problem import GraphColoringProblem
 from local_search.problems.base.problem import Problem
 
 
@@ -38,6 +40,9 @@ def assure_problem_is_solvable_by_algo(config, key: str, problem_model: Problem)
     if isinstance(problem_model, AvatarProblem):
         available_algorithms = available_algorithms - \
             {camel_to_snake(HillClimbing.__name__)}
+    if not isinstance(problem_model, GraphColoringProblem):
+        available_algorithms = available_algorithms - \
+            {camel_to_snake(TabuCol.__name__)}
     algo_name = get_or_prompt_if_not_exists_or_invalid(config, key, {
         'type': click.Choice(list(available_algorithms), case_sensitive=True)
     })
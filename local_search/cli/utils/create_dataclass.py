@@ -1,11 +1,13 @@
 from dataclasses import fields
-from typing import Type
+from typing import Dict, Iterable, Type
 from enum import Enum
+import click
 from local_search.cli.utils.prompt import get_or_prompt_if_not_exists_or_invalid
 
 
-def create_dataclass(options, dataclass: Type):
+def create_dataclass(options, dataclass: Type, choices: Dict[str, Iterable[str]] = None):
     dataclass_config = {}
+    choices = choices or {}
 
     for field in fields(dataclass):
         if issubclass(field.type, Enum):
@@ -13,6 +15,11 @@ def create_dataclass(options, dataclass: Type):
                 'default': field.default.value
             })
             field_value = field.type(value)
+        elif field.name in choices:
+            field_value = get_or_prompt_if_not_exists_or_invalid(options, field.name, {
+                'default': field.default,
+                'type': click.Choice(list(choices[field.name]), case_sensitive=True)
+            })
         else:
             field_value = get_or_prompt_if_not_exists_or_invalid(options, field.name, {
                 'default': field.default,
@@ -6,6 +6,7 @@ import inspect
 from local_search.cli.utils.create_dataclass import create_dataclass
 
 from local_search.cli.utils.prompt import get_or_prompt_if_not_exists_or_invalid
+from local_search.helpers.parse_generator_spec import parse_generator_spec
 from local_search.problems.base.problem import Problem
 
 
@@ -21,10 +22,18 @@ def create_problem_model(options):
 
     available_benchmarks = get_benchmark_names_for_model(model)
     default_benchmark_file = params['benchmark_name'].default
-    benchmark_file = get_or_prompt_if_not_exists_or_invalid(config, 'benchmark', {
-        'type': click.Choice(available_benchmarks, case_sensitive=True),
-        'default': default_benchmark_file
-    })
+    benchmark_file = config.get('benchmark')
+    if benchmark_file is not None and parse_generator_spec(benchmark_file, model.get_available_generators()):
+        # synthetic benchmark created by one of the generators
+        pass
+    elif benchmark_file in available_benchmarks or benchmark_file is None or not os.path.isfile(benchmark_file):
+        benchmark_file = get_or_prompt_if_not_exists_or_invalid(config, 'benchmark', {
+            'type': click.Choice(available_benchmarks, case_sensitive=True),
+            'default': default_benchmark_file
+        })
+    else:
+        # benchmark given as a path to a file outside of the bundled benchmarks
+        benchmark_file = os.path.abspath(benchmark_file)
 
     available_move_generators = list(
         model.get_available_move_generation_strategies())
@@ -51,7 +60,7 @@ def create_problem_model(options):
     if 'config' in from_benchmark_params:
         problem_config = config.setdefault('config', {})
         kwargs['config'] = create_dataclass(
-            problem_config, from_benchmark_params['config'].annotation)
+            problem_config, from_benchmark_params['config'].annotation, model.get_available_config_values())
     return model.from_benchmark(**kwargs)
 
 
@@ -13,6 +13,7 @@ def get_or_prompt_if_not_exists_or_invalid(options, option_key: str, option_conf
         if isinstance(option_config['type'], click.Choice) and options[option_key] not in option_config['type'].choices:
             console.print(
                 f"Value {options[option_key]} is invalid for for option {option_key} in this context.")
+            options[option_key] = None
             get_or_prompt(options, option_key, option_config)
     return options[option_key]
 
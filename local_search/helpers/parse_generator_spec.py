@@ -0,0 +1,46 @@
+import inspect
+from typing import Any, Callable, Dict, Iterable, Mapping, Tuple, Union
+
+
+def parse_generator_spec(spec: str, generators: Union[Mapping[str, Callable], Iterable[str]]) -> Union[Tuple[str, Dict[str, Any]], None]:
+    """
+    Parses a benchmark name like "gnp:n=1000,p=0.01,seed=1" into the name of the generator and its parameters,
+    returns None if the name does not start with one of the generators.
+    If the generators are given as a mapping from their names to the functions, the parameters are checked
+    against the signature of the function. Malformed specifications raise ValueError
+    """
+    name, _, params = spec.partition(':')
+    if name not in generators:
+        return None
+    kwargs = {}
+    for param in filter(None, params.split(',')):
+        key, separator, value = param.partition('=')
+        if not separator or not key.strip() or not value.strip():
+            raise ValueError(f'Invalid benchmark specification "{spec}": expected name=value instead of "{param}"')
+        kwargs[key.strip()] = _parse_value(value.strip())
+    if isinstance(generators, Mapping):
+        _check_params(spec, generators[name], kwargs)
+    return name, kwargs
+
+
+def _check_params(spec: str, generator: Callable, kwargs: Dict[str, Any]) -> None:
+    parameters = inspect.signature(generator).parameters
+    accepted = ", ".join(parameters)
+    unknown = [key for key in kwargs if key not in parameters]
+    if unknown:
+        raise ValueError(f'Invalid benchmark specification "{spec}": unknown parameters {", ".join(unknown)}, '
+                         f'accepted parameters are: {accepted}')
+    missing = [key for key, parameter in parameters.items()
+               if parameter.default is inspect.Parameter.empty and key not in kwargs]
+    if missing:
+        raise ValueError(f'Invalid benchmark specification "{spec}": missing parameters {", ".join(missing)}, '
+                         f'accepted parameters are: {accepted}')
+
+
+def _parse_value(value: str) -> Union[int, float, str]:
+    for value_type in (int, float):
+        try:
+            return value_type(value)
+        except ValueError:
+            pass
+    return value
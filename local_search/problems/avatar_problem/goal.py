@@ -1,5 +1,6 @@
 from typing import Tuple
 from PIL import Image
+from local_search.problems.avatar_problem.rasterizer import Box
 from local_search.problems.avatar_problem.state import AvatarState
 from local_search.problems.base.goal import Goal, GoalType
 from local_search.problems.base.state import State
@@ -7,15 +8,75 @@ import numpy as np
 
 
 class ApproximateAvatar(Goal):
+    """
+    Sum of squared differences between pixels of the state image and the reference image.
+
+    States created by moves are scored by comparing only their dirty boxes and subtracting
+    the errors of the same pixels of the parent state, in O(box area) time.
+    """
 
     def __init__(self, reference_image: Image.Image):
-        self._ref = np.asarray(reference_image, dtype=int)
+        self._ref = np.asarray(reference_image.convert('RGB'), dtype=np.int16)
 
     def objective_for(self, state: AvatarState) -> int:
         """
         Calculates objective for passed state
         """
-        return ((np.asarray(state.image, dtype=int) - self._ref) ** 2).sum()
+        if state.total_error is None:
+            if state.parent is not None:
+                self._score_dirty_box(state, self._error_of(state.parent))
+            else:
+                state.total_error = int(self._error_of(state).sum(dtype=np.int64))
+        return state.total_error
+
+    def _score_dirty_box(self, state: AvatarState, parent_error: np.ndarray) -> None:
+        """
+        Sets the errors of the dirty box and the total error of a state created by a move,
+        given the errors of all the pixels of its parent
+        """
+        left, top, right, bottom = state.dirty_box
+        state.dirty_error = self._pixel_errors(state.dirty_pixels, state.dirty_box)
+        state.total_error = self.objective_for(state.parent) \
+            + int(state.dirty_error.sum(dtype=np.int64)) - int(parent_error[top:bottom, left:right].sum(dtype=np.int64))
+
+    def _error_of(self, state: AvatarState) -> np.ndarray:
+        """
+        Returns squared errors of all the pixels of the state. For states created by moves the errors
+        of the nearest ancestor knowing them are copied and the dirty boxes down the chain are pasted over them,
+        in a loop, so that chains of moves of any length can be scored
+        """
+        if state.error is None:
+            chain = []
+            ancestor = state
+            while ancestor.error is None and ancestor.parent is not None:
+                chain.append(ancestor)
+                ancestor = ancestor.parent
+            if ancestor.error is None:
+                ancestor.error = self._pixel_errors(ancestor.canvas, (0, 0) + ancestor.size)
+            if chain:
+                error = ancestor.error.copy()
+                for link in reversed(chain):
+                    if link.total_error is None:
+                        self._score_dirty_box(link, error)
+                    left, top, right, bottom = link.dirty_box
+                    error[top:bottom, left:right] = link.dirty_error
+                state.error, state.dirty_error = error, None
+                state.release_parent()
+        return state.error
+
+    def _pixel_errors(self, pixels: np.ndarray, box: Box) -> np.ndarray:
+        left, top, right, bottom = box
+        reference = self._ref[top:bottom, left:right]
+        difference = pixels.astype(np.int16)
+        difference -= reference
+        difference *= difference
+        # squares of differences of 8-bit channels fit into 16 bits without the sign
+        squares = difference.view(np.uint16)
+        # adding the channels one by one is several times faster than summing over the last axis
+        errors = squares[..., 0].astype(np.int32)
+        for channel in range(1, squares.shape[-1]):
+            errors += squares[..., channel]
+        return errors
 
     def human_readable_objective_for(self, state: AvatarState) -> str:
         """
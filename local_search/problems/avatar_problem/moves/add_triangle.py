@@ -2,11 +2,11 @@ from random import randint
 from local_search.problems.avatar_problem.moves.move_generator import AvatarMoveGenerator
 from local_search.problems.base.move_generator import MoveGenerator
 from local_search.problems.base.moves import Move
+from local_search.problems.avatar_problem.rasterizer import Box, draw_triangle, triangle_box
 from local_search.problems.avatar_problem.state import AvatarState
 from local_search.problems.avatar_problem.models.vertex import Vertex
 from local_search.problems.avatar_problem.models.color import Color
 from typing import Generator, List, Tuple
-from PIL import ImageDraw
 
 
 class AddTriangle(AvatarMoveGenerator):
@@ -45,9 +45,16 @@ class AddTriangleMove(Move[AvatarState]):
     def _to_color_coordinates(self, color: Color) -> Tuple[int, int, int, int]:
         return color.R, color.G, color.B, color.A
 
+    @property
+    def dirty_box(self) -> Box:
+        """
+        Bounding box of the triangle clipped to the image, the only pixels the move can change
+        """
+        return triangle_box(self.coordinates, self.state.size)
+
     def make(self) -> AvatarState:
-        new_image = self.state.image.copy()
-        new_image_draw = ImageDraw.Draw(new_image, "RGBA")
-        new_image_draw.polygon(
-            self.coordinates, fill=self.color, outline=self.color)
-        return AvatarState(image=new_image)
+        box = self.dirty_box
+        left, top, right, bottom = box
+        pixels = self.state.canvas[top:bottom, left:right].copy()
+        draw_triangle(pixels, self.coordinates, self.color, box)
+        return AvatarState(parent=self.state, dirty_box=box, dirty_pixels=pixels)
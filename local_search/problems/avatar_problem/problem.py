@@ -36,9 +36,8 @@ class AvatarProblem(Problem):
         """
         Generates a random state
         """
-        imarray = np.random.rand(*self.reference_image.size, 3) * 255
-        img = Image.fromarray(imarray.astype('uint8')).convert('RGBA')
-        return AvatarState(img)
+        width, height = self._image_size
+        return AvatarState(np.random.randint(0, 256, (height, width, 3), dtype=np.uint8))
 
     @staticmethod
     def to_b64(image: Image.Image):
@@ -72,7 +71,8 @@ class AvatarProblem(Problem):
         }
 
     def _find_initial_solution(self) -> AvatarState:
-        return AvatarState(image=Image.new("RGB", self._image_size, "white"))
+        width, height = self._image_size
+        return AvatarState(np.full((height, width, 3), 255, dtype=np.uint8))
 
     @staticmethod
     def from_benchmark(benchmark_name: str, move_generator_name: str, goal_name: str = 'approximate_avatar', **kwargs):
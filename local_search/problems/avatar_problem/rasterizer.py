@@ -0,0 +1,75 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+# rectangle of pixels (left, top, right, bottom), right and bottom excluded
+Box = Tuple[int, int, int, int]
+
+
+def triangle_box(coordinates: Sequence[Tuple[int, int]], size: Tuple[int, int]) -> Box:
+    """
+    Returns the bounding box of the triangle clipped to the canvas of the given (width, height),
+    the box is empty if the triangle lies outside of the canvas
+    """
+    width, height = size
+    xs, ys = [x for x, _ in coordinates], [y for _, y in coordinates]
+    left, top = min(max(min(xs), 0), width), min(max(min(ys), 0), height)
+    return left, top, max(min(max(xs) + 1, width), left), max(min(max(ys) + 1, height), top)
+
+
+def triangle_spans(coordinates: Sequence[Tuple[int, int]], box: Box) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the first and the past the last covered pixel of every row of the box, rows without
+    covered pixels have the first one not smaller than the last.
+
+    A pixel is covered if it lies inside the triangle or at most half a pixel outside of an edge
+    along the axis the edge is closer to, which draws the outline like PIL does.
+    Every edge bounds the rows from one side, the bounds are computed exactly in integers
+    for all the rows at once. Degenerate triangles cover their segment.
+    """
+    left, top, right, bottom = box
+    (x0, y0), (x1, y1), (x2, y2) = coordinates
+    if (x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0) < 0:
+        # counterclockwise order in the image coordinates, so the triangle lies on the left of every edge
+        (x1, y1), (x2, y2) = (x2, y2), (x1, y1)
+    ys = np.arange(top, bottom, dtype=np.int64)
+    firsts = np.full(len(ys), left, dtype=np.int64)
+    stops = np.full(len(ys), right, dtype=np.int64)
+    for (start_x, start_y), (end_x, end_y) in (((x0, y0), (x1, y1)), ((x1, y1), (x2, y2)), ((x2, y2), (x0, y0))):
+        dx, dy = end_x - start_x, end_y - start_y
+        # the pixel is covered if 2 * dy * (x - start_x) <= limits
+        limits = 2 * dx * (ys - start_y) + max(abs(dx), abs(dy))
+        if dy > 0:
+            np.minimum(stops, start_x + limits // (2 * dy) + 1, out=stops)
+        elif dy < 0:
+            np.maximum(firsts, start_x - limits // (-2 * dy), out=firsts)
+        else:
+            stops[limits < 0] = left
+    return firsts, stops
+
+
+def draw_triangle(pixels: np.ndarray, coordinates: Sequence[Tuple[int, int]],
+                  color: Tuple[int, int, int, int], box: Box) -> None:
+    """
+    Blends the triangle with the color given as (R, G, B, A) into the uint8 RGB pixels of the box in place,
+    like drawing with PIL on an RGB image: `(color * A + pixel * (255 - A)) / 255`.
+
+    Rows of the box are handled as flat arrays of channels, the whole box is blended
+    and copied back only where the spans of the triangle cover it.
+    """
+    left, top, right, bottom = box
+    height, width = bottom - top, right - left
+    if not height or not width:
+        return
+    firsts, stops = triangle_spans(coordinates, box)
+    # a channel is covered if its offset from the span start, wrapping around below zero, is below the span length
+    offsets_type = np.uint16 if 3 * width < 2 ** 16 else np.uint32
+    offsets = np.arange(3 * width, dtype=offsets_type) - (3 * (firsts - left)).astype(offsets_type)[:, None]
+    covered = offsets < (3 * np.maximum(stops - firsts, 0)).astype(offsets_type)[:, None]
+    channels = pixels.reshape(height, 3 * width)
+    alpha = int(color[3])
+    blended = channels.astype(np.uint16)
+    blended *= 255 - alpha
+    blended += np.tile(np.array(color[:3], dtype=np.uint16) * alpha + 127, width)
+    blended //= 255
+    np.copyto(channels, blended, casting='unsafe', where=covered)
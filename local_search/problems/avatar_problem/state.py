@@ -1,13 +1,72 @@
+from local_search.problems.avatar_problem.rasterizer import Box
 from local_search.problems.base.state import State
-from dataclasses import dataclass
-from PIL import Image, ImageChops
+from PIL import Image
 from io import BytesIO
+from typing import Tuple, Union
 import base64
+import numpy as np
 
 
-@dataclass
 class AvatarState(State):
-    image: Image.Image
+    """
+    Image approximating the reference image, stored as an uint8 array of RGB pixels of shape (height, width, 3).
+
+    A state created by a move keeps the state it came from in `parent`, the rectangle it changed in `dirty_box`
+    and the new pixels of the rectangle in `dirty_pixels`, so moves cost O(box area) instead of copying the image.
+    `canvas` with all the pixels is put together from the parent's when first accessed.
+    `error` with the squared error of every pixel, `dirty_error` of the dirty box and `total_error` are set
+    by the goal evaluating the state. The parent is released once both the canvas and the error are known.
+    """
+    __slots__ = ('parent', 'dirty_box', 'dirty_pixels', 'error', 'dirty_error', 'total_error', '_canvas')
+
+    def __init__(self, canvas: Union[np.ndarray, None] = None, parent: Union['AvatarState', None] = None,
+                 dirty_box: Union[Box, None] = None, dirty_pixels: Union[np.ndarray, None] = None):
+        self._canvas = canvas
+        self.parent = parent
+        self.dirty_box = dirty_box
+        self.dirty_pixels = dirty_pixels
+        self.error: Union[np.ndarray, None] = None
+        self.dirty_error: Union[np.ndarray, None] = None
+        self.total_error: Union[int, None] = None
+
+    @classmethod
+    def from_image(cls, image: Image.Image) -> 'AvatarState':
+        return cls(np.array(image.convert('RGB'), dtype=np.uint8))
+
+    @property
+    def canvas(self) -> np.ndarray:
+        """
+        Pixels of the image, they must not be modified
+        """
+        if self._canvas is None:
+            # walking up in a loop, long chains of moves do not hit the recursion limit
+            chain = []
+            ancestor = self
+            while ancestor._canvas is None:
+                chain.append(ancestor)
+                ancestor = ancestor.parent
+            canvas = ancestor._canvas.copy()
+            for link in reversed(chain):
+                left, top, right, bottom = link.dirty_box
+                canvas[top:bottom, left:right] = link.dirty_pixels
+            self._canvas = canvas
+            self.release_parent()
+        return self._canvas
+
+    def release_parent(self) -> None:
+        """
+        Forgets the parent once nothing has to be put together from it anymore
+        """
+        if self._canvas is not None and self.error is not None:
+            self.parent = None
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.canvas.shape[1], self.canvas.shape[0]
+
+    @property
+    def image(self) -> Image.Image:
+        return Image.fromarray(self.canvas)
 
     def __str__(self):
         return 'There is no string representation of avatar state.'
@@ -15,7 +74,7 @@ class AvatarState(State):
     def __eq__(self, other: 'AvatarState'):
         if other is None:
             return False
-        return ImageChops.difference(self.image, other.image).getbbox() is None
+        return np.array_equal(self.canvas, other.canvas)
 
     @staticmethod
     def to_b64(image: Image.Image):
@@ -35,4 +94,4 @@ class AvatarState(State):
     def from_dict(cls, data):
         cls.validate_data(data)
         image = Image.open(BytesIO(base64.b64decode(data['image'])))
-        return cls(image)
+        return cls.from_image(image)
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from random import sample
-from typing import Generator, TypeVar
+from typing import Generator, TypeVar, Union
 
+from local_search.problems.base.goal import Goal
 from local_search.problems.base.moves import Move
 from local_search.problems.base.state import State
 
@@ -24,3 +25,18 @@ class MoveGenerator(ABC):
         """
         Generates available moves from state
         """
+
+    @property
+    def supports_batch_evaluation(self) -> bool:
+        """
+        Tells whether `best_improving_move` can evaluate the whole neighbourhood at once
+        """
+        return False
+
+    def best_improving_move(self, state: State, goal: Goal, worst: bool = False) -> Union[Move[State], None]:
+        """
+        Evaluates all available moves from state at once
+        and returns the one with the biggest (or the smallest positive one, if `worst` is set) improvement.
+        Returns None if no move improves the state.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support batch evaluation of moves')
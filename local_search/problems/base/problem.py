@@ -6,6 +6,7 @@ from enum import Enum
 from typing import Dict, Iterable, Type, TypeVar
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.goal import Goal
+from local_search.problems.base.moves import Move
 from local_search.problems.base.state import State
 from local_search.problems.base.move_generator import MoveGenerator
 from dataclasses import dataclass
@@ -52,6 +53,16 @@ class Problem(ABC):
             new_state) - self.objective_for(old_state)
         return improvement * self.goal.type().value
 
+    def move_improvement(self, move: Move) -> float:
+        """
+        A helper method. Calculates how much the state created by the move is better than the state it starts from.
+        Uses the goal's delta evaluation when available, so the new state is created only as a fallback.
+        """
+        delta = self.goal.delta_for(move)
+        if delta is None:
+            return self.improvement(move.make(), move.state)
+        return delta * self.goal.type().value
+
     @staticmethod
     @abstractmethod
     def get_available_move_generation_strategies() -> Iterable[str]:
@@ -66,6 +77,21 @@ class Problem(ABC):
         Available goals for this model.
         """
 
+    @classmethod
+    def get_available_config_values(cls) -> Dict[str, Iterable[str]]:
+        """
+        Values which options of the problem config naming registered classes can take, by the names of the options
+        """
+        return {}
+
+    @staticmethod
+    def get_available_generators() -> Iterable[str]:
+        """
+        Generators of synthetic benchmarks for this model, their specifications
+        like "name:param=value,..." can be used instead of benchmark names.
+        """
+        return ()
+
     @staticmethod
     @abstractmethod
     def from_benchmark(benchmark_name: str, move_generator_name: str = None, goal_name: str = None, **kwargs) -> 'Problem':
@@ -98,9 +124,10 @@ class Problem(ABC):
     @classmethod
     def validate_data(cls, data):
         """
-        Validates if data contains all params from class signature.
+        Validates if data contains all params without default values from class signature.
         """
-        params = set(signature(cls).parameters.keys())
+        params = set(name for name, param in signature(cls).parameters.items()
+                     if param.default is param.empty)
         missing_params = params - set(data.keys())
         if missing_params:
             raise ValueError(
@@ -9,6 +9,7 @@ from local_search.helpers.camel_to_snake import camel_to_snake
 
 @dataclass
 class State(ABC):
+    __slots__ = ()
     states = {}
 
     def __init_subclass__(cls):
@@ -37,9 +38,10 @@ class State(ABC):
     @classmethod
     def validate_data(cls, data) -> None:
         """
-        Validates if data contains all params required by class.
+        Validates if data contains all params without default values from class signature.
         """
-        params = set(signature(cls).parameters.keys())
+        params = set(name for name, param in signature(cls).parameters.items()
+                     if param.default is param.empty)
         missing_params = params - set(data.keys())
         if missing_params:
             raise ValueError(
@@ -0,0 +1,3 @@
+from local_search.problems.graph_coloring_problem.coloring_constructions.random_coloring import RandomColoring
+from local_search.problems.graph_coloring_problem.coloring_constructions.dsatur import Dsatur
+from local_search.problems.graph_coloring_problem.coloring_constructions.rlf import Rlf
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+
+
+class ColoringConstruction(ABC):
+    """
+    Base class for heuristics creating colorings for graph coloring problem
+    """
+    coloring_constructions = {}
+
+    def __init_subclass__(cls):
+        ColoringConstruction.coloring_constructions[camel_to_snake(cls.__name__)] = cls
+
+    def __init__(self, adjacency: Adjacency):
+        self.adjacency = adjacency
+
+    @abstractmethod
+    def construct(self, randomized: bool = False) -> np.ndarray:
+        """
+        Creates a proper coloring, with the color of vertex `i` at index `i`.
+        Randomized colorings differ between calls, so they can be used to restart the search.
+        """
@@ -0,0 +1,42 @@
+import heapq
+import random
+
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.coloring_constructions.coloring_construction import \
+    ColoringConstruction
+
+
+class Dsatur(ColoringConstruction):
+    """
+    Repeatedly colors the vertex with the most distinct colors among its neighbours (saturation),
+    breaking ties by the degree, with the smallest color its neighbours do not use.
+
+    Vertices wait in a heap, a vertex whose saturation grows is pushed again and its outdated entries
+    are skipped when popped, so the coloring takes O((n + m) log n) time.
+    Randomized colorings break the remaining ties randomly instead of by the vertex number.
+    """
+
+    def construct(self, randomized: bool = False) -> np.ndarray:
+        indptr, indices = self.adjacency.indptr.tolist(), self.adjacency.indices.tolist()
+        n_vertices = len(self.adjacency)
+        degrees = self.adjacency.degrees.tolist()
+        ties = [random.random() for _ in range(n_vertices)] if randomized else range(n_vertices)
+        coloring = [-1] * n_vertices
+        neighbour_colors = [set() for _ in range(n_vertices)]
+        queue = [(0, -degrees[vertex], ties[vertex], vertex) for vertex in range(n_vertices)]
+        heapq.heapify(queue)
+        while queue:
+            saturation, _, _, vertex = heapq.heappop(queue)
+            if coloring[vertex] >= 0 or -saturation != len(neighbour_colors[vertex]):
+                continue
+            color = 0
+            while color in neighbour_colors[vertex]:
+                color += 1
+            coloring[vertex] = color
+            for neighbour in indices[indptr[vertex]:indptr[vertex + 1]]:
+                colors = neighbour_colors[neighbour]
+                if coloring[neighbour] < 0 and color not in colors:
+                    colors.add(color)
+                    heapq.heappush(queue, (-len(colors), -degrees[neighbour], ties[neighbour], neighbour))
+        return np.array(coloring, dtype=np.int32)
@@ -0,0 +1,24 @@
+import random
+
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.coloring_constructions.coloring_construction import \
+    ColoringConstruction
+
+
+class RandomColoring(ColoringConstruction):
+    """
+    Gives every vertex a random color not used by its already colored neighbours.
+
+    Colors of a vertex are drawn from 0..deg, among which at least one is free,
+    so the whole coloring takes O(n + m) time.
+    """
+
+    def construct(self, randomized: bool = False) -> np.ndarray:
+        indptr, indices = self.adjacency.indptr.tolist(), self.adjacency.indices.tolist()
+        coloring = [-1] * len(self.adjacency)
+        for vertex in range(len(self.adjacency)):
+            neighbours = indices[indptr[vertex]:indptr[vertex + 1]]
+            used_colors = {coloring[neighbour] for neighbour in neighbours}
+            coloring[vertex] = random.choice([color for color in range(len(neighbours) + 1) if color not in used_colors])
+        return np.array(coloring, dtype=np.int32)
@@ -0,0 +1,59 @@
+import heapq
+import random
+
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.coloring_constructions.coloring_construction import \
+    ColoringConstruction
+
+# states of the uncolored vertices while a color class is built
+CANDIDATE, EXCLUDED, COLORED = 0, 1, 2
+
+
+class Rlf(ColoringConstruction):
+    """
+    Recursive largest first: builds the color classes one at a time. The class starts with the vertex
+    of the largest uncolored degree, then the candidate (uncolored vertex with no neighbour in the class)
+    having most neighbours excluded from the class is added, until there are no candidates left.
+
+    Candidates wait in a heap keyed by their numbers of excluded neighbours, a candidate whose number
+    grows is pushed again and its outdated entries are skipped when popped, so building a class costs
+    O(m log n) in the worst case. Ties are broken by the uncolored degree, then by the vertex number,
+    or randomly for randomized colorings.
+    """
+
+    def construct(self, randomized: bool = False) -> np.ndarray:
+        indptr, indices = self.adjacency.indptr.tolist(), self.adjacency.indices.tolist()
+        n_vertices = len(self.adjacency)
+        ties = [random.random() for _ in range(n_vertices)] if randomized else range(n_vertices)
+        uncolored_degrees = self.adjacency.degrees.tolist()
+        coloring = [-1] * n_vertices
+        states = [CANDIDATE] * n_vertices
+        excluded_neighbours = [0] * n_vertices
+        uncolored = list(range(n_vertices))
+        color = 0
+        while uncolored:
+            for vertex in uncolored:
+                states[vertex] = CANDIDATE
+                excluded_neighbours[vertex] = 0
+            queue = [(0, -uncolored_degrees[vertex], ties[vertex], vertex) for vertex in uncolored]
+            heapq.heapify(queue)
+            while queue:
+                excluded, _, _, vertex = heapq.heappop(queue)
+                if states[vertex] != CANDIDATE or -excluded != excluded_neighbours[vertex]:
+                    continue
+                coloring[vertex] = color
+                states[vertex] = COLORED
+                for neighbour in indices[indptr[vertex]:indptr[vertex + 1]]:
+                    uncolored_degrees[neighbour] -= 1
+                    if states[neighbour] != CANDIDATE:
+                        continue
+                    states[neighbour] = EXCLUDED
+                    for candidate in indices[indptr[neighbour]:indptr[neighbour + 1]]:
+                        if states[candidate] == CANDIDATE:
+                            excluded_neighbours[candidate] += 1
+                            heapq.heappush(queue, (-excluded_neighbours[candidate], -uncolored_degrees[candidate],
+                                                   ties[candidate], candidate))
+            uncolored = [vertex for vertex in uncolored if coloring[vertex] < 0]
+            color += 1
+        return np.array(coloring, dtype=np.int32)
@@ -0,0 +1,87 @@
+import re
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+# size of the blocks of the file parsed at once
+CHUNK_SIZE = 2 ** 24
+# comments, the problem line and other lines that are not edges, edge lines start with "e" or with a number
+NOT_EDGE_LINES = re.compile(rb'^[ \t]*[a-df-zA-DF-Z].*$', re.MULTILINE)
+PROBLEM_LINE = re.compile(rb'^[ \t]*p[ \t]+\S+[ \t]+(\d+)[ \t]+(\d+)', re.MULTILINE)
+# edge lines of the DIMACS format, plain edge lists have no leading "e"
+DIMACS_EDGE_LINE = re.compile(rb'^[ \t]*e[ \t]', re.MULTILINE)
+
+
+@dataclass
+class DimacsInstance:
+    """
+    Graph read from a DIMACS file or from a plain edge list.
+
+    `edges` is an array of shape (n_edges, 2) with vertices numbered from 0.
+    `n_vertices` comes from the problem line, so it counts isolated vertices too;
+    without the problem line it is the largest vertex number plus one.
+    """
+    name: str
+    edges: np.ndarray
+    n_vertices: int
+
+
+def read_dimacs(path: Union[str, Path]) -> DimacsInstance:
+    """
+    Reads a graph in the DIMACS format ("p edge N M" followed by "e u v" lines with vertices numbered from 1,
+    the problem line may be missing) or a plain list of "u v" lines with vertices numbered from 0, like the bundled benchmarks.
+
+    The file is read in blocks and every block is parsed at once into an array, after dropping
+    the lines other than edges, so that instances with millions of edges are read in a second.
+    """
+    blocks, n_vertices, is_dimacs = [], None, False
+    with open(path, 'rb') as file:
+        rest = b''
+        for block in iter(lambda: file.read(CHUNK_SIZE), b''):
+            block = rest + block
+            cut = block.rfind(b'\n') + 1
+            block, rest = block[:cut], block[cut:]
+            problem = PROBLEM_LINE.search(block)
+            if problem is not None:
+                n_vertices, is_dimacs = int(problem[1]), True
+            is_dimacs = is_dimacs or DIMACS_EDGE_LINE.search(block) is not None
+            blocks.append(_parse_edges(NOT_EDGE_LINES.sub(b'', block), path))
+        is_dimacs = is_dimacs or DIMACS_EDGE_LINE.search(rest) is not None
+        blocks.append(_parse_edges(NOT_EDGE_LINES.sub(b'', rest), path))
+    edges = np.concatenate(blocks).reshape(-1, 2)
+    if is_dimacs:
+        edges -= 1
+    if n_vertices is None:
+        n_vertices = int(edges.max()) + 1 if len(edges) else 0
+    if len(edges) and (edges.min() < 0 or edges.max() >= n_vertices):
+        first = 1 if is_dimacs else 0
+        raise ValueError(f'{path} has edges with vertices outside of the range {first}..{n_vertices - 1 + first}')
+    return DimacsInstance(name=Path(path).stem, edges=edges, n_vertices=n_vertices)
+
+
+def _parse_edges(block: bytes, path: Union[str, Path]) -> np.ndarray:
+    """
+    Parses numbers of the edge lines, with or without the leading "e"
+    """
+    with warnings.catch_warnings():
+        # numpy stops at something other than a number with a warning, newer versions raise ValueError instead
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            numbers = np.fromstring(block.translate(None, b'eE'), dtype=np.int64, sep=' ')
+        except (DeprecationWarning, ValueError):
+            raise ValueError(f'{path} contains lines that are not edges') from None
+    if len(numbers) % 2:
+        raise ValueError(f'{path} contains an edge without its second end')
+    return numbers
+
+
+def write_dimacs(path: Union[str, Path], edges: np.ndarray, n_vertices: int) -> None:
+    """
+    Writes the graph in the DIMACS format, with vertices numbered from 1
+    """
+    with open(path, 'w') as file:
+        file.write(f'p edge {n_vertices} {len(edges)}\n')
+        np.savetxt(file, np.asarray(edges) + 1, fmt='e %d %d')
@@ -0,0 +1,86 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def gnp(n: int, p: float, seed: int = 0) -> Tuple[np.ndarray, int]:
+    """
+    Erdős–Rényi graph G(n, p): every pair of vertices is joined with the probability p.
+    The number of edges is drawn first and then so many distinct pairs, so sparse graphs take O(n + m) time.
+    """
+    rng = np.random.default_rng(seed)
+    n = int(n)
+    n_pairs = n * (n - 1) // 2
+    pairs = rng.choice(n_pairs, rng.binomial(n_pairs, p), replace=False) if n_pairs else np.zeros(0, dtype=np.int64)
+    return _unrank_pairs(pairs), n
+
+
+def flat(n: int, k: int, p: float, seed: int = 0) -> Tuple[np.ndarray, int]:
+    """
+    k-colorable graph with the vertices split into k classes of equal sizes, every two classes
+    are joined by the same share p of the pairs between them, so the degrees are nearly flat
+    """
+    rng = np.random.default_rng(seed)
+    n, k = int(n), int(k)
+    classes = np.array_split(rng.permutation(n), k)
+    edges = []
+    for first in range(k):
+        for second in range(first + 1, k):
+            starts, ends = classes[first], classes[second]
+            pairs = rng.choice(len(starts) * len(ends), int(round(p * len(starts) * len(ends))), replace=False)
+            edges.append(np.stack((starts[pairs // len(ends)], ends[pairs % len(ends)]), axis=1))
+    return np.concatenate(edges) if edges else np.zeros((0, 2), dtype=np.int64), n
+
+
+def leighton(n: int, k: int, m: int, seed: int = 0) -> Tuple[np.ndarray, int]:
+    """
+    Leighton graph with the chromatic number k: the vertices are split into k classes and about m edges
+    come from cliques planted across the classes, with equal numbers of edges in cliques of every size 2..k.
+    One clique of size k is always planted, so k colors are needed and the classes show that they suffice.
+    """
+    rng = np.random.default_rng(seed)
+    n, k, m = int(n), int(k), int(m)
+    order = rng.permutation(n)
+    # vertex `order[i]` belongs to the class `i % k`
+    class_sizes = (n - np.arange(k) + k - 1) // k
+    edges = [_clique_edges(order[np.arange(k)][None, :])]
+    for size in range(2, k + 1):
+        n_cliques = int(m / (k - 1) / (size * (size - 1) // 2))
+        if not n_cliques:
+            continue
+        clique_classes = np.argsort(rng.random((n_cliques, k)), axis=1)[:, :size]
+        positions = clique_classes + k * (rng.random(clique_classes.shape) * class_sizes[clique_classes]).astype(np.int64)
+        edges.append(_clique_edges(order[positions]))
+    return _unique_edges(np.concatenate(edges)), n
+
+
+# generators of synthetic benchmarks returning edges and numbers of vertices
+GENERATORS = {
+    'gnp': gnp,
+    'flat': flat,
+    'leighton': leighton,
+}
+
+
+def _unrank_pairs(pairs: np.ndarray) -> np.ndarray:
+    """
+    Returns the pairs (j, i), j < i, numbered by i * (i - 1) / 2 + j
+    """
+    pairs = np.asarray(pairs, dtype=np.int64)
+    second = ((1 + np.sqrt(1 + 8 * pairs.astype(np.float64))) / 2).astype(np.int64)
+    # corrections of the floating point rounding
+    second -= second * (second - 1) // 2 > pairs
+    second += (second + 1) * second // 2 <= pairs
+    return np.stack((pairs - second * (second - 1) // 2, second), axis=1)
+
+
+def _clique_edges(cliques: np.ndarray) -> np.ndarray:
+    """
+    Returns edges of the cliques given as rows of vertices
+    """
+    first, second = np.triu_indices(cliques.shape[1], 1)
+    return np.stack((cliques[:, first].ravel(), cliques[:, second].ravel()), axis=1)
+
+
+def _unique_edges(edges: np.ndarray) -> np.ndarray:
+    return np.unique(np.sort(edges, axis=1), axis=0)
@@ -1,66 +1,68 @@
 from abc import ABC
-from typing import List
+from typing import Tuple, Union
+
+import numpy as np
 
 from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.base.moves import Move
 from local_search.problems.base.problem import Goal
-from local_search.problems.graph_coloring_problem.models.edge import Edge
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+from local_search.problems.graph_coloring_problem.models.conflict_table import ConflictTable
+from local_search.problems.graph_coloring_problem.moves.change_color import ChangeColorMove
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 
 class GraphColoringGoal(Goal, ABC):
     """
     Base class for goals of the graph coloring problem
+
+    With the problem's conflict table, changes of a single vertex color are evaluated in O(1)
+    once the table follows the state of the move, see `_recolor_delta`.
+    Objectives are computed from the numbers of vertices and bad edges of the colors kept by the states,
+    in O(number of colors) time.
     """
     goals = {}
 
-    def __init__(self, edges: List[Edge], n_vertices: int):
-        self.edges = edges
-        self.n_vertices = n_vertices
+    def __init__(self, adjacency: Adjacency, conflicts: Union[ConflictTable, None] = None):
+        self.adjacency = adjacency
+        self.n_vertices = len(adjacency)
+        self.conflicts = conflicts
+        self._starts, self._ends = adjacency.edges()
 
     def __init_subclass__(cls):
         GraphColoringGoal.goals[camel_to_snake(cls.__name__)] = cls
 
     def _num_colors(self, state: GraphColoringState) -> int:
-        # return number of distinct colors used in `state.coloring` 
-
-        all_col = []
-        for i in state.coloring:
-            all_col.append(i.color)
-
-        return len(set(all_col))
-
-        raise NotImplementedError()
+        # return number of distinct colors used in `state.colors`
+        return len(state.used_colors)
 
-    def _bad_edges(self, state: GraphColoringState) -> List[int]:
-        # TODO:
-        # return number of bad edges of every color class in the graph
-        # tip 1. `self.edges` is the list of 'Edge' in the graph
-        # tip 2. example usage: `state.coloring[edge.start].color` 
-        #        is color of the edge start in the current state
-        #-----------my code start----------------------------------------------
-        bad_edges = [0] * self.n_vertices
-        for edge in self.edges:
-            if state.coloring[edge.start].color == state.coloring[edge.end].color:
-                bad_edges[state.coloring[edge.start].color] += 1
-        return bad_edges
-        #----------end my code-------------------------------------------------
+    def _class_counters(self, state: GraphColoringState) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns sizes of the color classes and numbers of their bad edges, both indexed by color.
+        Bad edges are counted over the whole graph only if the state does not have them yet,
+        states created by moves get them updated from the state of the move.
+        """
+        if state.bad_edges is None:
+            start_colors, end_colors = state.colors[self._starts], state.colors[self._ends]
+            state.bad_edges = np.bincount(start_colors[start_colors == end_colors], minlength=len(state.histogram))
+        sizes, bad_edges = state.histogram, state.bad_edges
+        n_colors = max(len(sizes), len(bad_edges))
+        return np.pad(sizes, (0, n_colors - len(sizes))), np.pad(bad_edges, (0, n_colors - len(bad_edges)))
 
-        #raise NotImplementedError()
+    def delta_for(self, move: Move) -> Union[float, None]:
+        if self.conflicts is None or not isinstance(move, ChangeColorMove):
+            return None
+        self.conflicts.sync(move.state)
+        old_color = int(move.state.colors[move.idx])
+        if old_color == move.color:
+            return 0
+        return self._recolor_delta(move.idx, old_color, move.color)
 
-    def _color_classes(self, state: GraphColoringState) -> List[int]:
-        # TODO:
-        # return sizes of the color classes
-        # - assume the worst case — there is as many colors as there are vertices
-        #   so the result should be a list of size `self.n_vertices`
-        # - the result is a list with values corresponding to sizes of the color classes, e.g.
-        #   `result[0] = 5` means that there five nodes in `state` with `color = 0`
-        #------------my code start---------------------------------------------
-        color_classes = [0] * self.n_vertices
-        for node in state.coloring:
-            color_classes[node.color] += 1
-        return color_classes
-        #------------end my code-------------------------------------------------
-        #raise NotImplementedError()
+    def _recolor_delta(self, vertex: int, old_color: int, color: int) -> Union[int, None]:
+        """
+        Returns change of the objective after the vertex changes its color, using the synced conflict table
+        """
+        return None
 
     def human_readable_objective_for(self, state: GraphColoringState) -> str:
         return f"{self._num_colors(state)} colors"
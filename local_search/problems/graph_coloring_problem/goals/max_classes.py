@@ -1,3 +1,5 @@
+import numpy as np
+
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
@@ -7,8 +9,11 @@ class MaxClasses(GraphColoringGoal):
     '''This goal checks the color classes and their sizes!'''
     
     def objective_for(self, state: GraphColoringState) -> int:
-        color_classes = self._color_classes(state)
-        return sum([cc ** 2 for cc in color_classes])
+        return int((state.histogram.astype(np.int64) ** 2).sum())
+
+    def _recolor_delta(self, vertex: int, old_color: int, color: int) -> int:
+        # (size - 1)^2 - size^2 for the old class and (size + 1)^2 - size^2 for the new one
+        return 2 * (self.conflicts.class_size(color) - self.conflicts.class_size(old_color)) + 2
 
     def type(self) -> GoalType:
         return GoalType.MAX
\ No newline at end of file
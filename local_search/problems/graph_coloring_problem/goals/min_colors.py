@@ -8,5 +8,8 @@ class MinColors(GraphColoringGoal):
     def objective_for(self, state: GraphColoringState) -> int:
         return self._num_colors(state)
 
+    def _recolor_delta(self, vertex: int, old_color: int, color: int) -> int:
+        return int(self.conflicts.class_size(color) == 0) - int(self.conflicts.class_size(old_color) == 1)
+
     def type(self) -> GoalType:
         return GoalType.MIN
\ No newline at end of file
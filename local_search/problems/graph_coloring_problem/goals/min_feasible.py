@@ -1,4 +1,6 @@
-from typing import List
+from typing import Union
+
+import numpy as np
 
 from local_search.problems.base.goal import GoalType
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
@@ -9,9 +11,21 @@ class MinFeasible(GraphColoringGoal):
     '''The most sophisticated goal, all the local optima are feasible solutions!'''
     
     def objective_for(self, state: GraphColoringState) -> int:
-        bad_edges = self._bad_edges(state)
-        color_classes = self._color_classes(state)
-        return sum([2*bad_edges[i]*color_classes[i]-color_classes[i]**2 for i in range(self.n_vertices)])
+        color_classes, bad_edges = self._class_counters(state)
+        return int(self._term(bad_edges, color_classes).sum())
+
+    def _recolor_delta(self, vertex: int, old_color: int, color: int) -> int:
+        conflicts = self.conflicts
+        old_bad_edges, bad_edges = conflicts.bad_edges_of(old_color), conflicts.bad_edges_of(color)
+        old_size, size = conflicts.class_size(old_color), conflicts.class_size(color)
+        new_old_bad_edges = old_bad_edges - conflicts.neighbours_with_color(vertex, old_color)
+        new_bad_edges = bad_edges + conflicts.neighbours_with_color(vertex, color)
+        return (self._term(new_old_bad_edges, old_size - 1) - self._term(old_bad_edges, old_size)
+                + self._term(new_bad_edges, size + 1) - self._term(bad_edges, size))
+
+    @staticmethod
+    def _term(bad_edges: Union[int, np.ndarray], class_size: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+        return 2 * bad_edges * class_size - class_size ** 2
 
     def type(self) -> GoalType:
         return GoalType.MIN
\ No newline at end of file
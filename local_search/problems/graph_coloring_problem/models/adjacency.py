@@ -0,0 +1,92 @@
+from typing import Dict, Set, Tuple, Union
+
+import numpy as np
+
+
+class Adjacency:
+    """
+    Graph stored in the compressed sparse row format:
+    neighbours of vertex `v` are `indices[indptr[v]:indptr[v + 1]]`, sorted increasingly.
+
+    Every edge is stored at both of its ends, repeated edges and loops are dropped.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray):
+        self.indptr = indptr
+        self.indices = indices
+
+    @classmethod
+    def from_edges(cls, starts: np.ndarray, ends: np.ndarray, n_vertices: Union[int, None] = None) -> 'Adjacency':
+        """
+        Builds the graph from arrays with ends of the edges, vertices are numbered from 0
+        """
+        starts, ends = np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+        if n_vertices is None:
+            n_vertices = int(max(starts.max(), ends.max())) + 1 if len(starts) else 0
+        not_loops = starts != ends
+        starts, ends = starts[not_loops], ends[not_loops]
+        # unique keys of both directions of the edges are sorted by the vertex, then by the neighbour
+        keys = np.unique(np.concatenate((starts * n_vertices + ends, ends * n_vertices + starts)))
+        vertices, indices = np.divmod(keys, n_vertices) if n_vertices else (keys, keys)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(vertices, minlength=n_vertices))))
+        return cls(indptr, indices.astype(np.int32))
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices) // 2
+
+    @property
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbours(self, vertex: int) -> np.ndarray:
+        return self.indices[self.indptr[vertex]:self.indptr[vertex + 1]]
+
+    def neighbours_of(self, vertices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns arrays with the vertices repeated once per neighbour and with the neighbours
+        """
+        vertices = np.asarray(vertices, dtype=np.int64)
+        starts, degrees = self.indptr[vertices], self.indptr[vertices + 1] - self.indptr[vertices]
+        # position of every neighbour in `indices`: start of its vertex plus its index among the vertex neighbours
+        first_of_vertex = np.repeat(np.cumsum(degrees) - degrees, degrees)
+        positions = np.repeat(starts, degrees) + np.arange(int(degrees.sum())) - first_of_vertex
+        return np.repeat(vertices, degrees), self.indices[positions].astype(np.int64)
+
+    def neighbours_with_colors(self, colors: np.ndarray, vertex: int, *wanted: int) -> Tuple[int, ...]:
+        """
+        Returns numbers of neighbours of the vertex having each of the wanted colors
+        """
+        neighbour_colors = colors[self.neighbours(vertex)]
+        return tuple(int(np.count_nonzero(neighbour_colors == color)) for color in wanted)
+
+    def bad_edges_inside(self, colors: np.ndarray, vertices: np.ndarray, *wanted: int) -> Tuple[int, ...]:
+        """
+        Returns numbers of bad edges of each of the wanted colors with both ends among the vertices
+        """
+        selected = np.zeros(len(self), dtype=bool)
+        selected[vertices] = True
+        owners, neighbours = self.neighbours_of(vertices)
+        owner_colors = colors[owners]
+        bad = selected[neighbours] & (owner_colors == colors[neighbours])
+        # every edge is counted at both of its ends
+        return tuple(int(np.count_nonzero(owner_colors[bad] == color)) // 2 for color in wanted)
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns arrays with ends of the edges, each edge is listed once with the smaller end first
+        """
+        starts = np.repeat(np.arange(len(self), dtype=np.int64), self.degrees)
+        ends = self.indices.astype(np.int64)
+        first = starts < ends
+        return starts[first], ends[first]
+
+    def as_dict(self) -> Dict[int, Set[int]]:
+        """
+        Returns the graph as a dictionary from vertices with at least one neighbour to sets of their neighbours
+        """
+        return {vertex: set(self.neighbours(vertex).tolist())
+                for vertex in np.flatnonzero(self.degrees).tolist()}
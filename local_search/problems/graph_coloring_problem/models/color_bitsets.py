@@ -0,0 +1,104 @@
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+from local_search.problems.graph_coloring_problem.state import GraphColoringState
+
+# number of bits set in every byte, used if numpy has no `bitwise_count`
+BYTE_POPCOUNTS = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.int64)
+# number of the adjacency matrix cells unpacked at once while building the rows
+PACKED_CELLS = 2 ** 24
+
+
+class ColorBitsets:
+    """
+    Rows of the adjacency matrix and color classes of one coloring, as bitsets packed into uint64 words.
+
+    Neighbours of a vertex having a color are found with a word-parallel AND of its row and the color class,
+    in O(n / 64) time regardless of the degree, and Kempe chains grow by whole levels at once.
+    The rows take n^2 / 8 bytes, so the bitsets pay off for dense graphs of up to tens of thousands of vertices.
+    Color classes describe the state given to `sync` and are packed a color at a time, when first needed.
+    """
+
+    def __init__(self, adjacency: Adjacency):
+        self.n_vertices = n_vertices = len(adjacency)
+        self.n_words = (n_vertices + 63) // 64
+        self.rows = np.zeros((n_vertices, self.n_words), dtype=np.uint64)
+        block = max(1, PACKED_CELLS // max(n_vertices, 1))
+        for first in range(0, n_vertices, block):
+            last = min(first + block, n_vertices)
+            cells = np.zeros((last - first, n_vertices), dtype=bool)
+            owners, neighbours = adjacency.neighbours_of(np.arange(first, last))
+            cells[owners - first, neighbours] = True
+            self.rows[first:last] = self._pack(cells)
+        self._state: Union[GraphColoringState, None] = None
+        self._classes: Dict[int, np.ndarray] = {}
+
+    def sync(self, state: GraphColoringState) -> None:
+        """
+        Makes the color classes describe the coloring of the state
+        """
+        if state is not self._state:
+            self._state = state
+            self._classes = {}
+
+    def color_class(self, color: int) -> np.ndarray:
+        if color not in self._classes:
+            self._classes[color] = self._pack(self._state.colors == color)
+        return self._classes[color]
+
+    def neighbours_with_colors(self, vertex: int, *colors: int) -> Tuple[int, ...]:
+        """
+        Returns numbers of neighbours of the vertex having each of the colors in the synced state
+        """
+        return tuple(self._popcount(self.rows[vertex] & self.color_class(color)) for color in colors)
+
+    def bad_edges_inside(self, vertices: np.ndarray, *colors: int) -> Tuple[int, ...]:
+        """
+        Returns numbers of bad edges of each of the colors with both ends among the vertices in the synced state
+        """
+        selected = np.zeros(self.n_vertices, dtype=bool)
+        selected[vertices] = True
+        selected = self._pack(selected)
+        counts = []
+        for color in colors:
+            members = selected & self.color_class(color)
+            # every edge is counted at both of its ends
+            counts.append(self._popcount(self.rows[self._unpack(members)] & members) // 2)
+        return tuple(counts)
+
+    def kempe_chain(self, vertex: int, other_color: int) -> np.ndarray:
+        """
+        Returns vertices of the Kempe chain containing the vertex in the synced state,
+        formed by its color and the other color
+        """
+        allowed = self.color_class(int(self._state.colors[vertex])) | self.color_class(other_color)
+        chain = self._pack(np.arange(self.n_vertices) == vertex)
+        frontier = np.array([vertex])
+        while len(frontier):
+            reached = np.bitwise_or.reduce(self.rows[frontier], axis=0) & allowed & ~chain
+            chain |= reached
+            frontier = self._unpack(reached)
+        return self._unpack(chain)
+
+    def _pack(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Packs boolean arrays with a value for every vertex in the last axis into words
+        """
+        padded = np.zeros(bits.shape[:-1] + (64 * self.n_words,), dtype=bool)
+        padded[..., :self.n_vertices] = bits
+        return np.packbits(padded, axis=-1, bitorder='little').view('<u8').astype(np.uint64, copy=False)
+
+    def _unpack(self, words: np.ndarray) -> np.ndarray:
+        """
+        Returns the vertices whose bits are set
+        """
+        bits = np.unpackbits(words.astype('<u8', copy=False).view(np.uint8), bitorder='little')
+        return np.flatnonzero(bits[:self.n_vertices])
+
+    @staticmethod
+    def _popcount(words: np.ndarray) -> int:
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(words).sum())
+        return int(BYTE_POPCOUNTS[words.view(np.uint8)].sum())
@@ -0,0 +1,116 @@
+from typing import Iterable, Set, Union
+
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+from local_search.problems.graph_coloring_problem.state import GraphColoringState
+
+
+class ConflictTable:
+    """
+    For each vertex, number of its neighbours of each color, together with sizes of the color classes
+    and numbers of bad edges (edges with both ends of the same color) in every color class.
+    Numbers of conflicts (neighbours of the same color) of the vertices are kept as well,
+    with the set of the conflicting vertices.
+
+    The table describes one coloring at a time. Syncing it with another state recolors only the vertices
+    whose colors differ, which costs O(deg) per vertex, so the table follows a search moving
+    between neighbouring states cheaply and answers questions about their moves in O(1).
+    Columns for colors are added when a color exceeding the current ones appears.
+    """
+
+    def __init__(self, adjacency: Adjacency):
+        self.n_vertices = n_vertices = len(adjacency)
+        self.adjacency = adjacency
+        self.colors = np.zeros(n_vertices, dtype=np.int64)
+        self.neighbour_colors = np.zeros((n_vertices, 0), dtype=np.int32)
+        self.class_sizes = np.zeros(0, dtype=np.int64)
+        self.bad_edges = np.zeros(0, dtype=np.int64)
+        self.vertex_conflicts = np.zeros(n_vertices, dtype=np.int64)
+        self.conflicting: Set[int] = set()
+        self._built = False
+        self._state: Union[GraphColoringState, None] = None
+
+    def sync(self, state: GraphColoringState, changed: Union[Iterable[int], None] = None) -> None:
+        """
+        Makes the table describe the coloring of the state.
+        If the only vertices whose colors may differ from the table are known, they can be given as `changed`,
+        so that the colorings are not compared as a whole.
+        """
+        if state is self._state:
+            return
+        if not self._built:
+            self._build(state.colors.astype(np.int64))
+        elif changed is not None:
+            for vertex in changed:
+                if state.colors[vertex] != self.colors[vertex]:
+                    self.recolor(int(vertex), int(state.colors[vertex]))
+        else:
+            colors = state.colors.astype(np.int64)
+            for vertex in np.flatnonzero(colors != self.colors):
+                self.recolor(int(vertex), int(colors[vertex]))
+        self._state = state
+
+    def recolor(self, vertex: int, color: int) -> None:
+        """
+        Changes color of the vertex in the table, in O(deg) time
+        """
+        self._ensure_colors(color + 1)
+        old_color = self.colors[vertex]
+        neighbours = self.adjacency.neighbours(vertex)
+        self.neighbour_colors[neighbours, old_color] -= 1
+        self.neighbour_colors[neighbours, color] += 1
+        self.bad_edges[old_color] -= self.neighbour_colors[vertex, old_color]
+        self.bad_edges[color] += self.neighbour_colors[vertex, color]
+        self.class_sizes[old_color] -= 1
+        self.class_sizes[color] += 1
+        neighbour_colors = self.colors[neighbours]
+        for neighbour in neighbours[neighbour_colors == old_color].tolist():
+            self.vertex_conflicts[neighbour] -= 1
+            if not self.vertex_conflicts[neighbour]:
+                self.conflicting.discard(neighbour)
+        for neighbour in neighbours[neighbour_colors == color].tolist():
+            self.vertex_conflicts[neighbour] += 1
+            self.conflicting.add(neighbour)
+        self.vertex_conflicts[vertex] = self.neighbour_colors[vertex, color]
+        if self.vertex_conflicts[vertex]:
+            self.conflicting.add(vertex)
+        else:
+            self.conflicting.discard(vertex)
+        self.colors[vertex] = color
+        self._state = None
+
+    def neighbours_with_color(self, vertex: int, color: int) -> int:
+        return int(self.neighbour_colors[vertex, color]) if color < len(self.class_sizes) else 0
+
+    def class_size(self, color: int) -> int:
+        return int(self.class_sizes[color]) if color < len(self.class_sizes) else 0
+
+    def bad_edges_of(self, color: int) -> int:
+        return int(self.bad_edges[color]) if color < len(self.class_sizes) else 0
+
+    @property
+    def n_bad_edges(self) -> int:
+        return int(self.bad_edges.sum())
+
+    def _build(self, colors: np.ndarray) -> None:
+        n_colors = int(colors.max()) + 1 if self.n_vertices else 0
+        self.colors = colors
+        vertices = np.repeat(np.arange(self.n_vertices), self.adjacency.degrees)
+        cells = vertices * n_colors + colors[self.adjacency.indices]
+        self.neighbour_colors = np.bincount(cells, minlength=self.n_vertices * n_colors).astype(np.int32)
+        self.neighbour_colors = self.neighbour_colors.reshape(self.n_vertices, n_colors)
+        self.class_sizes = np.bincount(colors, minlength=n_colors)
+        self.vertex_conflicts = self.neighbour_colors[np.arange(self.n_vertices), colors].astype(np.int64)
+        self.conflicting = set(np.flatnonzero(self.vertex_conflicts).tolist())
+        # every bad edge is counted at both of its ends
+        self.bad_edges = np.bincount(colors, weights=self.vertex_conflicts, minlength=n_colors).astype(np.int64) // 2
+        self._built = True
+
+    def _ensure_colors(self, n_colors: int) -> None:
+        missing = n_colors - len(self.class_sizes)
+        if missing > 0:
+            missing = max(missing, len(self.class_sizes))
+            self.neighbour_colors = np.pad(self.neighbour_colors, ((0, 0), (0, missing)))
+            self.class_sizes = np.pad(self.class_sizes, (0, missing))
+            self.bad_edges = np.pad(self.bad_edges, (0, missing))
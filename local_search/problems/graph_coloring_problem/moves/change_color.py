@@ -1,21 +1,42 @@
 import random
-from typing import Generator
+from typing import Generator, Tuple, Union
 
 from local_search.problems.base.moves import Move
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+from local_search.problems.graph_coloring_problem.models.color_bitsets import ColorBitsets
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
-import copy
 
 
 class ChangeColorMove(Move[GraphColoringState]):
-    def __init__(self, from_state: GraphColoringState, idx: int, color: int):
+    """
+    Changes color of the vertex `idx` to `color`.
+    With the `Adjacency` of the graph, the new state gets its bad edges updated instead of cleared,
+    neighbours of the vertex with the old and the new color are counted with `ColorBitsets` if given.
+    """
+
+    def __init__(self, from_state: GraphColoringState, idx: int, color: int, adjacency: Union[Adjacency, None] = None,
+                 bitsets: Union[ColorBitsets, None] = None):
         super().__init__(from_state)
         (self.idx, self.color) = idx, color
+        self.adjacency = adjacency
+        self.bitsets = bitsets
 
     def make(self) -> GraphColoringState:
-        new_coloring = copy.deepcopy(self.state.coloring)
-        new_coloring[self.idx].color = self.color
-        return GraphColoringState(coloring=new_coloring)
+        new_state = self.state.copy()
+        new_state.recolor(self.idx, self.color, self._neighbour_counts())
+        return new_state
+
+    def _neighbour_counts(self) -> Union[Tuple[int, int], None]:
+        if self.state.bad_edges is None:
+            return None
+        old_color = int(self.state.colors[self.idx])
+        if self.bitsets is not None:
+            self.bitsets.sync(self.state)
+            return self.bitsets.neighbours_with_colors(self.idx, old_color, self.color)
+        if self.adjacency is not None:
+            return self.adjacency.neighbours_with_colors(self.state.colors, self.idx, old_color, self.color)
+        return None
 
 
 class ChangeColor(GraphColoringMoveGenerator):
@@ -28,9 +49,11 @@ class ChangeColor(GraphColoringMoveGenerator):
                 break
             yield ChangeColorMove(state,
                                   idx=idx,
-                                  color=random.choice(available_colors))
+                                  color=random.choice(available_colors),
+                                  adjacency=self.adjacency,
+                                  bitsets=self.bitsets)
 
     def available_moves(self, state: GraphColoringState) -> Generator[ChangeColorMove, None, None]:
         for idx in range(self.n_vertices):
             for color in self.get_available_colors(idx, state):
-                yield ChangeColorMove(state, idx, color)
+                yield ChangeColorMove(state, idx, color, self.adjacency, self.bitsets)
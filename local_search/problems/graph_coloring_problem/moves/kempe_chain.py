@@ -1,90 +1,125 @@
 import random
-from typing import Generator, Set, Dict, List
+from collections import deque
+from typing import Generator, Tuple, Union
+
+import numpy as np
 
 from local_search.problems.base.moves import Move
-from local_search.problems.graph_coloring_problem.models.vertex import Vertex
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+from local_search.problems.graph_coloring_problem.models.color_bitsets import ColorBitsets
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
-import copy
+
+
+class KempeChains:
+    """
+    Finds Kempe chains, i.e. connected components of the subgraph induced by the vertices of two colors.
+
+    The search goes only through the vertices of the two colors, so it takes time proportional to the size
+    of the chain and the degrees of its vertices. Visited vertices are marked with the number of the search
+    in a buffer shared by all the searches, so the buffer never has to be cleared.
+    With `ColorBitsets`, the chain grows instead by a whole level of the search at once,
+    OR-ing the bitset rows of the level and AND-ing them with the two color classes.
+    Sizes of the found chains are collected, so the cost of the moves can be inspected.
+    """
+
+    def __init__(self, adjacency: Adjacency, bitsets: Union[ColorBitsets, None] = None):
+        self.adjacency = adjacency
+        self.bitsets = bitsets
+        self._visited = np.zeros(len(adjacency), dtype=np.int64)
+        self._search = 0
+        self.n_chains = 0
+        self.total_size = 0
+        self.max_size = 0
+
+    @property
+    def mean_size(self) -> float:
+        return self.total_size / self.n_chains if self.n_chains else 0.0
+
+    def find(self, state: GraphColoringState, vertex: int, other_color: int) -> np.ndarray:
+        """
+        Returns vertices of the chain containing the vertex, formed by its color and the other color
+        """
+        if self.bitsets is not None:
+            self.bitsets.sync(state)
+            chain = self.bitsets.kempe_chain(vertex, other_color)
+        else:
+            chain = self._search_chain(state.colors, vertex, other_color)
+        self.n_chains += 1
+        self.total_size += len(chain)
+        self.max_size = max(self.max_size, len(chain))
+        return chain
+
+    def bad_edges_inside(self, state: GraphColoringState, chain: np.ndarray,
+                         color: int, other_color: int) -> Union[Tuple[int, int], None]:
+        """
+        Returns numbers of bad edges of the two colors inside the chain, if the state has its bad edges counted
+        """
+        if state.bad_edges is None:
+            return None
+        if self.bitsets is not None:
+            self.bitsets.sync(state)
+            return self.bitsets.bad_edges_inside(chain, color, other_color)
+        return self.adjacency.bad_edges_inside(state.colors, chain, color, other_color)
+
+    def _search_chain(self, colors: np.ndarray, vertex: int, other_color: int) -> np.ndarray:
+        self._search += 1
+        search, visited, adjacency = self._search, self._visited, self.adjacency
+        color = colors[vertex]
+        visited[vertex] = search
+        chain = [vertex]
+        queue = deque(chain)
+        while queue:
+            neighbours = adjacency.neighbours(queue.popleft())
+            neighbour_colors = colors[neighbours]
+            neighbours = neighbours[((neighbour_colors == color) | (neighbour_colors == other_color))
+                                    & (visited[neighbours] != search)]
+            if len(neighbours):
+                visited[neighbours] = search
+                neighbours = neighbours.tolist()
+                chain.extend(neighbours)
+                queue.extend(neighbours)
+        return np.array(chain, dtype=np.int64)
 
 
 class KempeChainMove(Move[GraphColoringState]):
-    def __init__(self, graph: Dict[int, Set[int]], from_state: GraphColoringState, idx: int, color: int):
+    """
+    Changes color of the vertex `idx` to `color` and swaps the two colors on the whole Kempe chain of the vertex,
+    so that a proper coloring stays proper.
+    """
+
+    def __init__(self, chains: KempeChains, from_state: GraphColoringState, idx: int, color: int):
         super().__init__(from_state)
         self.idx = idx
         self.color = color
-        self.graph = graph
-        self.old_color = self.state.coloring[idx].color
-
-    def _kempe_chain(self, coloring: List[Vertex]):
-        '''This method is supposed to fix the `coloring` using the kempe chain method'''
-        # TODO: do the kempe chain thing
-        # - self.idx is index of the node beginning the chain
-        # - self.color is the new color of the node (already set in the `make` method)
-        # - self.old_color is the old color of the node 
-        # - self.graph[c] are the neighbors of the node c, just a list of adjacent vertices (`Vertex` class)
-        # - coloring is a list of vertices (also `Vertex` class, has index and color)
-        #   your task is to modify this coloring to make it again a correct graph coloring
-        #
-        # Debrief:
-        # The color of the node with index `self.idx`` has changed!
-        # Now you have to fix all the possible conflicts in a BFS fashion
-        # by changing colors of nodes (via `coloring`): 
-        # - with self.color to self.old_color 
-        # - with self.old_color to self.color
-        #
-        # Remember, the BFS start at `self.idx` and should explore the graph
-        # as long as the explored nodes are colored with self.old_color or self.color.
-        #-------------------my code from here----------------------
-        queue = []
-        visited = set()
-        queue.append(self.idx)
-        visited.add(self.idx)
-        while len(queue) > 0:
-            node = queue.pop(0)
-            for c in self.graph[node]:
-                if c not in visited:
-                    if coloring[c].color == self.old_color:
-                        coloring[c].color = self.color
-                    elif coloring[c].color == self.color:
-                        coloring[c].color = self.old_color
-                    visited.add(c)
-                    queue.append(c)
-            if len(queue) > 0 and node == queue[0]:
-                node = queue.pop(0)
-                for c in self.graph[node]:
-                    if c not in visited:
-                        if coloring[c].color == self.old_color:
-                            coloring[c].color = self.color
-                        elif coloring[c].color == self.color:
-                            coloring[c].color = self.old_color
-                        visited.add(c)
-                        queue.append(c)
-        #-------------------code ends here-------------------------
-        #raise NotImplementedError()
+        self.chains = chains
+        self.old_color = int(self.state.colors[idx])
+        self.chain: Union[np.ndarray, None] = None
 
     def make(self) -> GraphColoringState:
-        '''This method changes color of a single node and starts of the kempe chain'''
-        new_coloring = copy.deepcopy(self.state.coloring)
-        new_coloring[self.idx].color = self.color
-        self._kempe_chain(new_coloring)
-        return GraphColoringState(coloring=new_coloring)
+        if self.chain is None:
+            self.chain = self.chains.find(self.state, self.idx, self.color)
+        new_state = self.state.copy()
+        new_state.swap_colors(self.chain, self.old_color, self.color,
+                              self.chains.bad_edges_inside(self.state, self.chain, self.old_color, self.color))
+        return new_state
 
 
 class KempeChain(GraphColoringMoveGenerator):
 
+    def __init__(self, adjacency: Adjacency, bitsets: Union[ColorBitsets, None] = None):
+        super().__init__(adjacency, bitsets)
+        self.chains = KempeChains(adjacency, bitsets)
+
     def random_moves(self, state: GraphColoringState) -> Generator[KempeChainMove, None, None]:
         while True:
             idx = random.randrange(self.n_vertices)
             available_colors = self.get_available_colors(idx, state)
-            yield KempeChainMove(self.graph,
-                                 state,
-                                 idx=random.randrange(self.n_vertices),
-                                 color=random.choice(available_colors))
+            if not available_colors:
+                break
+            yield KempeChainMove(self.chains, state, idx=idx, color=random.choice(available_colors))
 
     def available_moves(self, state: GraphColoringState) -> Generator[KempeChainMove, None, None]:
         for idx in range(self.n_vertices):
             for color in self.get_available_colors(idx, state):
-                if state.coloring[idx].color == color:
-                    continue
-                yield KempeChainMove(self.graph, state, idx, color)
+                yield KempeChainMove(self.chains, state, idx, color)
@@ -1,7 +1,9 @@
-from typing import List, Dict, Set
+from typing import Union
 
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.move_generator import MoveGenerator
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+from local_search.problems.graph_coloring_problem.models.color_bitsets import ColorBitsets
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
 
@@ -12,11 +14,14 @@ class GraphColoringMoveGenerator(MoveGenerator):
         GraphColoringMoveGenerator.move_generators[camel_to_snake(
             cls.__name__)] = cls
 
-    def __init__(self, graph: Dict[int, Set[int]], n_vertices: int):
-        self.n_vertices = n_vertices
-        self.graph = graph
+    def __init__(self, adjacency: Adjacency, bitsets: Union[ColorBitsets, None] = None):
+        self.n_vertices = len(adjacency)
+        self.adjacency = adjacency
+        self.bitsets = bitsets
 
     def get_available_colors(self, idx: int, state: GraphColoringState):
-        used_colors = set([v.color for v in state.coloring])
-        return tuple(
-            used_colors.difference({state.coloring[idx].color}))
+        """
+        Returns colors used in the state other than the color of the vertex
+        """
+        color = state.colors[idx]
+        return tuple(used_color for used_color in state.used_colors if used_color != color)
@@ -1,76 +1,130 @@
-from io import TextIOWrapper
-import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.helpers.parse_generator_spec import parse_generator_spec
 from local_search.problems.base.problem import Problem
-from typing import Iterable, List, Set, Dict, Union
+from typing import Iterable, List, Set, Dict, Tuple, Union
 
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.coloring_constructions.coloring_construction import \
+    ColoringConstruction
+from local_search.problems.graph_coloring_problem.dimacs import read_dimacs, write_dimacs
+from local_search.problems.graph_coloring_problem.generators import GENERATORS
 from local_search.problems.graph_coloring_problem.goals.goal import GraphColoringGoal
 from local_search.problems.graph_coloring_problem.state import GraphColoringState
 
+from local_search.problems.graph_coloring_problem.models.adjacency import Adjacency
+from local_search.problems.graph_coloring_problem.models.color_bitsets import ColorBitsets
+from local_search.problems.graph_coloring_problem.models.conflict_table import ConflictTable
 from local_search.problems.graph_coloring_problem.models.edge import Edge
-from local_search.problems.graph_coloring_problem.models.vertex import Vertex
 from local_search.problems.graph_coloring_problem.moves.move_generator import GraphColoringMoveGenerator
 
 
+@dataclass
+class GraphColoringProblemConfig:
+    initial_coloring: str = 'random_coloring'
+    color_bitsets: bool = False
+
+
+DEFAULT_CONFIG = GraphColoringProblemConfig()
+
+
 class GraphColoringProblem(Problem):
 
-    def __init__(self, edges: List[Edge], move_generator_name: Union[str, None] = None, goal_name: Union[str, None] = None):
-        self._edges: List[Edge] = edges
-        self.graph: Dict[int, Set[int]] = self._create_graph()
-        self.n_vertices = len(self.graph)
+    def __init__(self, edges: Union[List[Edge], np.ndarray], move_generator_name: Union[str, None] = None,
+                 goal_name: Union[str, None] = None, n_vertices: Union[int, None] = None,
+                 config: GraphColoringProblemConfig = None):
+        self.config = config or DEFAULT_CONFIG
+        if self.config.initial_coloring not in ColoringConstruction.coloring_constructions:
+            raise ValueError(f'Unknown initial coloring {self.config.initial_coloring}, available coloring constructions '
+                             f'are: {", ".join(ColoringConstruction.coloring_constructions)}')
+        self._edges = self._edge_array(edges)
+        self.adjacency = Adjacency.from_edges(self._edges[:, 0], self._edges[:, 1], n_vertices)
+        self._graph: Union[Dict[int, Set[int]], None] = None
+        self.n_vertices = len(self.adjacency)
         move_generator_name = move_generator_name or list(
             GraphColoringMoveGenerator.move_generators.keys())[0]
-        move_generator = GraphColoringMoveGenerator.move_generators[move_generator_name](
-            self.graph, self.n_vertices)
+        self.bitsets = ColorBitsets(self.adjacency) if self.config.color_bitsets else None
+        move_generator = GraphColoringMoveGenerator.move_generators[move_generator_name](self.adjacency, self.bitsets)
         goal_name = goal_name or list(GraphColoringGoal.goals.keys())[0]
-        goal = GraphColoringGoal.goals[goal_name](self.edges, self.n_vertices)
-        initial_solution = self._find_random_solution()
+        self.conflicts = ConflictTable(self.adjacency)
+        goal = GraphColoringGoal.goals[goal_name](self.adjacency, self.conflicts)
+        self.coloring_construction = ColoringConstruction.coloring_constructions[self.config.initial_coloring](
+            self.adjacency)
+        initial_solution = GraphColoringState(self.coloring_construction.construct())
         super().__init__(initial_solution, move_generator, goal)
 
+    @staticmethod
+    def _edge_array(edges: Union[List[Edge], np.ndarray]) -> np.ndarray:
+        if isinstance(edges, np.ndarray):
+            return edges.astype(np.int64, copy=False).reshape(-1, 2)
+        edge_array = np.fromiter((end for edge in edges for end in (edge.start, edge.end)),
+                                 dtype=np.int64, count=2 * len(edges))
+        return edge_array.reshape(-1, 2)
+
+    @property
+    def edges(self) -> List[Edge]:
+        """
+        Edges as a list of objects, created on every access
+        """
+        return [Edge(start, end) for start, end in self._edges.tolist()]
+
     @property
-    def edges(self):
-        return self._edges
-
-    def _create_graph(self) -> Dict[int, Set[int]]:
-        graph = {}
-        for edge in self._edges:
-            if edge.start in graph.keys():
-                graph[edge.start].add(edge.end)
-            else:
-                graph[edge.start] = {edge.end}
-            if edge.end in graph.keys():
-                graph[edge.end].add(edge.start)
-            else:
-                graph[edge.end] = {edge.start}
-        return graph
-
-    def _find_random_solution(self) -> GraphColoringState:
-        coloring = [Vertex(idx=i, color=-1) for i in range(self.n_vertices)]
-        coloring[0].color = 0
-        for vertex in self.graph:
-            available_colors = [i for i in range(self.n_vertices)]
-            for neighbour in self.graph[vertex]:
-                if coloring[neighbour].color in available_colors:
-                    available_colors.remove(coloring[neighbour].color)
-            coloring[vertex].color = random.choice(available_colors)
-        return GraphColoringState(coloring=coloring)
+    def graph(self) -> Dict[int, Set[int]]:
+        """
+        Neighbours of the vertices as sets, built from `adjacency` on the first access
+        """
+        if self._graph is None:
+            self._graph = self.adjacency.as_dict()
+        return self._graph
 
     def random_state(self) -> GraphColoringState:
-        return self._find_random_solution()
+        """
+        Creates a coloring with the configured construction heuristic, randomized so that restarts start from different colorings
+        """
+        return GraphColoringState(self.coloring_construction.construct(randomized=True))
 
     @classmethod
-    def from_benchmark(cls, benchmark_name: str, move_generator_name: str = None, goal_name: str = None):
-        with open(cls.get_path_to_benchmarks()/benchmark_name) as benchmark_file:
-            edges = cls.parse_edges(benchmark_file)
-            return GraphColoringProblem(edges=edges, move_generator_name=move_generator_name, goal_name=goal_name)
+    def from_benchmark(cls, benchmark_name: str, move_generator_name: str = None, goal_name: str = None,
+                       config: GraphColoringProblemConfig = None):
+        """
+        Creates the problem from a bundled benchmark, from a file at the given path
+        in the format of the bundled benchmarks or in the DIMACS format,
+        or from a synthetic benchmark specification like "gnp:n=100000,p=0.0001,seed=1"
+        """
+        if parse_generator_spec(benchmark_name, GENERATORS) is not None:
+            edges, n_vertices = cls.generate_graph(benchmark_name)
+            return GraphColoringProblem(edges=edges, move_generator_name=move_generator_name,
+                                        goal_name=goal_name, n_vertices=n_vertices, config=config)
+        path = cls.get_path_to_benchmarks()/benchmark_name
+        if not path.is_file():
+            path = Path(benchmark_name)
+        instance = read_dimacs(path)
+        return GraphColoringProblem(edges=instance.edges, move_generator_name=move_generator_name,
+                                    goal_name=goal_name, n_vertices=instance.n_vertices, config=config)
+
+    @staticmethod
+    def get_available_generators() -> Iterable[str]:
+        return GENERATORS.keys()
+
+    @staticmethod
+    def generate_graph(spec: str) -> Tuple[np.ndarray, int]:
+        """
+        Creates edges and the number of vertices of the synthetic benchmark
+        """
+        generated = parse_generator_spec(spec, GENERATORS)
+        if generated is None:
+            raise ValueError(f'Unknown generator in {spec}, available generators are: {", ".join(GENERATORS)}')
+        name, params = generated
+        return GENERATORS[name](**params)
 
     @classmethod
-    def parse_edges(cls, file_buffer: TextIOWrapper):
-        def line_to_edge(line: str):
-            (start, end) = map(int, line.split(sep=' '))
-            return Edge(start, end)
-        edges = [line_to_edge(line) for line in file_buffer]
-        return edges
+    def save_generated_benchmark(cls, spec: str, path: Union[str, Path]) -> None:
+        """
+        Saves the synthetic benchmark to a file in the DIMACS format
+        """
+        write_dimacs(path, *cls.generate_graph(spec))
 
     @staticmethod
     def get_available_move_generation_strategies() -> Iterable[str]:
@@ -80,15 +134,26 @@ class GraphColoringProblem(Problem):
     def get_available_goals() -> Iterable[str]:
         return GraphColoringGoal.goals.keys()
 
+    @staticmethod
+    def get_available_coloring_constructions() -> Iterable[str]:
+        return ColoringConstruction.coloring_constructions.keys()
+
+    @classmethod
+    def get_available_config_values(cls) -> Dict[str, Iterable[str]]:
+        return {'initial_coloring': cls.get_available_coloring_constructions()}
+
     def asdict(self):
         base = super().asdict()
         return {
-            'edges': [(edge.start, edge.end) for edge in self.edges],
+            'edges': self._edges.tolist(),
+            'n_vertices': self.n_vertices,
+            'config': asdict(self.config),
             **base
         }
 
     @classmethod
     def from_dict(cls, data):
-        data['edges'] = [Edge(start=edge_tuple[0], end=edge_tuple[1])
-                         for edge_tuple in data['edges']]
+        data['edges'] = np.array(data['edges'], dtype=np.int64).reshape(-1, 2)
+        if 'config' in data:
+            data['config'] = GraphColoringProblemConfig(**data['config'])
         return cls(**data)
@@ -1,34 +1,136 @@
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
 
-from dataclasses import dataclass
-from typing import List
-import random
 from local_search.problems.base.state import State
 from local_search.problems.graph_coloring_problem.models.vertex import Vertex
-from copy import deepcopy
 
 
-@dataclass
 class GraphColoringState(State):
-    coloring: List[Vertex]
+    """
+    Coloring of the graph stored in an int array, vertex `i` has color `colors[i]`.
+
+    Moves create new states by copying the array, which is a single memory copy
+    instead of copying an object per vertex.
+
+    `histogram` with the number of vertices of every color is computed on the first access,
+    copied together with the state and updated by `recolor`, so used colors are known without scanning the coloring.
+    `bad_edges` with the number of bad edges of every color is set by the goal evaluating the state
+    and updated in O(1) by changes given the numbers of bad edges they add and remove, otherwise it is cleared.
+    """
+    __slots__ = ('colors', 'bad_edges', '_histogram', '_used_colors')
+
+    def __init__(self, coloring: Union[np.ndarray, Iterable[int]]):
+        self.colors = np.asarray(coloring, dtype=np.int32)
+        self.bad_edges: Union[np.ndarray, None] = None
+        self._histogram: Union[np.ndarray, None] = None
+        self._used_colors: Union[Tuple[int, ...], None] = None
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """
+        Number of vertices of every color, it must not be modified
+        """
+        if self._histogram is None:
+            self._histogram = np.bincount(self.colors) if len(self.colors) else np.zeros(0, dtype=np.int64)
+        return self._histogram
+
+    @property
+    def used_colors(self) -> Tuple[int, ...]:
+        if self._used_colors is None:
+            self._used_colors = tuple(np.flatnonzero(self.histogram).tolist())
+        return self._used_colors
+
+    def recolor(self, vertex: int, color: int, neighbour_counts: Union[Tuple[int, int], None] = None) -> None:
+        """
+        Changes color of the vertex in place, updating the histogram, and the bad edges
+        if numbers of neighbours of the vertex having its old and its new color are given
+        """
+        old_color = int(self.colors[vertex])
+        if self.bad_edges is not None:
+            if neighbour_counts is None:
+                self.bad_edges = None
+            else:
+                self.bad_edges = self._padded(self.bad_edges, color)
+                self.bad_edges[old_color] -= neighbour_counts[0]
+                self.bad_edges[color] += neighbour_counts[1]
+        self.colors[vertex] = color
+        if self._histogram is None:
+            return
+        self._histogram = self._padded(self._histogram, color)
+        self._histogram[old_color] -= 1
+        self._histogram[color] += 1
+        if self._histogram[old_color] == 0 or self._histogram[color] == 1:
+            self._used_colors = None
+
+    def swap_colors(self, vertices: np.ndarray, color: int, other_color: int,
+                    bad_edges_inside: Union[Tuple[int, int], None] = None) -> None:
+        """
+        Exchanges the two colors on the vertices in place, each of the vertices has one of them.
+        The vertices must form a Kempe chain, i.e. no vertex outside of them has a neighbour among them
+        with one of the two colors, so all the bad edges of the two colors touching them lie inside.
+        Bad edges are updated if their numbers inside the chain for both colors are given.
+        """
+        has_color = self.colors[vertices] == color
+        if self.bad_edges is not None:
+            if bad_edges_inside is None:
+                self.bad_edges = None
+            else:
+                inside, other_inside = bad_edges_inside
+                self.bad_edges = self._padded(self.bad_edges, max(color, other_color))
+                self.bad_edges[color] += other_inside - inside
+                self.bad_edges[other_color] += inside - other_inside
+        self.colors[vertices] = np.where(has_color, other_color, color)
+        if self._histogram is None:
+            return
+        self._histogram = self._padded(self._histogram, max(color, other_color))
+        n_color = int(np.count_nonzero(has_color))
+        self._histogram[color] += len(vertices) - 2 * n_color
+        self._histogram[other_color] += 2 * n_color - len(vertices)
+        self._used_colors = None
+
+    @staticmethod
+    def _padded(counts: np.ndarray, color: int) -> np.ndarray:
+        """
+        Returns the counts extended with zeros, so that they include the color
+        """
+        return np.pad(counts, (0, color + 1 - len(counts))) if color >= len(counts) else counts
+
+    @property
+    def coloring(self) -> List[Vertex]:
+        """
+        Vertices with their colors, created on every access
+        """
+        return [Vertex(idx=idx, color=color) for idx, color in enumerate(self.colors.tolist())]
+
+    def copy(self) -> 'GraphColoringState':
+        new_state = GraphColoringState(self.colors.copy())
+        if self.bad_edges is not None:
+            new_state.bad_edges = self.bad_edges.copy()
+        if self._histogram is not None:
+            new_state._histogram = self._histogram.copy()
+            new_state._used_colors = self._used_colors
+        return new_state
 
     def __str__(self):
-        return " ".join([f"({v.idx}: {v.color})" for v in self.coloring])
+        return " ".join([f"({idx}: {color})" for idx, color in enumerate(self.colors.tolist())])
 
     def __eq__(self, other: 'GraphColoringState'):
         if other is None:
             return False
-        return all(ov.color == sv.color for sv, ov in zip(self.coloring, other.coloring))
+        return np.array_equal(self.colors, other.colors)
 
     def asdict(self):
         base = super().asdict()
         return {
-            'coloring': [(vertex.idx, vertex.color) for vertex in self.coloring],
+            'coloring': [(idx, color) for idx, color in enumerate(self.colors.tolist())],
             **base
         }
 
     @classmethod
     def from_dict(cls, data):
         cls.validate_data(data)
-        coloring = [Vertex(idx=vertex_tuple[0], color=vertex_tuple[1])
-                    for vertex_tuple in data['coloring']]
-        return cls(coloring)
+        colors = np.empty(len(data['coloring']), dtype=np.int32)
+        for idx, color in data['coloring']:
+            colors[idx] = color
+        return cls(colors)
@@ -0,0 +1,32 @@
+import numpy as np
+
+# side of the square containing the cities
+SIZE = 1000000
+
+
+def uniform(n: int, seed: int = 0, size: int = SIZE) -> np.ndarray:
+    """
+    Random geometric instance: cities with integer coordinates spread uniformly over the square
+    """
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, int(size), (int(n), 2))
+
+
+def clustered(n: int, seed: int = 0, clusters: int = 0, size: int = SIZE) -> np.ndarray:
+    """
+    Cities normally distributed around cluster centers spread uniformly over the square, like in the DIMACS
+    TSP challenge: by default n / 100 clusters, with the standard deviation of size / sqrt(n)
+    """
+    rng = np.random.default_rng(seed)
+    n, size = int(n), int(size)
+    clusters = int(clusters) or max(1, n // 100)
+    centers = rng.integers(0, size, (clusters, 2))
+    points = centers[rng.integers(0, clusters, n)] + rng.normal(0, size / np.sqrt(n), (n, 2))
+    return np.clip(np.rint(points), 0, size - 1).astype(np.int64)
+
+
+# generators of synthetic benchmarks returning coordinates of the cities, the first city is the depot
+GENERATORS = {
+    'uniform': uniform,
+    'clustered': clustered,
+}
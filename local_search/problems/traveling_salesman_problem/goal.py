@@ -1,12 +1,13 @@
 from abc import ABC
-from typing import List
+from typing import Iterable, Union
 
 from local_search.helpers.camel_to_snake import camel_to_snake
 from local_search.problems.base.goal import GoalType
 from local_search.problems.base.problem import Goal
-from local_search.problems.traveling_salesman_problem.models import Point
-from local_search.problems.traveling_salesman_problem.models.salesman import \
-    Salesman
+from local_search.problems.base.moves import Move
+from local_search.problems.traveling_salesman_problem.models import DistanceOracle, Edge
+from local_search.problems.traveling_salesman_problem.moves.move import \
+    TravelingSalesmanMove
 from local_search.problems.traveling_salesman_problem.state import \
     TravelingSalesmanState
 
@@ -17,8 +18,8 @@ class TravelingSalesmanGoal(Goal, ABC):
     """
     goals = {}
 
-    def __init__(self, points: List[Point]):
-        self._points = points
+    def __init__(self, distances: DistanceOracle):
+        self._distances = distances
 
     def __init_subclass__(cls):
         TravelingSalesmanGoal.goals[camel_to_snake(cls.__name__)] = cls
@@ -27,11 +28,20 @@ class TravelingSalesmanGoal(Goal, ABC):
 class Distance(TravelingSalesmanGoal):
 
     def objective_for(self, state: TravelingSalesmanState) -> int:
-        route = [self._points[i]
-                 for i in state.route]
-        return int(Salesman.from_point(route[0])
-                           .walk_route(route)
-                           .travelled_distance)
+        if state.length is None:
+            route = state.route
+            state.length = float(self._distances.edge_lengths(route[:-1], route[1:]).sum())
+        return int(state.length)
+
+    def delta_for(self, move: Move) -> Union[float, None]:
+        if not isinstance(move, TravelingSalesmanMove):
+            return None
+        removed_edges, added_edges = move.changed_edges()
+        move.length_delta = self._length(added_edges) - self._length(removed_edges)
+        return move.length_delta
+
+    def _length(self, edges: Iterable[Edge]) -> float:
+        return sum(self._distances(edge.start, edge.end) for edge in edges)
 
     def human_readable_objective_for(self, state: TravelingSalesmanState) -> str:
         return f"{self.objective_for(state)} km"
@@ -3,3 +3,8 @@ from local_search.problems.traveling_salesman_problem.models.salesman import (
     Salesman,
 )
 from local_search.problems.traveling_salesman_problem.models.edge import Edge
+from local_search.problems.traveling_salesman_problem.models.distance_oracle import DistanceOracle
+from local_search.problems.traveling_salesman_problem.models.grid_index import GridIndex
+from local_search.problems.traveling_salesman_problem.models.nearest_city_search import NearestCitySearch
+from local_search.problems.traveling_salesman_problem.models.tour import Tour, ArrayTour
+from local_search.problems.traveling_salesman_problem.models.two_level_list_tour import TwoLevelListTour
@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from math import hypot
+from typing import List, Union
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.models.grid_index import GridIndex
+from local_search.problems.traveling_salesman_problem.models.point import Point
+
+
+BYTES_IN_MB = 2 ** 20
+# radius of the Earth and the value of pi used by TSPLIB for geographical distances
+EARTH_RADIUS = 6378.388
+TSPLIB_PI = 3.141592
+
+
+def euclidean(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    diff = b - a
+    return np.hypot(diff[..., 0], diff[..., 1])
+
+
+def euc_2d(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Euclidean distance rounded to the nearest integer
+    """
+    return np.floor(euclidean(a, b) + 0.5)
+
+
+def ceil_2d(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.ceil(euclidean(a, b))
+
+
+def att(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Pseudo-euclidean distance of TSPLIB ATT instances
+    """
+    distances = euclidean(a, b) / np.sqrt(10)
+    rounded = np.floor(distances + 0.5)
+    return np.where(rounded < distances, rounded + 1, rounded)
+
+
+def geo(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Distance in kilometers on the Earth between (latitude, longitude) pairs given in radians
+    """
+    q1 = np.cos(a[..., 1] - b[..., 1])
+    q2 = np.cos(a[..., 0] - b[..., 0])
+    q3 = np.cos(a[..., 0] + b[..., 0])
+    return np.floor(EARTH_RADIUS * np.arccos(np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)) + 1)
+
+
+def geo_radians(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Converts TSPLIB coordinates, with degrees in the integer part and minutes in the fraction, to radians
+    """
+    degrees = np.trunc(coordinates)
+    return TSPLIB_PI * (degrees + 5 * (coordinates - degrees) / 3) / 180
+
+
+METRICS = {
+    'euclidean': euclidean,
+    'euc_2d': euc_2d,
+    'ceil_2d': ceil_2d,
+    'att': att,
+    'geo': geo,
+}
+# metrics, under which the nearest cities are the nearest cities in the plane
+PLANAR_METRICS = ('euclidean', 'euc_2d', 'ceil_2d', 'att')
+
+
+class DistanceOracle:
+    """
+    Answers distance queries between the cities of a traveling salesman problem.
+
+    Distances follow one of the `METRICS` computed from coordinates of the cities,
+    or the 'explicit' metric given by a distance matrix (coordinates are then used only to display the cities).
+
+    Small instances precompute a dense distance matrix. When the matrix would not fit
+    into `max_mb` megabytes, rows of the matrix are computed on demand instead
+    and the most recently used ones are cached within the same memory limit.
+    """
+
+    def __init__(self, points: Union[np.ndarray, List[Point], None], max_mb: int = 256, metric: str = 'euclidean',
+                 matrix: Union[np.ndarray, None] = None):
+        if metric != 'explicit' and metric not in METRICS:
+            raise ValueError(f'Unknown metric {metric}, available metrics are: {", ".join(METRICS)}, explicit')
+        if metric == 'explicit' and matrix is None:
+            raise ValueError('The explicit metric requires a distance matrix')
+        if points is None:
+            # cities of an explicit matrix without coordinates are all displayed at the origin
+            self.coordinates = np.zeros((len(matrix), 2))
+        elif isinstance(points, np.ndarray):
+            self.coordinates = points.reshape(-1, 2)
+        else:
+            self.coordinates = np.array([(point.x, point.y) for point in points]).reshape(-1, 2)
+        self.coordinates.setflags(write=False)
+        self.metric = metric
+        self._distance = METRICS.get(metric)
+        self._metric_coordinates = geo_radians(self.coordinates) if metric == 'geo' else self.coordinates
+        row_size = len(self.coordinates) * np.dtype(float).itemsize
+        max_bytes = max_mb * BYTES_IN_MB
+        if matrix is not None:
+            self._matrix = np.asarray(matrix, dtype=float)
+            self._matrix.setflags(write=False)
+        else:
+            self._matrix = self._create_matrix() if row_size * len(self.coordinates) <= max_bytes else None
+        self._rows = OrderedDict()
+        self._max_cached_rows = max_bytes // max(row_size, 1)
+
+    def __len__(self) -> int:
+        return len(self.coordinates)
+
+    def __call__(self, start: int, end: int) -> float:
+        if self._matrix is not None:
+            return self._matrix[start, end]
+        row = self._rows.get(start)
+        if row is not None:
+            return row[end]
+        if self.metric == 'euclidean':
+            (x1, y1), (x2, y2) = self.coordinates[start], self.coordinates[end]
+            return hypot(x2 - x1, y2 - y1)
+        return float(self._distance(self._metric_coordinates[start], self._metric_coordinates[end]))
+
+    @property
+    def is_dense(self) -> bool:
+        return self._matrix is not None
+
+    @property
+    def matrix(self) -> Union[np.ndarray, None]:
+        """
+        Dense distance matrix, None if rows of the matrix are computed on demand
+        """
+        return self._matrix
+
+    def row(self, city: int) -> np.ndarray:
+        """
+        Returns distances from the city to all the cities
+        """
+        if self._matrix is not None:
+            return self._matrix[city]
+        row = self._rows.get(city)
+        if row is not None:
+            self._rows.move_to_end(city)
+            return row
+        row = self._compute_row(city)
+        if self._max_cached_rows > 0:
+            self._rows[city] = row
+            if len(self._rows) > self._max_cached_rows:
+                self._rows.popitem(last=False)
+        return row
+
+    def rows(self, cities: np.ndarray) -> np.ndarray:
+        """
+        Returns distances from each of the cities to all the cities, without caching the computed rows
+        """
+        if self._matrix is not None:
+            return self._matrix[cities]
+        return self._distance(self._metric_coordinates[cities, None, :], self._metric_coordinates[None, :, :])
+
+    def edge_lengths(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Returns distances between pairs of cities from `starts` and `ends`
+        """
+        if self._matrix is not None:
+            return self._matrix[starts, ends]
+        return self._distance(self._metric_coordinates[starts], self._metric_coordinates[ends])
+
+    def nearest_neighbours(self, k: int) -> np.ndarray:
+        """
+        Returns array with `k` nearest cities of every city, sorted from the nearest one
+        """
+        if self.metric in PLANAR_METRICS:
+            return GridIndex(self.coordinates).nearest_neighbours(k)
+        return self._nearest_neighbours_from_rows(k)
+
+    def _nearest_neighbours_from_rows(self, k: int) -> np.ndarray:
+        """
+        Finds the nearest cities by going through all the distances, rows of the matrix are computed in blocks
+        """
+        n_cities = len(self.coordinates)
+        k = min(k, n_cities - 1)
+        neighbours = np.empty((n_cities, max(k, 0)), dtype=np.int32)
+        if k <= 0:
+            return neighbours
+        block = max(1, BYTES_IN_MB // max(n_cities, 1))
+        for first in range(0, n_cities, block):
+            cities = np.arange(first, min(first + block, n_cities))
+            distances = np.array(self.rows(cities), dtype=float)
+            distances[np.arange(len(cities)), cities] = np.inf
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1, kind='stable')
+            neighbours[cities] = np.take_along_axis(nearest, order, axis=1)
+        return neighbours
+
+    def _compute_row(self, city: int) -> np.ndarray:
+        row = self._distance(self._metric_coordinates[city], self._metric_coordinates)
+        row.setflags(write=False)
+        return row
+
+    def _create_matrix(self) -> np.ndarray:
+        matrix = np.empty((len(self.coordinates), len(self.coordinates)))
+        for city in range(len(self.coordinates)):
+            matrix[city] = self._compute_row(city)
+        matrix.setflags(write=False)
+        return matrix
@@ -0,0 +1,101 @@
+from math import ceil, sqrt
+from typing import Tuple
+
+import numpy as np
+
+
+class GridIndex:
+    """
+    Spatial index that buckets cities into a uniform grid of square cells.
+
+    Cells are sized so that on average each of them contains `cities_per_cell` cities,
+    so nearest neighbours of a city can be found by looking only at a few surrounding cells.
+    """
+
+    def __init__(self, coordinates: np.ndarray, cities_per_cell: int = 2):
+        self.coordinates = coordinates
+        self._min = coordinates.min(axis=0) if len(coordinates) else np.zeros(2)
+        extent = (coordinates.max(axis=0) - self._min) if len(coordinates) else np.zeros(2)
+        area = max(extent[0], 1.0) * max(extent[1], 1.0)
+        self.cell_size = sqrt(area * cities_per_cell / max(len(coordinates), 1))
+        self.shape = (int(extent[0] // self.cell_size) + 1, int(extent[1] // self.cell_size) + 1)
+        cells = self.cells_of(coordinates)
+        cell_ids = self.cell_ids(cells)
+        self.cells = cells
+        self._cities = np.argsort(cell_ids, kind='stable')
+        self._cell_starts = np.searchsorted(
+            cell_ids[self._cities], np.arange(self.shape[0] * self.shape[1] + 1))
+
+    def cells_of(self, coordinates: np.ndarray) -> np.ndarray:
+        cells = ((coordinates - self._min) // self.cell_size).astype(int)
+        return np.clip(cells, 0, np.array(self.shape) - 1)
+
+    def cell_ids(self, cells: np.ndarray) -> np.ndarray:
+        return cells[..., 0] * self.shape[1] + cells[..., 1]
+
+    def ring(self, cell: Tuple[int, int], radius: int) -> np.ndarray:
+        """
+        Returns cells lying exactly `radius` cells away from the cell, as an array of (x, y) pairs
+        """
+        if radius == 0:
+            return np.array([cell])
+        steps = np.arange(-radius, radius + 1)
+        sides = np.concatenate((
+            np.stack((np.full_like(steps, -radius), steps), axis=1),
+            np.stack((np.full_like(steps, radius), steps), axis=1),
+            np.stack((steps[1:-1], np.full_like(steps[1:-1], -radius)), axis=1),
+            np.stack((steps[1:-1], np.full_like(steps[1:-1], radius)), axis=1),
+        )) + np.array(cell)
+        inside = (sides >= 0).all(axis=1) & (sides < np.array(self.shape)).all(axis=1)
+        return sides[inside]
+
+    def cities_in_cell(self, cell: Tuple[int, int]) -> np.ndarray:
+        cell_id = cell[0] * self.shape[1] + cell[1]
+        return self._cities[self._cell_starts[cell_id]:self._cell_starts[cell_id + 1]]
+
+    def cities_in_cells(self, cell_ids: np.ndarray) -> np.ndarray:
+        return np.concatenate([self._cities[self._cell_starts[cell_id]:self._cell_starts[cell_id + 1]]
+                               for cell_id in cell_ids] or [np.empty(0, dtype=self._cities.dtype)])
+
+    def cities_around(self, cell: Tuple[int, int], radius: int) -> np.ndarray:
+        """
+        Returns cities from the square of cells with the given radius around the cell
+        """
+        x_from, x_to = max(cell[0] - radius, 0), min(cell[0] + radius, self.shape[0] - 1)
+        y_from, y_to = max(cell[1] - radius, 0), min(cell[1] + radius, self.shape[1] - 1)
+        return np.concatenate([
+            self._cities[self._cell_starts[x * self.shape[1] + y_from]:self._cell_starts[x * self.shape[1] + y_to + 1]]
+            for x in range(x_from, x_to + 1)
+        ])
+
+    def nearest_neighbours(self, k: int) -> np.ndarray:
+        """
+        Returns array with `k` nearest cities of every city, sorted from the nearest one.
+        """
+        n_cities = len(self.coordinates)
+        k = min(k, n_cities - 1)
+        neighbours = np.empty((n_cities, max(k, 0)), dtype=np.int32)
+        if k <= 0:
+            return neighbours
+        max_radius = max(self.shape)
+        for cell_x in range(self.shape[0]):
+            for cell_y in range(self.shape[1]):
+                cities = self.cities_in_cell((cell_x, cell_y))
+                if len(cities) == 0:
+                    continue
+                # every city outside of the square is at least `radius * cell_size` away
+                radius = max(1, ceil(sqrt((k + 1) / len(cities))) // 2)
+                while True:
+                    candidates = self.cities_around((cell_x, cell_y), radius)
+                    if len(candidates) > k:
+                        diff = self.coordinates[cities, None, :] - self.coordinates[None, candidates, :]
+                        distances = np.hypot(diff[..., 0], diff[..., 1])
+                        distances[cities[:, None] == candidates[None, :]] = np.inf
+                        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+                        nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+                        if radius >= max_radius or nearest_distances.max() <= radius * self.cell_size:
+                            break
+                    radius *= 2
+                order = np.argsort(nearest_distances, axis=1, kind='stable')
+                neighbours[cities] = candidates[np.take_along_axis(nearest, order, axis=1)]
+        return neighbours
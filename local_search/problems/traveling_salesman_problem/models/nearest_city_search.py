@@ -0,0 +1,61 @@
+from math import inf
+from typing import Union
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.models.grid_index import GridIndex
+
+
+class NearestCitySearch:
+    """
+    Finds the nearest of the remaining cities, which are removed from the search one by one.
+
+    Cities are bucketed with a `GridIndex` and the search visits rings of cells around the city,
+    skipping cells without remaining cities, until no city outside of the visited rings can be nearer.
+    """
+
+    def __init__(self, coordinates: np.ndarray, cities: Union[np.ndarray, None] = None):
+        self.coordinates = coordinates
+        self.cities = np.arange(len(coordinates)) if cities is None else np.asarray(cities)
+        self._index = GridIndex(coordinates[self.cities])
+        self._local_indices = np.full(len(coordinates), -1)
+        self._local_indices[self.cities] = np.arange(len(self.cities))
+        self._removed = np.zeros(len(self.cities), dtype=bool)
+        self._cell_ids = self._index.cell_ids(self._index.cells)
+        self._remaining = np.bincount(self._cell_ids, minlength=self._index.shape[0] * self._index.shape[1])
+        self._remaining_total = len(self.cities)
+
+    def __len__(self) -> int:
+        return self._remaining_total
+
+    def remove(self, city: int) -> None:
+        local_index = self._local_indices[city]
+        if local_index >= 0 and not self._removed[local_index]:
+            self._removed[local_index] = True
+            self._remaining[self._cell_ids[local_index]] -= 1
+            self._remaining_total -= 1
+
+    def nearest(self, city: int) -> Union[int, None]:
+        """
+        Returns the nearest remaining city or None if there are no remaining cities
+        """
+        if self._remaining_total == 0:
+            return None
+        point = self.coordinates[city]
+        cell = tuple(self._index.cells_of(point[None, :])[0])
+        nearest, nearest_distance = None, inf
+        for radius in range(max(self._index.shape)):
+            ring_ids = self._index.cell_ids(self._index.ring(cell, radius))
+            ring_ids = ring_ids[self._remaining[ring_ids] > 0]
+            if len(ring_ids):
+                local_indices = self._index.cities_in_cells(ring_ids)
+                local_indices = local_indices[~self._removed[local_indices]]
+                diff = self.coordinates[self.cities[local_indices]] - point
+                distances = np.hypot(diff[:, 0], diff[:, 1])
+                best = np.argmin(distances)
+                if distances[best] < nearest_distance:
+                    nearest, nearest_distance = self.cities[local_indices[best]], distances[best]
+            # every city outside of the visited rings is at least `radius * cell_size` away
+            if nearest is not None and nearest_distance <= radius * self._index.cell_size:
+                break
+        return int(nearest)
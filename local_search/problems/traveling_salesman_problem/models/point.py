@@ -1,7 +1,11 @@
 from dataclasses import dataclass
+from math import sqrt
 
 
 @dataclass
 class Point:
     x: int
     y: int
+
+    def distance_to(self, point: 'Point') -> float:
+        return sqrt((point.x - self.x) ** 2 + (self.y - point.y) ** 2)
@@ -1,5 +1,4 @@
 from functools import reduce
-from math import sqrt
 from typing import List
 
 from local_search.problems.traveling_salesman_problem.models.point import Point
@@ -9,8 +8,7 @@ class Salesman(Point):
     travelled_distance: float = 0
 
     def walk_to(self, point: Point) -> 'Salesman':
-        self.travelled_distance += sqrt((point.x - self.x)
-                                        ** 2 + (self.y - point.y) ** 2)
+        self.travelled_distance += self.distance_to(point)
         self.x, self.y = point.x, point.y
         return self
 
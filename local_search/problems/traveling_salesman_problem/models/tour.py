@@ -0,0 +1,158 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Union
+
+import numpy as np
+
+from local_search.helpers.camel_to_snake import camel_to_snake
+
+
+class Tour(ABC):
+    """
+    Order of the cities on a route, which starts at position 0 and ends at position `len(tour) - 1` in the depot.
+
+    Positions of the cities count from the depot at the beginning of the route.
+    Parts of the route are modified in place by `reverse`, `swap` and `exchange_segments`.
+    """
+    tours = {}
+
+    def __init_subclass__(cls):
+        Tour.tours[camel_to_snake(cls.__name__)] = cls
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Length of the route, which is the number of the cities plus one (the depot is both at its beginning and its end)
+        """
+
+    @property
+    @abstractmethod
+    def route(self) -> np.ndarray:
+        """
+        Array with cities of the route, it must not be modified
+        """
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Array with positions of the cities on the route, it must not be modified
+        """
+        return self.positions_of(np.arange(len(self) - 1))
+
+    @abstractmethod
+    def city_at(self, position: int) -> int:
+        pass
+
+    @abstractmethod
+    def cities_at(self, positions: np.ndarray) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def position_of(self, city: int) -> int:
+        pass
+
+    @abstractmethod
+    def positions_of(self, cities: np.ndarray) -> np.ndarray:
+        pass
+
+    def next(self, city: int) -> int:
+        return self.city_at(self.position_of(city) + 1)
+
+    def prev(self, city: int) -> int:
+        position = self.position_of(city)
+        return self.city_at(position - 1 if position > 0 else len(self) - 2)
+
+    def between(self, first: int, city: int, last: int) -> bool:
+        """
+        Tells whether the city lies on the path going forward from `first` to `last` (both including)
+        """
+        first, city, last = self.position_of(first), self.position_of(city), self.position_of(last)
+        if first <= last:
+            return first <= city <= last
+        return city >= first or city <= last
+
+    @abstractmethod
+    def reverse(self, i1: int, i2: int) -> None:
+        """
+        Reverses the part of the route from position `i1` up to (excluding) position `i2`
+        """
+
+    @abstractmethod
+    def swap(self, i1: int, i2: int) -> None:
+        """
+        Swaps cities at positions `i1` and `i2` of the route
+        """
+
+    def exchange_segments(self, i1: int, i2: int, i3: int) -> None:
+        """
+        Exchanges adjacent parts of the route from position `i1` up to `i2` and from `i2` up to `i3` (both excluding)
+        """
+        self.reverse(i1, i2)
+        self.reverse(i2, i3)
+        self.reverse(i1, i3)
+
+    @abstractmethod
+    def copy(self) -> 'Tour':
+        pass
+
+
+class ArrayTour(Tour):
+    """
+    Route stored in an array, together with positions of the cities computed when they are needed for the first time.
+    Queries take O(1) time, modifications of the route take time proportional to the length of the modified part.
+    """
+
+    def __init__(self, route: Union[np.ndarray, Iterable[int]]):
+        self._route = np.asarray(route, dtype=np.int32)
+        self._positions: Union[np.ndarray, None] = None
+
+    def __len__(self) -> int:
+        return len(self._route)
+
+    @property
+    def route(self) -> np.ndarray:
+        return self._route
+
+    @property
+    def positions(self) -> np.ndarray:
+        if self._positions is None:
+            self._positions = np.empty(len(self._route) - 1, dtype=np.int32)
+            self._positions[self._route[:-1]] = np.arange(len(self._route) - 1, dtype=np.int32)
+        return self._positions
+
+    def city_at(self, position: int) -> int:
+        return self._route[position]
+
+    def cities_at(self, positions: np.ndarray) -> np.ndarray:
+        return self._route[positions]
+
+    def position_of(self, city: int) -> int:
+        return self.positions[city]
+
+    def positions_of(self, cities: np.ndarray) -> np.ndarray:
+        return self.positions[cities]
+
+    def next(self, city: int) -> int:
+        return self._route[self.positions[city] + 1]
+
+    def reverse(self, i1: int, i2: int) -> None:
+        segment = self._route[i1:i2]
+        segment[:] = segment[::-1].copy()
+        if self._positions is not None:
+            self._positions[segment] = np.arange(i1, i2, dtype=np.int32)
+
+    def swap(self, i1: int, i2: int) -> None:
+        self._route[[i1, i2]] = self._route[[i2, i1]]
+        if self._positions is not None:
+            self._positions[self._route[[i1, i2]]] = (i1, i2)
+
+    def exchange_segments(self, i1: int, i2: int, i3: int) -> None:
+        segment = self._route[i1:i3]
+        segment[:] = np.concatenate((segment[i2 - i1:], segment[:i2 - i1]))
+        if self._positions is not None:
+            self._positions[segment] = np.arange(i1, i3, dtype=np.int32)
+
+    def copy(self) -> 'ArrayTour':
+        tour = ArrayTour(self._route.copy())
+        if self._positions is not None:
+            tour._positions = self._positions.copy()
+        return tour
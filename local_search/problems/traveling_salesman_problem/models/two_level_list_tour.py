@@ -0,0 +1,164 @@
+from math import isqrt
+from typing import Iterable, Union
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.models.tour import Tour
+
+
+class TwoLevelListTour(Tour):
+    """
+    Route split into segments of about sqrt(n) cities, suited for very large problems.
+
+    Cities of all the segments are stored in a single array, each segment is a slice of it
+    with a flag telling whether the slice is read in the reversed order.
+    Segments are kept in the order of the route together with positions at which they start.
+
+    Reversing a part of the route splits at most two segments at its ends, then reverses the order
+    of the segments in between and flips their flags, which takes O(sqrt n) time.
+    Queries find the segment of a city (or of a position) and take O(1) (or O(log n)) time.
+    Once splits double the number of segments, the segments are rebuilt from the route.
+    """
+
+    def __init__(self, route: Union[np.ndarray, Iterable[int]]):
+        self._build(np.asarray(route, dtype=np.int32))
+
+    def _build(self, route: np.ndarray) -> None:
+        self._length = len(route)
+        self._depot = route[0]
+        n_cities = len(route) - 1
+        segment_size = max(isqrt(n_cities), 1)
+        n_segments = -(-n_cities // segment_size)
+        self._max_segments = 2 * n_segments
+        capacity = self._max_segments + 2
+        self._cities = route[:-1].copy()
+        # storage slots of the cities
+        self._slots = np.empty(n_cities, dtype=np.int64)
+        self._slots[self._cities] = np.arange(n_cities)
+        # attributes of the segments, indexed by segment id
+        self._bases = np.zeros(capacity, dtype=np.int64)
+        self._lengths = np.zeros(capacity, dtype=np.int64)
+        self._flipped = np.zeros(capacity, dtype=bool)
+        self._start_of = np.zeros(capacity, dtype=np.int64)
+        self._bases[:n_segments] = np.arange(n_segments) * segment_size
+        self._lengths[:n_segments] = np.minimum(segment_size, n_cities - self._bases[:n_segments])
+        self._start_of[:n_segments] = self._bases[:n_segments]
+        self._segment_of = (np.arange(n_cities) // segment_size)[self._slots]
+        self._n_segments = n_segments
+        # segment ids in the order of the route and their start positions
+        self._order = np.arange(n_segments)
+        self._starts = self._bases[:n_segments].copy()
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def route(self) -> np.ndarray:
+        return np.concatenate([self._segment_cities(segment) for segment in self._order] + [[self._depot]]) \
+            .astype(np.int32)
+
+    def _segment_cities(self, segment: int) -> np.ndarray:
+        cities = self._cities[self._bases[segment]:self._bases[segment] + self._lengths[segment]]
+        return cities[::-1] if self._flipped[segment] else cities
+
+    def _rank_of(self, position: int) -> int:
+        """
+        Returns index of the segment containing the position in the order of the route
+        """
+        return int(np.searchsorted(self._starts, position, side='right')) - 1
+
+    def city_at(self, position: int) -> int:
+        if position == self._length - 1:
+            position = 0
+        rank = self._rank_of(position)
+        segment, offset = self._order[rank], position - self._starts[rank]
+        if self._flipped[segment]:
+            offset = self._lengths[segment] - 1 - offset
+        return self._cities[self._bases[segment] + offset]
+
+    def cities_at(self, positions: np.ndarray) -> np.ndarray:
+        positions = np.where(positions == self._length - 1, 0, positions)
+        ranks = np.searchsorted(self._starts, positions, side='right') - 1
+        segments = self._order[ranks]
+        offsets = positions - self._starts[ranks]
+        offsets = np.where(self._flipped[segments], self._lengths[segments] - 1 - offsets, offsets)
+        return self._cities[self._bases[segments] + offsets]
+
+    def position_of(self, city: int) -> int:
+        segment = self._segment_of[city]
+        offset = self._slots[city] - self._bases[segment]
+        if self._flipped[segment]:
+            offset = self._lengths[segment] - 1 - offset
+        return int(self._start_of[segment] + offset)
+
+    def positions_of(self, cities: np.ndarray) -> np.ndarray:
+        segments = self._segment_of[cities]
+        offsets = self._slots[cities] - self._bases[segments]
+        offsets = np.where(self._flipped[segments], self._lengths[segments] - 1 - offsets, offsets)
+        return self._start_of[segments] + offsets
+
+    def reverse(self, i1: int, i2: int) -> None:
+        if i2 - i1 < 2:
+            return
+        rank = self._rank_of(i1)
+        if i2 <= self._starts[rank] + self._lengths[self._order[rank]]:
+            self._reverse_inside(self._order[rank], i1 - self._starts[rank], i2 - self._starts[rank])
+            return
+        first = self._split(i1)
+        last = self._split(i2) if i2 < self._length - 1 else len(self._order)
+        segments = self._order[first:last][::-1].copy()
+        self._order[first:last] = segments
+        self._flipped[segments] ^= True
+        self._starts[first:last] = i1 + np.concatenate(([0], np.cumsum(self._lengths[segments])[:-1]))
+        self._start_of[segments] = self._starts[first:last]
+        if len(self._order) > self._max_segments:
+            self._build(self.route)
+
+    def _reverse_inside(self, segment: int, offset1: int, offset2: int) -> None:
+        """
+        Reverses cities of the segment between offsets from its start on the route
+        """
+        if self._flipped[segment]:
+            offset1, offset2 = self._lengths[segment] - offset2, self._lengths[segment] - offset1
+        base = self._bases[segment]
+        cities = self._cities[base + offset1:base + offset2]
+        cities[:] = cities[::-1].copy()
+        self._slots[cities] = np.arange(base + offset1, base + offset2)
+
+    def _split(self, position: int) -> int:
+        """
+        Splits the segment containing the position, so that a segment starts at it.
+        Returns index of that segment in the order of the route.
+        """
+        rank = self._rank_of(position)
+        if self._starts[rank] == position:
+            return rank
+        segment, new_segment = self._order[rank], self._n_segments
+        self._n_segments += 1
+        offset = position - self._starts[rank]
+        base, length = self._bases[segment], self._lengths[segment]
+        if self._flipped[segment]:
+            self._bases[new_segment], self._bases[segment] = base, base + length - offset
+        else:
+            self._bases[new_segment] = base + offset
+        self._lengths[new_segment], self._lengths[segment] = length - offset, offset
+        self._flipped[new_segment] = self._flipped[segment]
+        self._start_of[new_segment] = position
+        new_base = self._bases[new_segment]
+        self._segment_of[self._cities[new_base:new_base + length - offset]] = new_segment
+        self._order = np.insert(self._order, rank + 1, new_segment)
+        self._starts = np.insert(self._starts, rank + 1, position)
+        return rank + 1
+
+    def swap(self, i1: int, i2: int) -> None:
+        city1, city2 = self.cities_at(np.array([i1, i2]))
+        slot1, slot2 = self._slots[city1], self._slots[city2]
+        self._cities[slot1], self._cities[slot2] = city2, city1
+        self._slots[city1], self._slots[city2] = slot2, slot1
+        self._segment_of[city1], self._segment_of[city2] = self._segment_of[city2], self._segment_of[city1]
+
+    def copy(self) -> 'TwoLevelListTour':
+        tour = TwoLevelListTour.__new__(TwoLevelListTour)
+        for name, value in vars(self).items():
+            setattr(tour, name, value.copy() if isinstance(value, np.ndarray) else value)
+        return tour
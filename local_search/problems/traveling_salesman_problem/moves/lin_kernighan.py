@@ -0,0 +1,147 @@
+from typing import Generator, List, Set, Tuple, Union
+
+import numpy as np
+
+from local_search.problems.base import Move
+from local_search.problems.traveling_salesman_problem.models.edge import Edge
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
+from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+import random
+
+# maximal number of 2-opt moves chained into a single move
+MAX_DEPTH = 12
+# number of alternatives tried for the first edge added by a move, deeper edges are chosen greedily
+BREADTH = 5
+
+
+class LinKernighanMove(TravelingSalesmanMove):
+    """
+    Sequence of 2-opt moves, each reversing the part of the route from position `i1` up to (excluding) position `i2`,
+    which together remove and add the given edges.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState, reversals: List[Tuple[int, int]],
+                 removed_edges: List[Edge], added_edges: List[Edge]):
+        super().__init__(from_state)
+        self.reversals = reversals
+        self.removed_edges, self.added_edges = removed_edges, added_edges
+
+    def _apply_to(self, state: TravelingSalesmanState) -> None:
+        for i1, i2 in self.reversals:
+            state.reverse(i1, i2)
+
+    def _undo_on(self, state: TravelingSalesmanState) -> None:
+        for i1, i2 in reversed(self.reversals):
+            state.reverse(i1, i2)
+
+    def changed_edges(self) -> Tuple[List[Edge], List[Edge]]:
+        return self.removed_edges, self.added_edges
+
+
+class LinKernighan(TravelingSalesmanMoveGenerator):
+    """
+    Generates variable-depth moves in the style of the Lin-Kernighan heuristic.
+
+    A move starts by removing the edge (t1, t2) of the route. Then, as long as the sum of removed minus added
+    edges stays positive, it adds an edge (t2, t3) to one of the candidates of t2 and removes the edge (t3, t4),
+    which lets the route be closed with the edge (t4, t1) by a 2-opt move. The chain of 2-opt moves
+    is cut at the depth with the shortest closed route, so a move of depth 1 is a plain 2-opt move.
+
+    Chains are built by reversing parts of the state route in place, the route is restored before a move is generated.
+    """
+
+    def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        for t1 in self._base_cities(state):
+            for forward in (True, False):
+                t2 = self._neighbour_on_route(state, t1, forward)
+                for t3 in self._next_cities(state, t1, t2, forward, self.distances(t1, t2))[:BREADTH]:
+                    yield self._chain(state, int(t1), forward, t3)
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        failed_attempts = 0
+        while failed_attempts <= 10 * len(state.tour):
+            t1, forward = random.randrange(len(state.tour) - 1), random.random() < 0.5
+            t2 = self._neighbour_on_route(state, t1, forward)
+            # the first step does not need to be promising, so the random moves can also worsen the route
+            next_cities = self._next_cities(state, t1, t2, forward, self.distances(t1, t2), positive_gain=False)
+            if not next_cities:
+                failed_attempts += 1
+                continue
+            failed_attempts = 0
+            yield self._chain(state, t1, forward, random.choice(next_cities[:BREADTH]))
+
+    def _chain(self, state: TravelingSalesmanState, t1: int, forward: bool, t3: int) -> LinKernighanMove:
+        """
+        Creates the move starting with the edge removed after t1 (or before it, if not `forward`)
+        and the edge added to t3, continuing it greedily
+        """
+        t2 = self._neighbour_on_route(state, t1, forward)
+        removed_edges, added_edges, closing_cities, reversals = [Edge(t1, t2)], [], [], []
+        changed = {self._key(t1, t2)}
+        gain = self.distances(t1, t2)
+        best_gain, best_depth = None, 0
+        try:
+            while True:
+                t4 = self._neighbour_on_route(state, t3, not forward)
+                gain += self.distances(t3, t4) - self.distances(t2, t3)
+                removed_edges.append(Edge(t3, t4))
+                added_edges.append(Edge(t2, t3))
+                changed.update((self._key(t3, t4), self._key(t2, t3)))
+                reversal, is_complement = self._reversal(state, t2, t4) if forward else self._reversal(state, t4, t2)
+                state.reverse(*reversal)
+                reversals.append(reversal)
+                closing_cities.append(t4)
+                forward ^= is_complement
+                closed_gain = gain - self.distances(t4, t1)
+                if best_gain is None or closed_gain > best_gain:
+                    best_gain, best_depth = closed_gain, len(reversals)
+                if len(reversals) >= MAX_DEPTH:
+                    break
+                t2 = t4
+                next_cities = self._next_cities(state, t1, t2, forward, gain, changed)
+                if not next_cities:
+                    break
+                t3 = next_cities[0]
+        finally:
+            for reversal in reversed(reversals):
+                state.reverse(*reversal)
+        return LinKernighanMove(state, reversals[:best_depth], removed_edges[:best_depth + 1],
+                                added_edges[:best_depth] + [Edge(closing_cities[best_depth - 1], t1)])
+
+    def _next_cities(self, state: TravelingSalesmanState, t1: int, t2: int, forward: bool, gain: float,
+                     changed: Union[Set[Tuple[int, int]], None] = None, positive_gain: bool = True) -> List[int]:
+        """
+        Returns candidates t3 of t2 for the next added edge, the most promising first.
+        Edges already changed by the move are neither added nor removed again.
+        """
+        tour = state.tour
+        candidates = self.neighbours[t2] if self.neighbours is not None else np.arange(len(tour) - 1)
+        closing = tour.cities_at((tour.positions_of(candidates) + (-1 if forward else 1)) % (len(tour) - 1))
+        partial_gains = gain - self.distances.row(t2)[candidates]
+        valid = (candidates != t1) & (candidates != t2) & (closing != t2)
+        if positive_gain:
+            valid &= partial_gains > 0
+        scores = partial_gains + self.distances.edge_lengths(candidates, closing)
+        order = np.flatnonzero(valid)[np.argsort(-scores[valid], kind='stable')]
+        return [int(t3) for t3, t4 in zip(candidates[order], closing[order])
+                if not changed or (self._key(t2, t3) not in changed and self._key(t3, t4) not in changed)]
+
+    @staticmethod
+    def _neighbour_on_route(state: TravelingSalesmanState, city: int, forward: bool) -> int:
+        return int(state.tour.next(city) if forward else state.tour.prev(city))
+
+    @staticmethod
+    def _reversal(state: TravelingSalesmanState, first: int, last: int) -> Tuple[Tuple[int, int], bool]:
+        """
+        Returns the part of the route to reverse, so that the path going forward from `first` to `last` is reversed.
+        If the path passes the depot, the rest of the route is reversed instead, which also changes direction of the route.
+        """
+        start, end = int(state.tour.position_of(first)), int(state.tour.position_of(last))
+        if 1 <= start <= end:
+            return (start, end + 1), False
+        return (end + 1, start if start > 0 else len(state.tour) - 1), True
+
+    @staticmethod
+    def _key(start: int, end: int) -> Tuple[int, int]:
+        return (start, end) if start < end else (end, start)
@@ -0,0 +1,93 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple, Union
+
+from local_search.problems.base import Move
+from local_search.problems.traveling_salesman_problem.models.edge import Edge
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+
+
+class TravelingSalesmanMove(Move[TravelingSalesmanState], ABC):
+    """
+    Base class for moves of the traveling salesman problem.
+    Every move only replaces a few edges of the route, so it can be evaluated without walking the whole route.
+
+    Besides `make`, which creates a new state, a move can be applied to its state in place with `apply`
+    and reverted with `undo`, so no state has to be allocated to try it.
+    `changed_edges` describe the move only as long as it is not applied.
+
+    `length_delta` is set by the goal evaluating the move, so that the states created by the move
+    get their cached length from the length of the move state without walking the route again.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState):
+        super().__init__(from_state)
+        self.length_delta: Union[float, None] = None
+        self._reactivated: List[int] = []
+
+    @abstractmethod
+    def changed_edges(self) -> Tuple[List[Edge], List[Edge]]:
+        """
+        Returns edges removed from the route and edges added to the route by this move
+        """
+
+    @abstractmethod
+    def _apply_to(self, state: TravelingSalesmanState) -> None:
+        """
+        Modifies the route of the state (a copy of the move state or the move state itself) in place
+        """
+
+    def _undo_on(self, state: TravelingSalesmanState) -> None:
+        """
+        Reverts the move applied to the state, moves which are their own inverse do not need to override it
+        """
+        self._apply_to(state)
+
+    def make(self) -> TravelingSalesmanState:
+        new_state = self.state.copy()
+        self._reactivate_cities(new_state)
+        self._apply_to(new_state)
+        new_state.length = self._length_after(self.state.length, self.length_delta)
+        return new_state
+
+    def apply(self) -> TravelingSalesmanState:
+        """
+        Makes the move on its state in place
+        """
+        length = self.state.length
+        self._reactivated = self._reactivate_cities(self.state)
+        self._apply_to(self.state)
+        self.state.length = self._length_after(length, self.length_delta)
+        return self.state
+
+    def undo(self) -> TravelingSalesmanState:
+        """
+        Restores the route and the don't look bits of the state modified by `apply`
+        """
+        length = self.state.length
+        self._undo_on(self.state)
+        if self._reactivated:
+            self.state.dont_look_bits[self._reactivated] = True
+            self._reactivated = []
+        self.state.length = self._length_after(length, -self.length_delta if self.length_delta is not None else None)
+        return self.state
+
+    @staticmethod
+    def _length_after(length: Union[float, None], delta: Union[float, None]) -> Union[float, None]:
+        if length is None or delta is None:
+            return None
+        return length + delta
+
+    def _reactivate_cities(self, state: TravelingSalesmanState) -> List[int]:
+        """
+        Clears don't look bits of cities whose incident edges are changed by the move,
+        returns the cities whose bits were set before
+        """
+        if state.dont_look_bits is None:
+            return []
+        reactivated = []
+        for edge in self.changed_edges()[0]:
+            for city in (edge.start, edge.end):
+                if state.dont_look_bits[city]:
+                    state.dont_look_bits[city] = False
+                    reactivated.append(city)
+        return reactivated
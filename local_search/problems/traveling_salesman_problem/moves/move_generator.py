@@ -1,15 +1,91 @@
 from abc import ABC
+import random
+from typing import Generator, Tuple, Union
+
+import numpy as np
 
 from local_search.helpers.camel_to_snake import camel_to_snake
 
 from local_search.problems.base.move_generator import MoveGenerator
+from local_search.problems.traveling_salesman_problem.models.distance_oracle import DistanceOracle
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 
 
 class TravelingSalesmanMoveGenerator(MoveGenerator, ABC):
     """
     Base class for move generators for traveling salesman problem
+
+    If `neighbours` (candidate lists of the nearest cities) are passed, generators only create moves
+    which connect a city with one of its candidates, instead of enumerating all the pairs of positions.
+
+    With `dont_look_bits` enabled, moves of a city are skipped once all of them were rejected,
+    until one of the edges incident to the city is changed by a move.
+    It suits first choice hill climbing, which stops at the first improving move.
+    The bits are a heuristic: a city is not reactivated when only edges of its candidates change.
     """
     move_generators = {}
 
     def __init_subclass__(cls):
-        TravelingSalesmanMoveGenerator.move_generators[camel_to_snake(cls.__name__)] = cls
\ No newline at end of file
+        TravelingSalesmanMoveGenerator.move_generators[camel_to_snake(cls.__name__)] = cls
+
+    def __init__(self, distances: DistanceOracle, neighbours: Union[np.ndarray, None] = None, dont_look_bits: bool = False):
+        self.distances = distances
+        self.neighbours = neighbours
+        self.dont_look_bits = dont_look_bits
+
+    def _base_cities(self, state: TravelingSalesmanState) -> Generator[int, None, None]:
+        """
+        Generates cities to start moves from, with don't look bits it skips cities whose moves were all rejected
+        """
+        if not self.dont_look_bits:
+            yield from state.route[:-1]
+            return
+        if state.dont_look_bits is None:
+            state.dont_look_bits = np.zeros(len(state.tour) - 1, dtype=bool)
+        for city in np.flatnonzero(~state.dont_look_bits):
+            yield city
+            # reached only if none of the city moves was accepted
+            state.dont_look_bits[city] = True
+
+    def _base_positions(self, state: TravelingSalesmanState) -> Generator[int, None, None]:
+        """
+        Generates positions of the base cities on the route, skipping the depot at both of its ends
+        """
+        tour = state.tour
+        for city in self._base_cities(state):
+            position = tour.position_of(city)
+            if position != 0:
+                yield position
+
+    def _position_pairs(self, state: TravelingSalesmanState) -> Generator[Tuple[int, int], None, None]:
+        """
+        Generates pairs of positions 1 <= i1 < i2 <= len(route) - 2, with don't look bits only the pairs
+        including a position of a base city
+        """
+        last = len(state.tour) - 1
+        if not self.dont_look_bits:
+            for i1 in range(1, last - 1):
+                for i2 in range(i1 + 1, last):
+                    yield i1, i2
+            return
+        for position in self._base_positions(state):
+            for other in range(1, last):
+                if other != position:
+                    yield min(position, other), max(position, other)
+
+    def _candidate_positions(self, state: TravelingSalesmanState) -> Generator[Tuple[int, int], None, None]:
+        """
+        Generates positions of cities on the route paired with positions of their candidates
+        """
+        tour = state.tour
+        for city in self._base_cities(state):
+            position = tour.position_of(city)
+            for neighbour_position in tour.positions_of(self.neighbours[city]):
+                yield position, neighbour_position
+
+    def _random_candidate_positions(self, state: TravelingSalesmanState) -> Generator[Tuple[int, int], None, None]:
+        tour = state.tour
+        while True:
+            position = random.randrange(len(tour) - 1)
+            neighbour = random.choice(self.neighbours[tour.city_at(position)])
+            yield position, tour.position_of(neighbour)
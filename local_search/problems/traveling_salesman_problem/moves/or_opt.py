@@ -0,0 +1,131 @@
+from typing import Generator, Iterable, List, Tuple
+
+from local_search.problems.base import Move
+from local_search.problems.traveling_salesman_problem.models.edge import Edge
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
+from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
+from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
+import random
+
+MAX_SEGMENT_LENGTH = 3
+
+
+class OrOptMove(TravelingSalesmanMove):
+    """
+    Relocates the part of the route from position `i1` to position `i2` (both including)
+    between cities at positions `p` and `p + 1`, optionally reversing it.
+    """
+
+    def __init__(self, from_state: TravelingSalesmanState, i1: int, i2: int, p: int, reverse: bool = False):
+        super().__init__(from_state)
+        (self.i1, self.i2, self.p, self.reverse) = i1, i2, p, reverse
+
+    def _apply_to(self, state: TravelingSalesmanState) -> None:
+        length = self.i2 - self.i1 + 1
+        if self.p > self.i2:
+            state.exchange_segments(self.i1, self.i2 + 1, self.p + 1)
+            if self.reverse:
+                state.reverse(self.p + 1 - length, self.p + 1)
+        else:
+            state.exchange_segments(self.p + 1, self.i1, self.i2 + 1)
+            if self.reverse:
+                state.reverse(self.p + 1, self.p + 1 + length)
+
+    def _undo_on(self, state: TravelingSalesmanState) -> None:
+        length = self.i2 - self.i1 + 1
+        if self.p > self.i2:
+            if self.reverse:
+                state.reverse(self.p + 1 - length, self.p + 1)
+            state.exchange_segments(self.i1, self.p + 1 - length, self.p + 1)
+        else:
+            if self.reverse:
+                state.reverse(self.p + 1, self.p + 1 + length)
+            state.exchange_segments(self.p + 1, self.p + 1 + length, self.i2 + 1)
+
+    def changed_edges(self) -> Tuple[List[Edge], List[Edge]]:
+        tour = self.state.tour
+        before, first, last, after = (tour.city_at(self.i1 - 1), tour.city_at(self.i1),
+                                      tour.city_at(self.i2), tour.city_at(self.i2 + 1))
+        start, end = tour.city_at(self.p), tour.city_at(self.p + 1)
+        removed_edges = [Edge(before, first), Edge(last, after), Edge(start, end)]
+        if self.reverse:
+            first, last = last, first
+        return (removed_edges,
+                [Edge(before, after), Edge(start, first), Edge(last, end)])
+
+
+class OrOpt(TravelingSalesmanMoveGenerator):
+    """
+    Generates moves relocating parts of the route with up to `MAX_SEGMENT_LENGTH` cities,
+    in the same or in the reversed direction.
+    """
+
+    def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        if self.neighbours is not None:
+            yield from self._candidate_moves(state, self._candidate_positions(state))
+            return
+        if self.dont_look_bits:
+            for position in self._base_positions(state):
+                yield from self._moves_of_position(state, position)
+            return
+        last = len(state.tour) - 1
+        for length in range(1, MAX_SEGMENT_LENGTH + 1):
+            for i1 in range(1, last - length + 1):
+                yield from self._segment_moves(state, i1, i1 + length - 1, range(last))
+
+    def _moves_of_position(self, state: TravelingSalesmanState, position: int) -> Generator[Move[TravelingSalesmanState], None, None]:
+        """
+        Generates moves removing an edge incident to the city at the position: moves of segments
+        starting or ending with the city and moves inserting segments right before or right after the city
+        """
+        last = len(state.tour) - 1
+        for length in range(1, MAX_SEGMENT_LENGTH + 1):
+            for i1 in sorted({position, position - length + 1}):
+                if 1 <= i1 <= last - length:
+                    yield from self._segment_moves(state, i1, i1 + length - 1, range(last))
+            for i1 in range(1, last - length + 1):
+                yield from self._segment_moves(state, i1, i1 + length - 1, (position - 1, position))
+
+    @staticmethod
+    def _segment_moves(state: TravelingSalesmanState, i1: int, i2: int, positions: Iterable[int]) -> Generator[Move[TravelingSalesmanState], None, None]:
+        """
+        Generates moves inserting the segment from `i1` to `i2` after the given positions outside of it
+        """
+        for p in positions:
+            if i1 - 1 <= p <= i2:
+                continue
+            yield OrOptMove(state, i1, i2, p)
+            if i2 > i1:
+                yield OrOptMove(state, i1, i2, p, reverse=True)
+
+    def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        if self.neighbours is not None:
+            yield from self._candidate_moves(state, self._random_candidate_positions(state))
+            return
+        last = len(state.tour) - 1
+        while True:
+            length = random.randint(1, min(MAX_SEGMENT_LENGTH, last - 2))
+            i1 = random.randrange(1, last - length + 1)
+            i2 = i1 + length - 1
+            # positions, between which the segment can be inserted, skipping its own ones
+            p = random.randrange(last - length - 1)
+            if p >= i1 - 1:
+                p += length + 1
+            yield OrOptMove(state, i1, i2, p, reverse=length > 1 and random.random() < 0.5)
+
+    def _candidate_moves(self, state: TravelingSalesmanState, candidate_positions) -> Generator[Move[TravelingSalesmanState], None, None]:
+        """
+        Generates moves that place a segment starting or ending with the city right before or right after its candidate
+        """
+        last = len(state.tour) - 1
+        for position, candidate_position in candidate_positions:
+            # the depot is both at the beginning and at the end of the route
+            before_candidate = candidate_position - 1 if candidate_position > 0 else last - 1
+            for length in range(1, MAX_SEGMENT_LENGTH + 1):
+                segments = ((position, position + length - 1, False), (position - length + 1, position, True))
+                for i1, i2, city_is_last in segments[:1 if length == 1 else 2]:
+                    if i1 < 1 or i2 > last - 1:
+                        continue
+                    for p, reverse in ((candidate_position, city_is_last), (before_candidate, not city_is_last)):
+                        if not i1 - 1 <= p <= i2:
+                            yield OrOptMove(state, i1, i2, p, reverse=reverse and length > 1)
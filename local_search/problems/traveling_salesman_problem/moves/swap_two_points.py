@@ -1,34 +1,59 @@
-from copy import copy
-from typing import Generator, List
+from typing import Generator, List, Tuple
 
 from local_search.problems.base import Move
+from local_search.problems.traveling_salesman_problem.models.edge import Edge
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
 from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 import random
 
 
-class SwapTwoPointsMove(Move[TravelingSalesmanState]):
+class SwapTwoPointsMove(TravelingSalesmanMove):
 
     def __init__(self, from_state: TravelingSalesmanState, i1: int, i2: int):
         super().__init__(from_state)
         (self.i1, self.i2) = i1, i2
 
-    def make(self) -> TravelingSalesmanState:
-        new_route = copy(self.state.route)
-        new_route[self.i1] = self.state.route[self.i2]
-        new_route[self.i2] = self.state.route[self.i1]
-        return TravelingSalesmanState(new_route, self.state.points)
+    def _apply_to(self, state: TravelingSalesmanState) -> None:
+        state.swap(self.i1, self.i2)
+
+    def changed_edges(self) -> Tuple[List[Edge], List[Edge]]:
+        tour = self.state.tour
+        before_a, a, after_a = tour.city_at(self.i1 - 1), tour.city_at(self.i1), tour.city_at(self.i1 + 1)
+        before_b, b, after_b = tour.city_at(self.i2 - 1), tour.city_at(self.i2), tour.city_at(self.i2 + 1)
+        if self.i2 == self.i1 + 1:
+            return ([Edge(before_a, a), Edge(a, b), Edge(b, after_b)],
+                    [Edge(before_a, b), Edge(b, a), Edge(a, after_b)])
+        return ([Edge(before_a, a), Edge(a, after_a), Edge(before_b, b), Edge(b, after_b)],
+                [Edge(before_a, b), Edge(b, after_a), Edge(before_b, a), Edge(a, after_b)])
 
 
 class SwapTwoPoints(TravelingSalesmanMoveGenerator):
 
     def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
-        for i1 in range(1, len(state.route) - 2):
-            for i2 in range(i1 + 1, len(state.route) - 1):
-                yield SwapTwoPointsMove(state, i1, i2)
+        if self.neighbours is not None:
+            yield from self._candidate_moves(state, self._candidate_positions(state))
+            return
+        for i1, i2 in self._position_pairs(state):
+            yield SwapTwoPointsMove(state, i1, i2)
 
     def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        if self.neighbours is not None:
+            yield from self._candidate_moves(state, self._random_candidate_positions(state))
+            return
         while True:
-            i1 = random.randrange(1, len(state.route) - 2)
-            i2 = random.randrange(i1 + 1, len(state.route) - 1)
+            i1 = random.randrange(1, len(state.tour) - 2)
+            i2 = random.randrange(i1 + 1, len(state.tour) - 1)
             yield SwapTwoPointsMove(state, i1, i2)
+
+    def _candidate_moves(self, state: TravelingSalesmanState, candidate_positions) -> Generator[Move[TravelingSalesmanState], None, None]:
+        """
+        Generates moves that place the city right before or right after its candidate
+        """
+        last = len(state.tour) - 1
+        for position, candidate_position in candidate_positions:
+            if position == 0:
+                continue
+            for swapped_position in (candidate_position - 1, candidate_position + 1):
+                if 1 <= swapped_position < last and swapped_position != position:
+                    yield SwapTwoPointsMove(state, min(position, swapped_position), max(position, swapped_position))
@@ -1,33 +1,104 @@
-from copy import copy
-from typing import Generator
+from typing import Generator, List, Tuple, Union
+
+import numpy as np
 
 from local_search.problems.base import Move
+from local_search.problems.base.goal import Goal
+from local_search.problems.traveling_salesman_problem.models.edge import Edge
+from local_search.problems.traveling_salesman_problem.moves.move import TravelingSalesmanMove
 from local_search.problems.traveling_salesman_problem.moves.move_generator import TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import TravelingSalesmanState
 import random
 
-class TwoOptMove(Move[TravelingSalesmanState]):
+class TwoOptMove(TravelingSalesmanMove):
 
     def __init__(self, from_state: TravelingSalesmanState, i1: int, i2: int):
         super().__init__(from_state)
         (self.i1, self.i2) = i1, i2
 
-    def make(self) -> TravelingSalesmanState:
-        new_route = self.state.route[0:self.i1] + list(reversed(self.state.route[self.i1:self.i2])) + self.state.route[self.i2:]
-        return TravelingSalesmanState(new_route, self.state.points)
+    def _apply_to(self, state: TravelingSalesmanState) -> None:
+        state.reverse(self.i1, self.i2)
+
+    def changed_edges(self) -> Tuple[List[Edge], List[Edge]]:
+        tour = self.state.tour
+        before_first, first = tour.city_at(self.i1 - 1), tour.city_at(self.i1)
+        last, after_last = tour.city_at(self.i2 - 1), tour.city_at(self.i2)
+        return ([Edge(before_first, first), Edge(last, after_last)],
+                [Edge(before_first, last), Edge(first, after_last)])
+
+# number of gains computed in a single NumPy operation
+BATCH_SIZE = 2 ** 20
+
 
 class TwoOpt(TravelingSalesmanMoveGenerator):
+    """
+    Generates moves reversing a part of the route.
+
+    Without candidate lists the whole neighbourhood can be evaluated in batch:
+    gains of all the (i1, i2) pairs are computed with NumPy, a block of i1 rows at a time.
+    """
+
+    @property
+    def supports_batch_evaluation(self) -> bool:
+        return self.neighbours is None
+
+    def best_improving_move(self, state: TravelingSalesmanState, goal: Goal, worst: bool = False) -> Union[TwoOptMove, None]:
+        route = state.route
+        # moves reverse route[i1:i2] for 1 <= i1 < i2 <= len(route) - 2,
+        # columns of the gain arrays correspond to i2 - 1
+        lengths = self.distances.edge_lengths(route[:-1], route[1:])
+        columns = np.arange(len(route) - 2)
+        best_move, best_improvement = None, None
+        block = max(1, BATCH_SIZE // len(route))
+        for first in range(1, len(route) - 2, block):
+            i1 = np.arange(first, min(first + block, len(route) - 2))
+            added = self.distances.rows(route[i1 - 1])[:, route[:-2]] + self.distances.rows(route[i1])[:, route[1:-1]]
+            removed = lengths[i1 - 1, None] + lengths[None, :-1]
+            improvements = (added - removed) * goal.type().value
+            invalid = (columns[None, :] < i1[:, None]) | (improvements <= 0)
+            if worst:
+                improvements[invalid] = np.inf
+                row, column = np.unravel_index(np.argmin(improvements), improvements.shape)
+            else:
+                improvements[invalid] = -np.inf
+                row, column = np.unravel_index(np.argmax(improvements), improvements.shape)
+            if invalid[row, column]:
+                continue
+            improvement = improvements[row, column]
+            if best_improvement is None or (improvement < best_improvement if worst else improvement > best_improvement):
+                best_move, best_improvement = TwoOptMove(state, int(i1[row]), int(column) + 1), improvement
+        if best_move is not None:
+            best_move.length_delta = float(best_improvement) * goal.type().value
+        return best_move
 
     def available_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
-        for i1 in range(1, len(state.route) - 2):
-            for i2 in range(i1 + 1, len(state.route) - 1):
-                yield TwoOptMove(state, i1, i2)
+        if self.neighbours is not None:
+            yield from self._candidate_moves(state, self._candidate_positions(state))
+            return
+        for i1, i2 in self._position_pairs(state):
+            yield TwoOptMove(state, i1, i2)
 
     def random_moves(self, state: TravelingSalesmanState) -> Generator[Move[TravelingSalesmanState], None, None]:
+        if self.neighbours is not None:
+            yield from self._candidate_moves(state, self._random_candidate_positions(state))
+            return
         while True:
-            i1 = random.randrange(1, len(state.route) - 2)
-            i2 = random.randrange(i1 + 1, len(state.route) - 1)
+            i1 = random.randrange(1, len(state.tour) - 2)
+            i2 = random.randrange(i1 + 1, len(state.tour) - 1)
             yield TwoOptMove(state, i1, i2)
 
-
-
+    def _candidate_moves(self, state: TravelingSalesmanState, candidate_positions) -> Generator[Move[TravelingSalesmanState], None, None]:
+        """
+        Generates moves that add an edge between the city and its candidate,
+        together with an edge either between their successors or between their predecessors
+        """
+        last = len(state.tour) - 1
+        for position, candidate_position in candidate_positions:
+            start, end = min(position, candidate_position), max(position, candidate_position)
+            # the depot is both at the beginning and at the end of the route
+            if end - start >= 2:
+                yield TwoOptMove(state, start + 1, end + 1)
+            if start == 0:
+                start, end = end, last
+            if start >= 1 and end - start >= 2:
+                yield TwoOptMove(state, start, end)
@@ -1,46 +1,91 @@
+import warnings
+from dataclasses import dataclass, asdict
 from io import TextIOWrapper
-from typing import Iterable, List, Union
-import random
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+import numpy as np
+
 from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.helpers.parse_generator_spec import parse_generator_spec
 from local_search.problems.base.problem import Problem, Goal
+from local_search.problems.traveling_salesman_problem.generators import GENERATORS
 from local_search.problems.traveling_salesman_problem.goal import TravelingSalesmanGoal, Distance
+from local_search.problems.traveling_salesman_problem.models.distance_oracle import \
+    DistanceOracle
 from local_search.problems.traveling_salesman_problem.models.point import \
     Point
+from local_search.problems.traveling_salesman_problem.models.tour import Tour
 from local_search.problems.traveling_salesman_problem.models.salesman import \
     Salesman
 from local_search.problems.traveling_salesman_problem.moves.move_generator import \
     TravelingSalesmanMoveGenerator
 from local_search.problems.traveling_salesman_problem.state import \
     TravelingSalesmanState
+from local_search.problems.traveling_salesman_problem.tour_constructions.tour_construction import \
+    TourConstruction
+from local_search.problems.traveling_salesman_problem.tsplib import is_tsplib, read_tsplib
+
+
+@dataclass
+class TravelingSalesmanProblemConfig:
+    distances_max_mb: int = 256
+    neighbour_list_size: int = 0  # 0 means "all the cities"
+    dont_look_bits: bool = False
+    initial_tour: str = 'random_tour'
+    tour: str = 'array_tour'
+
+
+DEFAULT_CONFIG = TravelingSalesmanProblemConfig()
 
 
 class TravelingSalesmanProblem(Problem):
 
-    def __init__(self, points: List[Point],
+    def __init__(self, points: Union[np.ndarray, List[Point], None],
                  depot_idx: int,
                  move_generator_name: Union[str, None] = None,
-                 goal_name: Union[str, None] = "distance"):
-        self._points: List[Point] = points
+                 goal_name: Union[str, None] = "distance",
+                 config: TravelingSalesmanProblemConfig = None,
+                 metric: str = 'euclidean',
+                 distance_matrix: Union[np.ndarray, None] = None):
+        self.config = config or DEFAULT_CONFIG
+        if self.config.initial_tour not in TourConstruction.tour_constructions:
+            raise ValueError(f'Unknown initial tour {self.config.initial_tour}, '
+                             f'available tour constructions are: {", ".join(TourConstruction.tour_constructions)}')
+        if self.config.tour not in Tour.tours:
+            raise ValueError(f'Unknown tour {self.config.tour}, available tours are: {", ".join(Tour.tours)}')
         self.depot_idx = depot_idx
-        initial_solution = self.random_state()
+        self.has_points = points is not None
+        self.distances = DistanceOracle(points, self.config.distances_max_mb, metric, distance_matrix)
+        self.neighbours = self.distances.nearest_neighbours(
+            self.config.neighbour_list_size) if self.config.neighbour_list_size > 0 else None
+        self.tour_construction = TourConstruction.tour_constructions[self.config.initial_tour](
+            self.distances, self.neighbours)
+        self.tour_type = Tour.tours[self.config.tour]
+        initial_solution = TravelingSalesmanState(
+            points=self.distances.coordinates, route=self.tour_construction.construct(self.depot_idx),
+            tour_type=self.tour_type)
         move_generator_name = move_generator_name or list(
             self.get_available_move_generation_strategies())[0]
         move_generator = TravelingSalesmanMoveGenerator.move_generators[move_generator_name](
-        )
+            self.distances, self.neighbours, self.config.dont_look_bits)
         goal_name = goal_name or list(self.get_available_goals())[0]
-        goal = TravelingSalesmanGoal.goals[goal_name](self._points)
+        goal = TravelingSalesmanGoal.goals[goal_name](self.distances)
         super().__init__(initial_solution, move_generator, goal)
 
     @property
-    def points(self):
-        return self._points
+    def points(self) -> np.ndarray:
+        """
+        Array with coordinates of the cities
+        """
+        return self.distances.coordinates
 
     def random_state(self) -> TravelingSalesmanState:
-        route = [idx for idx in range(
-            len(self._points)) if idx != self.depot_idx]
-        random.shuffle(route)
-        naive_circle = [self.depot_idx] + route + [self.depot_idx]
-        return TravelingSalesmanState(points=self.points, route=naive_circle)
+        """
+        Creates a route with the configured construction heuristic, randomized so that restarts start from different routes
+        """
+        route = self.tour_construction.construct(self.depot_idx, randomized=True)
+        return TravelingSalesmanState(points=self.distances.coordinates, route=route, tour_type=self.tour_type)
 
     @staticmethod
     def get_available_move_generation_strategies() -> Iterable[str]:
@@ -50,27 +95,100 @@ class TravelingSalesmanProblem(Problem):
     def get_available_goals() -> Iterable[str]:
         return TravelingSalesmanGoal.goals.keys()
 
+    @staticmethod
+    def get_available_tour_constructions() -> Iterable[str]:
+        return TourConstruction.tour_constructions.keys()
+
+    @staticmethod
+    def get_available_tours() -> Iterable[str]:
+        return Tour.tours.keys()
+
     @classmethod
-    def from_benchmark(cls, benchmark_name: str, move_generator_name: str = None, goal_name: str = "distance"):
-        with open(cls.get_path_to_benchmarks()/benchmark_name) as benchmark_file:
+    def get_available_config_values(cls) -> Dict[str, Iterable[str]]:
+        return {'initial_tour': cls.get_available_tour_constructions(), 'tour': cls.get_available_tours()}
+
+    @classmethod
+    def from_benchmark(cls, benchmark_name: str, move_generator_name: str = None, goal_name: str = "distance",
+                       config: TravelingSalesmanProblemConfig = None):
+        """
+        Creates the problem from a bundled benchmark, from a file at the given path
+        in the format of the bundled benchmarks or in the TSPLIB format,
+        or from a synthetic benchmark specification like "clustered:n=100000,seed=1"
+        """
+        if parse_generator_spec(benchmark_name, GENERATORS) is not None:
+            return cls(
+                points=cls.generate_points(benchmark_name),
+                depot_idx=0,
+                move_generator_name=move_generator_name,
+                goal_name=goal_name,
+                config=config
+            )
+        path = cls.get_path_to_benchmarks()/benchmark_name
+        if not path.is_file():
+            path = Path(benchmark_name)
+        if is_tsplib(path):
+            instance = read_tsplib(path)
+            return cls(
+                points=instance.coordinates,
+                depot_idx=instance.depot_idx,
+                move_generator_name=move_generator_name,
+                goal_name=goal_name,
+                config=config,
+                metric=instance.metric,
+                distance_matrix=instance.distance_matrix
+            )
+        with open(path) as benchmark_file:
             depot_idx, points = cls.parse_model(benchmark_file)
             return cls(
                 points=points,
                 depot_idx=depot_idx,
                 move_generator_name=move_generator_name,
-                goal_name=goal_name
+                goal_name=goal_name,
+                config=config
             )
 
+    @staticmethod
+    def get_available_generators() -> Iterable[str]:
+        return GENERATORS.keys()
+
+    @staticmethod
+    def generate_points(spec: str) -> np.ndarray:
+        """
+        Creates coordinates of the cities of the synthetic benchmark, the first city is the depot
+        """
+        generated = parse_generator_spec(spec, GENERATORS)
+        if generated is None:
+            raise ValueError(f'Unknown generator in {spec}, available generators are: {", ".join(GENERATORS)}')
+        name, params = generated
+        return GENERATORS[name](**params)
+
+    @classmethod
+    def save_generated_benchmark(cls, spec: str, path: Union[str, Path]) -> None:
+        """
+        Saves the synthetic benchmark to a file in the format of the bundled benchmarks
+        """
+        points = cls.generate_points(spec)
+        with open(path, 'w') as file:
+            file.write('0\n')
+            np.savetxt(file, points, fmt='%d')
+
     @classmethod
     def parse_model(cls, file_buffer: TextIOWrapper):
+        """
+        Parses the depot index followed by lines with integer coordinates of the cities into an array
+        """
+        name = getattr(file_buffer, 'name', 'The benchmark')
         depot_idx = int(file_buffer.readline())
-
-        def line_to_point(line: str):
-            (x, y) = map(int, line.split(sep=' '))
-            return Point(x, y)
-        points = list(
-            map(line_to_point, [line for line in file_buffer]))
-        return depot_idx, points
+        with warnings.catch_warnings():
+            # numpy stops at something other than a number with a warning, newer versions raise ValueError instead
+            warnings.simplefilter('error', DeprecationWarning)
+            try:
+                numbers = np.fromstring(file_buffer.read(), dtype=np.int64, sep=' ')
+            except (DeprecationWarning, ValueError):
+                raise ValueError(f'{name} contains lines that are not coordinates of cities') from None
+        if len(numbers) % 2:
+            raise ValueError(f'{name} contains a city without its second coordinate')
+        return depot_idx, numbers.reshape(-1, 2)
 
     @classmethod
     def parse_route(cls, file_buffer: TextIOWrapper):
@@ -81,12 +199,19 @@ class TravelingSalesmanProblem(Problem):
         base = super().asdict()
         return {
             'depot_idx': self.depot_idx,
-            'points': [(point.x, point.y) for point in self.points],
+            'points': [tuple(point) for point in self.points.tolist()] if self.has_points else None,
+            'config': asdict(self.config),
+            'metric': self.distances.metric,
+            'distance_matrix': self.distances.matrix.tolist() if self.distances.metric == 'explicit' else None,
             **base
         }
 
     @classmethod
     def from_dict(cls, data):
-        data['points'] = [Point(x=point_tuple[0], y=point_tuple[1])
-                          for point_tuple in data['points']]
+        if data['points'] is not None:
+            data['points'] = np.array(data['points'])
+        if data.get('distance_matrix') is not None:
+            data['distance_matrix'] = np.array(data['distance_matrix'])
+        if 'config' in data:
+            data['config'] = TravelingSalesmanProblemConfig(**data['config'])
         return cls(**data)
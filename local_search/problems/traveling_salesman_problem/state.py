@@ -1,48 +1,90 @@
+from typing import Iterable, Type, Union
 
-from dataclasses import dataclass
-from typing import Iterable, List, Tuple
+import numpy as np
 
 from local_search.problems.base.state import State
 from local_search.problems.traveling_salesman_problem.models.edge import \
     Edge
-from random import sample
+from local_search.problems.traveling_salesman_problem.models.tour import ArrayTour, Tour
 
-from local_search.problems.traveling_salesman_problem.models.point import Point
 
-
-@dataclass
 class TravelingSalesmanState(State):
-    route: List[int]
-    points: List[Point]
+    """
+    Route of the salesman, which starts and ends in the depot, stored in a `Tour`.
+
+    `points` is an immutable array with coordinates of the cities shared by all the states
+    of a problem, so copying a state copies only its tour.
+    Moves modify the tour in place with `reverse`, `swap` and `exchange_segments`.
+
+    `length` of the route is cached by the goal and cleared whenever the route changes,
+    unless the move changing it knows the change of the length.
+    """
+    __slots__ = ('tour', 'points', 'dont_look_bits', 'length')
+
+    def __init__(self, route: Union[np.ndarray, Iterable[int]], points: np.ndarray, tour_type: Type[Tour] = ArrayTour):
+        self.tour = tour_type(route)
+        self.points = points
+        # cities, which have no improving move since their incident edges last changed
+        self.dont_look_bits: Union[np.ndarray, None] = None
+        self.length: Union[float, None] = None
 
     def __str__(self):
-        return str.join(" -> ", map(lambda idx: f'({self.points[idx].x}, {self.points[idx].y})', self.route))
+        return str.join(" -> ", map(lambda idx: f'({self.points[idx][0]:g}, {self.points[idx][1]:g})', self.route))
+
+    @property
+    def route(self) -> np.ndarray:
+        return self.tour.route
 
     @property
     def edges(self) -> Iterable[Edge]:
         not_connected_edges = zip(
-            self.route,
-            self.route[1:] + [self.route[0]]
+            self.route.tolist(),
+            np.roll(self.route, -1).tolist()
         )
         return map(lambda edge: Edge(edge[0], edge[1]), not_connected_edges)
 
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Positions of the cities on the route, the depot is placed at the beginning of the route
+        """
+        return self.tour.positions
+
+    def copy(self) -> 'TravelingSalesmanState':
+        new_state = TravelingSalesmanState.__new__(TravelingSalesmanState)
+        new_state.tour = self.tour.copy()
+        new_state.points = self.points
+        new_state.dont_look_bits = self.dont_look_bits.copy() if self.dont_look_bits is not None else None
+        new_state.length = self.length
+        return new_state
+
+    def reverse(self, i1: int, i2: int) -> None:
+        self.tour.reverse(i1, i2)
+        self.length = None
+
+    def swap(self, i1: int, i2: int) -> None:
+        self.tour.swap(i1, i2)
+        self.length = None
+
+    def exchange_segments(self, i1: int, i2: int, i3: int) -> None:
+        self.tour.exchange_segments(i1, i2, i3)
+        self.length = None
+
     def __eq__(self, other):
         if other is None:
             return False
-        is_any_idx_differs = any(
-            self.route[i] != other.route[i] for i in range(len(self.route)))
-        return not is_any_idx_differs
+        return np.array_equal(self.route, other.route)
 
     def asdict(self):
         base = super().asdict()
         return {
-            'route': self.route,
-            'points': [(point.x, point.y) for point in self.points],
+            'route': self.route.tolist(),
+            'points': [tuple(point) for point in self.points.tolist()],
             **base
         }
 
     @classmethod
     def from_dict(cls, data):
-        data['points'] = [Point(x=point_tuple[0], y=point_tuple[1])
-                          for point_tuple in data['points']]
+        data['points'] = np.array(data['points'])
+        data['points'].setflags(write=False)
         return cls(**data)
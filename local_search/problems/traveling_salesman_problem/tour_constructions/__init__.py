@@ -0,0 +1,4 @@
+from local_search.problems.traveling_salesman_problem.tour_constructions.random_tour import RandomTour
+from local_search.problems.traveling_salesman_problem.tour_constructions.nearest_neighbour import NearestNeighbour
+from local_search.problems.traveling_salesman_problem.tour_constructions.greedy_edge import GreedyEdge
+from local_search.problems.traveling_salesman_problem.tour_constructions.space_filling_curve import SpaceFillingCurve
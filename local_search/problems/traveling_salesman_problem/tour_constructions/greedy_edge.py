@@ -0,0 +1,70 @@
+import random
+from typing import List
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.models.nearest_city_search import NearestCitySearch
+from local_search.problems.traveling_salesman_problem.tour_constructions.tour_construction import TourConstruction
+
+# randomized routes lengthen each edge by a random factor up to this fraction before sorting them
+RANDOMIZATION = 0.1
+
+
+class GreedyEdge(TourConstruction):
+    """
+    Adds edges to the nearest candidates from the shortest one, skipping edges that would give a city
+    a third edge or close a cycle. The resulting paths are joined by going from the end of each path
+    to the nearest end of another one.
+    """
+
+    def construct(self, depot_idx: int, randomized: bool = False) -> np.ndarray:
+        n_cities = len(self.distances)
+        neighbours = self._candidates()
+        starts = np.repeat(np.arange(n_cities), neighbours.shape[1])
+        ends = neighbours.ravel()
+        starts, ends = np.minimum(starts, ends), np.maximum(starts, ends)
+        _, unique = np.unique(starts.astype(np.int64) * n_cities + ends, return_index=True)
+        starts, ends = starts[unique], ends[unique]
+        lengths = self.distances.edge_lengths(starts, ends)
+        if randomized:
+            lengths = lengths * (1 + RANDOMIZATION * np.random.default_rng(random.getrandbits(32)).random(len(lengths)))
+        order = np.argsort(lengths, kind='stable')
+
+        adjacency = [[] for _ in range(n_cities)]
+        fragments = list(range(n_cities))
+
+        def find(city: int) -> int:
+            while fragments[city] != city:
+                fragments[city] = fragments[fragments[city]]
+                city = fragments[city]
+            return city
+
+        for start, end in zip(starts[order].tolist(), ends[order].tolist()):
+            if len(adjacency[start]) < 2 and len(adjacency[end]) < 2:
+                start_fragment, end_fragment = find(start), find(end)
+                if start_fragment != end_fragment:
+                    fragments[start_fragment] = end_fragment
+                    adjacency[start].append(end)
+                    adjacency[end].append(start)
+        return self._close_route(np.array(self._join_fragments(adjacency, depot_idx), dtype=np.int32), depot_idx)
+
+    def _join_fragments(self, adjacency: List[List[int]], depot_idx: int) -> List[int]:
+        """
+        Walks the paths one after another, moving from the end of a path to the nearest end of the remaining paths
+        """
+        path_ends = [city for city, cities in enumerate(adjacency) if len(cities) < 2]
+        search = NearestCitySearch(self.distances.coordinates, np.array(path_ends))
+        order = []
+        city = depot_idx if len(adjacency[depot_idx]) < 2 else path_ends[0]
+        while city is not None:
+            search.remove(city)
+            previous = None
+            while True:
+                order.append(city)
+                next_cities = [next_city for next_city in adjacency[city] if next_city != previous]
+                if not next_cities:
+                    break
+                previous, city = city, next_cities[0]
+            search.remove(city)
+            city = search.nearest(city)
+        return order
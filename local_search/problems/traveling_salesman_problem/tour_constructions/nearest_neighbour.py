@@ -0,0 +1,33 @@
+import random
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.models.nearest_city_search import NearestCitySearch
+from local_search.problems.traveling_salesman_problem.tour_constructions.tour_construction import TourConstruction
+
+
+class NearestNeighbour(TourConstruction):
+    """
+    Starting from the depot (or from a random city, if randomized), always goes to the nearest unvisited city.
+
+    The nearest unvisited city is looked up among the candidates of the city first,
+    only if all of them are visited the spatial index of the remaining cities is searched.
+    """
+
+    def construct(self, depot_idx: int, randomized: bool = False) -> np.ndarray:
+        n_cities = len(self.distances)
+        neighbours = self._candidates()
+        search = NearestCitySearch(self.distances.coordinates)
+        visited = np.zeros(n_cities, dtype=bool)
+        order = np.empty(n_cities, dtype=np.int32)
+        city = random.randrange(n_cities) if randomized else depot_idx
+        for step in range(n_cities):
+            order[step] = city
+            visited[city] = True
+            search.remove(city)
+            if step == n_cities - 1:
+                break
+            candidates = neighbours[city]
+            unvisited = candidates[~visited[candidates]]
+            city = unvisited[0] if len(unvisited) else search.nearest(city)
+        return self._close_route(order, depot_idx)
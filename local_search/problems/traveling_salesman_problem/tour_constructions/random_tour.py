@@ -0,0 +1,16 @@
+import random
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.tour_constructions.tour_construction import TourConstruction
+
+
+class RandomTour(TourConstruction):
+    """
+    Visits the cities in a random order
+    """
+
+    def construct(self, depot_idx: int, randomized: bool = False) -> np.ndarray:
+        route = [idx for idx in range(len(self.distances)) if idx != depot_idx]
+        random.shuffle(route)
+        return np.array([depot_idx] + route + [depot_idx], dtype=np.int32)
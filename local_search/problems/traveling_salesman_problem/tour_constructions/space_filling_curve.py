@@ -0,0 +1,47 @@
+import random
+from math import cos, pi, sin
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.tour_constructions.tour_construction import TourConstruction
+
+# cities are placed on a grid with 2^ORDER cells along each side
+ORDER = 16
+
+
+class SpaceFillingCurve(TourConstruction):
+    """
+    Visits the cities in the order of the Hilbert curve passing through the bounding box of the cities.
+    Randomized routes come from curves through the cities rotated by a random angle.
+    """
+
+    def construct(self, depot_idx: int, randomized: bool = False) -> np.ndarray:
+        coordinates = self.distances.coordinates.astype(float)
+        if randomized:
+            angle = random.uniform(0, 2 * pi)
+            coordinates = coordinates @ np.array([[cos(angle), sin(angle)], [-sin(angle), cos(angle)]])
+        coordinates = coordinates - coordinates.min(axis=0)
+        scale = ((1 << ORDER) - 1) / max(coordinates.max(), 1e-12)
+        cells = (coordinates * scale).astype(np.int64)
+        order = np.argsort(self._hilbert_indices(cells[:, 0], cells[:, 1]), kind='stable')
+        return self._close_route(order, depot_idx)
+
+    @staticmethod
+    def _hilbert_indices(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Returns distances along the Hilbert curve for cells of the grid
+        """
+        indices = np.zeros(len(x), dtype=np.int64)
+        side = 1 << ORDER
+        quadrant_side = side // 2
+        while quadrant_side > 0:
+            right = (x & quadrant_side) > 0
+            top = (y & quadrant_side) > 0
+            indices += quadrant_side * quadrant_side * ((3 * right) ^ top)
+            # rotates the quadrant, so that the curve inside it starts in the lower left corner
+            flipped = ~top & right
+            x = np.where(flipped, side - 1 - x, x)
+            y = np.where(flipped, side - 1 - y, y)
+            x, y = np.where(top, x, y), np.where(top, y, x)
+            quadrant_side //= 2
+        return indices
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Union
+
+import numpy as np
+
+from local_search.helpers.camel_to_snake import camel_to_snake
+from local_search.problems.traveling_salesman_problem.models.distance_oracle import DistanceOracle
+
+# number of the nearest cities used as candidates, if the problem has no candidate lists
+CANDIDATES = 10
+
+
+class TourConstruction(ABC):
+    """
+    Base class for heuristics creating routes for traveling salesman problem
+
+    `neighbours` (candidate lists of the nearest cities) are reused if the problem computed them,
+    otherwise constructions needing them compute lists of `CANDIDATES` nearest cities.
+    """
+    tour_constructions = {}
+
+    def __init_subclass__(cls):
+        TourConstruction.tour_constructions[camel_to_snake(cls.__name__)] = cls
+
+    def __init__(self, distances: DistanceOracle, neighbours: Union[np.ndarray, None] = None):
+        self.distances = distances
+        self.neighbours = neighbours
+
+    @abstractmethod
+    def construct(self, depot_idx: int, randomized: bool = False) -> np.ndarray:
+        """
+        Creates a route starting and ending in the depot.
+        Randomized routes differ between calls, so they can be used to restart the search.
+        """
+
+    def _candidates(self) -> np.ndarray:
+        if self.neighbours is None:
+            self.neighbours = self.distances.nearest_neighbours(CANDIDATES)
+        return self.neighbours
+
+    @staticmethod
+    def _close_route(order: np.ndarray, depot_idx: int) -> np.ndarray:
+        """
+        Rotates the cyclic order of all the cities to start in the depot and returns to the depot at the end
+        """
+        start = int(np.flatnonzero(order == depot_idx)[0])
+        return np.concatenate((order[start:], order[:start], [depot_idx])).astype(np.int32)
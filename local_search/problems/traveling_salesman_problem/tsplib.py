@@ -0,0 +1,164 @@
+import mmap
+import re
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Union
+
+import numpy as np
+
+# supported edge weight types and metrics of `DistanceOracle` corresponding to them
+METRICS = {
+    'EUC_2D': 'euc_2d',
+    'CEIL_2D': 'ceil_2d',
+    'ATT': 'att',
+    'GEO': 'geo',
+    'EXPLICIT': 'explicit',
+}
+# keyword line ending a section
+NEXT_KEYWORD = re.compile(rb'^[ \t]*[A-Za-z]', re.MULTILINE)
+# formats of columnwise listed triangles and the same triangles listed by rows
+COLUMN_FORMATS = {
+    'UPPER_COL': 'LOWER_ROW',
+    'LOWER_COL': 'UPPER_ROW',
+    'UPPER_DIAG_COL': 'LOWER_DIAG_ROW',
+    'LOWER_DIAG_COL': 'UPPER_DIAG_ROW',
+}
+
+
+@dataclass
+class TsplibInstance:
+    """
+    Traveling salesman problem read from a TSPLIB file.
+
+    `coordinates` are None for explicit matrices without the display data.
+    The depot is the first city of the depot section, or the first city if there is no such section.
+    """
+    name: str
+    coordinates: Union[np.ndarray, None]
+    metric: str
+    distance_matrix: Union[np.ndarray, None] = None
+    depot_idx: int = 0
+
+
+def is_tsplib(path: Union[str, Path]) -> bool:
+    """
+    Tells whether the file starts with a TSPLIB keyword, rather than with a number
+    """
+    with open(path, 'rb') as file:
+        return file.read(64).lstrip()[:1].isalpha()
+
+
+def read_tsplib(path: Union[str, Path]) -> TsplibInstance:
+    """
+    Reads a symmetric TSPLIB instance. The file is memory-mapped and the known number of values
+    of each section is parsed at once into an array, so that huge instances are read in a few seconds.
+    """
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        specification = _read_specification(data)
+        dimension = int(specification['DIMENSION'])
+        edge_weight_type = specification.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+        if edge_weight_type not in METRICS:
+            raise ValueError(f'Unsupported edge weight type {edge_weight_type} of {path}, '
+                             f'supported types are: {", ".join(METRICS)}')
+        if edge_weight_type == 'EXPLICIT':
+            matrix = _read_matrix(data, dimension, specification.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX'))
+            coordinates = _read_coordinates(data, b'DISPLAY_DATA_SECTION', dimension)
+        else:
+            matrix = None
+            coordinates = _read_coordinates(data, b'NODE_COORD_SECTION', dimension)
+            if coordinates is None:
+                raise ValueError(f'{path} has no node coordinates')
+        depots = _read_section(data, b'DEPOT_SECTION', end=b'-1')
+        depots = depots if depots is not None else ()
+        return TsplibInstance(
+            name=specification.get('NAME', Path(path).stem),
+            coordinates=coordinates,
+            metric=METRICS[edge_weight_type],
+            distance_matrix=matrix,
+            depot_idx=int(depots[0]) - 1 if len(depots) else 0
+        )
+
+
+def _read_specification(data: mmap.mmap) -> Dict[str, str]:
+    """
+    Reads "KEY : VALUE" lines preceding the first section
+    """
+    specification = {}
+    data.seek(0)
+    for line in iter(data.readline, b''):
+        if not line.strip():
+            continue
+        key, separator, value = line.decode().partition(':')
+        if not separator:
+            break
+        specification[key.strip().upper()] = value.strip()
+    return specification
+
+
+def _read_section(data: mmap.mmap, section: bytes, count: int = -1, end: bytes = None) -> Union[np.ndarray, None]:
+    """
+    Parses `count` numbers of the section (or the numbers up to the `end` marker) into a flat array,
+    returns None if there is no such section.
+    The section ends at the next keyword, like EOF, so that numpy only gets the numbers to parse.
+    """
+    start = data.find(b'\n' + section, 0)
+    if start < 0:
+        return None
+    start = data.find(b'\n', start + 1) + 1
+    keyword = NEXT_KEYWORD.search(data, start) if start > 0 else None
+    stop = keyword.start() if keyword is not None else len(data)
+    marker = data.find(end, start, stop) if end is not None else -1
+    stop = marker if marker >= 0 else stop
+    with warnings.catch_warnings():
+        # numpy stops at something other than a number with a warning, newer versions raise ValueError instead
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            numbers = np.fromstring(data[start:stop], sep=' ') if start > 0 else None
+        except (DeprecationWarning, ValueError):
+            numbers = None
+    if numbers is None or count >= 0 and len(numbers) < count:
+        expected = f'{count} numbers' if count >= 0 else 'only numbers'
+        raise ValueError(f'{section.decode()} should contain {expected}')
+    return numbers[:count] if count >= 0 else numbers
+
+
+def _read_coordinates(data: mmap.mmap, section: bytes, dimension: int) -> Union[np.ndarray, None]:
+    numbers = _read_section(data, section, 3 * dimension)
+    if numbers is None:
+        return None
+    numbers = numbers.reshape(-1, 3)
+    cities = numbers[:, 0].astype(np.int64) - 1
+    if np.array_equal(cities, np.arange(dimension)):
+        return numbers[:, 1:].copy()
+    coordinates = np.empty((dimension, 2))
+    coordinates[cities] = numbers[:, 1:]
+    return coordinates
+
+
+def _read_matrix(data: mmap.mmap, dimension: int, edge_weight_format: str) -> np.ndarray:
+    """
+    Creates a symmetric distance matrix from the weights listed in the given format
+    """
+    if edge_weight_format == 'FULL_MATRIX':
+        return _read_weights(data, dimension * dimension).reshape(dimension, dimension)
+    edge_weight_format = COLUMN_FORMATS.get(edge_weight_format, edge_weight_format)
+    offset = 0 if 'DIAG' in edge_weight_format else 1
+    if edge_weight_format in ('UPPER_ROW', 'UPPER_DIAG_ROW'):
+        rows, columns = np.triu_indices(dimension, offset)
+    elif edge_weight_format in ('LOWER_ROW', 'LOWER_DIAG_ROW'):
+        rows, columns = np.tril_indices(dimension, -offset)
+    else:
+        raise ValueError(f'Unsupported edge weight format {edge_weight_format}')
+    weights = _read_weights(data, len(rows))
+    matrix = np.zeros((dimension, dimension))
+    matrix[rows, columns] = weights
+    matrix[columns, rows] = weights
+    return matrix
+
+
+def _read_weights(data: mmap.mmap, count: int) -> np.ndarray:
+    weights = _read_section(data, b'EDGE_WEIGHT_SECTION', count)
+    if weights is None:
+        raise ValueError('Explicit instance has no edge weight section')
+    return weights
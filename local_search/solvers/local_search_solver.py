@@ -26,6 +26,8 @@ class LocalSearchSolver(Solver):
             else:
                 solution_state = algorithm.best_state
                 break
+        else:
+            solution_state = algorithm.solution_state(solution_state)
 
         self.stop_timer()
         statistics = statistics_subscription.subscriber.statistics
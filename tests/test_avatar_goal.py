@@ -0,0 +1,39 @@
+import random
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from local_search.problems.avatar_problem.goal import ApproximateAvatar
+from local_search.problems.avatar_problem.moves import AddTriangle
+from local_search.problems.avatar_problem.state import AvatarState
+
+
+class ApproximateAvatarTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        rng = np.random.default_rng(0)
+        self.reference = Image.fromarray(rng.integers(0, 256, (30, 40, 3), dtype=np.uint8))
+        self.initial = AvatarState(rng.integers(0, 256, (30, 40, 3), dtype=np.uint8))
+
+    def test_long_chain_of_moves_is_scored_like_a_full_recompute(self):
+        goal = ApproximateAvatar(self.reference)
+        moves = AddTriangle(self.initial.size)
+        state = self.initial
+        for _ in range(1000):
+            state = next(moves.random_moves(state)).make()
+        self.assertEqual(goal.objective_for(state),
+                         ApproximateAvatar(self.reference).objective_for(AvatarState(state.canvas.copy())))
+
+    def test_scored_parent_chain_gives_the_same_errors(self):
+        goal = ApproximateAvatar(self.reference)
+        moves = AddTriangle(self.initial.size)
+        state = self.initial
+        goal.objective_for(state)
+        for _ in range(50):
+            state = next(moves.random_moves(state)).make()
+            goal.objective_for(state)
+        full = AvatarState(state.canvas.copy())
+        self.assertEqual(goal.objective_for(state), goal.objective_for(full))
+        np.testing.assert_array_equal(goal._error_of(state), goal._error_of(full))
@@ -0,0 +1,43 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from local_search.problems.graph_coloring_problem.dimacs import read_dimacs
+
+
+class ReadDimacsTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'graph.col'
+
+    def test_reads_edges_numbered_from_one(self):
+        self.path.write_text('c triangle\np edge 4 3\ne 1 2\ne 2 3\ne 3 1\n')
+        instance = read_dimacs(self.path)
+        self.assertEqual(instance.n_vertices, 4)
+        np.testing.assert_array_equal(instance.edges, [[0, 1], [1, 2], [2, 0]])
+
+    def test_rejects_malformed_edge_line(self):
+        self.path.write_text('p edge 3 2\ne 1 2\ne 2 x\n')
+        with self.assertRaisesRegex(ValueError, 'lines that are not edges'):
+            read_dimacs(self.path)
+
+    def test_reads_edge_lines_without_problem_line_as_numbered_from_one(self):
+        self.path.write_text('e 1 2\ne 2 3\ne 3 1\n')
+        instance = read_dimacs(self.path)
+        self.assertEqual(instance.n_vertices, 3)
+        np.testing.assert_array_equal(instance.edges, [[0, 1], [1, 2], [2, 0]])
+
+    def test_reads_plain_edge_list_as_numbered_from_zero(self):
+        self.path.write_text('0 1\n1 2\n')
+        instance = read_dimacs(self.path)
+        self.assertEqual(instance.n_vertices, 3)
+        np.testing.assert_array_equal(instance.edges, [[0, 1], [1, 2]])
+
+    def test_range_error_shows_numbering_of_the_file(self):
+        self.path.write_text('p edge 2 1\ne 1 3\n')
+        with self.assertRaisesRegex(ValueError, r'range 1\.\.2'):
+            read_dimacs(self.path)
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem, \
+    TravelingSalesmanProblemConfig
+
+FULL_ENUMERATION_GENERATORS = ('two_opt', 'swap_two_points', 'or_opt')
+
+
+class DontLookBitsTest(unittest.TestCase):
+
+    @staticmethod
+    def _problem(move_generator_name: str) -> TravelingSalesmanProblem:
+        config = TravelingSalesmanProblemConfig(dont_look_bits=True)
+        return TravelingSalesmanProblem.from_benchmark('problem_1', move_generator_name, config=config)
+
+    def test_full_enumeration_starts_moves_only_from_active_cities(self):
+        for move_generator_name in FULL_ENUMERATION_GENERATORS:
+            with self.subTest(move_generator=move_generator_name):
+                problem = self._problem(move_generator_name)
+                state = problem.initial_state.copy()
+                active = int(state.tour.city_at(len(state.tour) // 2))
+                state.dont_look_bits = np.ones(len(state.tour) - 1, dtype=bool)
+                state.dont_look_bits[active] = False
+                moves = list(problem.move_generator.available_moves(state))
+                self.assertTrue(moves)
+                for move in moves:
+                    removed_cities = {city for edge in move.changed_edges()[0] for city in (edge.start, edge.end)}
+                    self.assertIn(active, removed_cities)
+                self.assertTrue(state.dont_look_bits.all())
+                self.assertEqual(list(problem.move_generator.available_moves(state)), [])
+
+    def test_full_enumeration_without_set_bits_covers_all_moves(self):
+        for move_generator_name in ('two_opt', 'swap_two_points'):
+            with self.subTest(move_generator=move_generator_name):
+                problem = self._problem(move_generator_name)
+                state = problem.initial_state.copy()
+                pairs = {(move.i1, move.i2) for move in problem.move_generator.available_moves(state)}
+                last = len(state.tour) - 1
+                self.assertEqual(pairs, {(i1, i2) for i1 in range(1, last - 1) for i2 in range(i1 + 1, last)})
+
+    def test_undo_restores_bits_cleared_by_apply(self):
+        for move_generator_name in FULL_ENUMERATION_GENERATORS:
+            with self.subTest(move_generator=move_generator_name):
+                problem = self._problem(move_generator_name)
+                state = problem.initial_state.copy()
+                state.dont_look_bits = np.ones(len(state.tour) - 1, dtype=bool)
+                state.dont_look_bits[int(state.tour.city_at(1))] = False
+                bits, route = state.dont_look_bits.copy(), state.route.copy()
+                move = next(problem.move_generator.available_moves(state))
+                move.apply()
+                self.assertLess(int(state.dont_look_bits.sum()), int(bits.sum()))
+                move.undo()
+                np.testing.assert_array_equal(state.dont_look_bits, bits)
+                np.testing.assert_array_equal(state.route, route)
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+from local_search.cli.solve import create_path_to_save_solution
+from local_search.helpers.parse_generator_spec import parse_generator_spec
+from local_search.problems.graph_coloring_problem.generators import GENERATORS
+
+
+class ParseGeneratorSpecTest(unittest.TestCase):
+
+    def test_parses_name_and_params(self):
+        self.assertEqual(parse_generator_spec('gnp:n=50,p=0.1,seed=3', GENERATORS),
+                         ('gnp', {'n': 50, 'p': 0.1, 'seed': 3}))
+
+    def test_returns_none_for_benchmark_names(self):
+        self.assertIsNone(parse_generator_spec('problem_1', GENERATORS))
+
+    def test_rejects_param_without_value(self):
+        with self.assertRaisesRegex(ValueError, '"gnp:n=50,p"'):
+            parse_generator_spec('gnp:n=50,p', GENERATORS)
+
+    def test_rejects_unknown_param(self):
+        with self.assertRaisesRegex(ValueError, 'unknown parameters q, accepted parameters are: n, p, seed'):
+            parse_generator_spec('gnp:n=50,q=0.1', GENERATORS)
+
+    def test_rejects_missing_param(self):
+        with self.assertRaisesRegex(ValueError, 'missing parameters p'):
+            parse_generator_spec('gnp:n=50', GENERATORS)
+
+
+class SolutionPathTest(unittest.TestCase):
+
+    def test_spec_benchmark_gives_portable_file_name(self):
+        config = {
+            'problem': {'name': 'graph_coloring_problem', 'benchmark': 'flat:n=300,k=10,p=0.1,seed=3',
+                        'move_generator': 'kempe_chain', 'goal': 'min_feasible'},
+            'algorithm': {'name': 'tabu_col'},
+        }
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                path = create_path_to_save_solution(config)
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(path.name,
+                         'solution_graph_coloring_problem_flat_n=300_k=10_p=0.1_seed=3_kempe_chain_min_feasible_tabu_col.json')
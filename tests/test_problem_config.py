@@ -0,0 +1,53 @@
+import unittest
+from dataclasses import asdict
+from unittest import mock
+
+from local_search.cli.utils.create_dataclass import create_dataclass
+from local_search.problems.graph_coloring_problem.problem import GraphColoringProblem, GraphColoringProblemConfig
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem, \
+    TravelingSalesmanProblemConfig
+
+
+class TravelingSalesmanProblemConfigTest(unittest.TestCase):
+
+    def test_rejects_unknown_initial_tour(self):
+        config = TravelingSalesmanProblemConfig(initial_tour='greedy')
+        with self.assertRaisesRegex(ValueError, 'greedy_edge'):
+            TravelingSalesmanProblem.from_benchmark('problem_1', config=config)
+
+    def test_cli_prompts_again_for_unknown_initial_tour(self):
+        options = {**asdict(TravelingSalesmanProblemConfig()), 'initial_tour': 'greedy'}
+        with mock.patch('local_search.cli.utils.prompt.click.prompt', return_value='greedy_edge') as prompt:
+            config = create_dataclass(options, TravelingSalesmanProblemConfig,
+                                      TravelingSalesmanProblem.get_available_config_values())
+        self.assertEqual(config.initial_tour, 'greedy_edge')
+        self.assertEqual(prompt.call_count, 1)
+
+    def test_rejects_unknown_tour(self):
+        config = TravelingSalesmanProblemConfig(tour='array')
+        with self.assertRaisesRegex(ValueError, 'array_tour'):
+            TravelingSalesmanProblem.from_benchmark('problem_1', config=config)
+
+    def test_cli_prompts_again_for_unknown_tour(self):
+        options = {**asdict(TravelingSalesmanProblemConfig()), 'tour': 'array'}
+        with mock.patch('local_search.cli.utils.prompt.click.prompt', return_value='array_tour') as prompt:
+            config = create_dataclass(options, TravelingSalesmanProblemConfig,
+                                      TravelingSalesmanProblem.get_available_config_values())
+        self.assertEqual(config.tour, 'array_tour')
+        self.assertEqual(prompt.call_count, 1)
+
+
+class GraphColoringProblemConfigTest(unittest.TestCase):
+
+    def test_rejects_unknown_initial_coloring(self):
+        config = GraphColoringProblemConfig(initial_coloring='dsat')
+        with self.assertRaisesRegex(ValueError, 'dsatur'):
+            GraphColoringProblem.from_benchmark('problem_1', config=config)
+
+    def test_cli_prompts_again_for_unknown_initial_coloring(self):
+        options = {**asdict(GraphColoringProblemConfig()), 'initial_coloring': 'dsat'}
+        with mock.patch('local_search.cli.utils.prompt.click.prompt', return_value='dsatur') as prompt:
+            config = create_dataclass(options, GraphColoringProblemConfig,
+                                      GraphColoringProblem.get_available_config_values())
+        self.assertEqual(config.initial_coloring, 'dsatur')
+        self.assertEqual(prompt.call_count, 1)
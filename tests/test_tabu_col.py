@@ -0,0 +1,32 @@
+import random
+import unittest
+
+import numpy as np
+
+from local_search.algorithms.tabu_col import TabuCol
+from local_search.problems.graph_coloring_problem.problem import GraphColoringProblem
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem
+from local_search.solvers.local_search_solver import LocalSearchSolver
+from local_search.solvers.solver_config import SolverConfig
+
+
+class TabuColTest(unittest.TestCase):
+
+    def test_solution_of_stopped_search_is_proper(self):
+        random.seed(0)
+        for benchmark in ('problem_1', 'problem_2', 'problem_3'):
+            with self.subTest(benchmark=benchmark):
+                problem = GraphColoringProblem.from_benchmark(benchmark, 'change_color', 'min_feasible')
+                solution = LocalSearchSolver(SolverConfig(time_limit=0.5)).solve(problem, TabuCol())
+                starts, ends = problem.adjacency.edges()
+                colors = solution.state.colors
+                self.assertEqual(int(np.count_nonzero(colors[starts] == colors[ends])), 0)
+
+    def test_rejects_other_problems(self):
+        problem = TravelingSalesmanProblem.from_benchmark('problem_1')
+        with self.assertRaises(ValueError):
+            TabuCol().next_state(problem, problem.initial_state)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.problem import TravelingSalesmanProblem
+
+
+class ParseModelTest(unittest.TestCase):
+
+    def test_reads_depot_and_cities(self):
+        depot_idx, points = TravelingSalesmanProblem.parse_model(io.StringIO('1\n1 2\n3 4\n5 6\n'))
+        self.assertEqual(depot_idx, 1)
+        np.testing.assert_array_equal(points, [[1, 2], [3, 4], [5, 6]])
+
+    def test_rejects_line_that_is_not_a_city(self):
+        with self.assertRaisesRegex(ValueError, 'not coordinates of cities'):
+            TravelingSalesmanProblem.parse_model(io.StringIO('0\n1 2\n3 4\nx y\n5 6\n'))
+
+    def test_rejects_city_without_second_coordinate(self):
+        with self.assertRaisesRegex(ValueError, 'without its second coordinate'):
+            TravelingSalesmanProblem.parse_model(io.StringIO('0\n1 2\n3\n'))
+
+    def test_error_names_the_benchmark_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'cities.txt'
+            path.write_text('0\n1 2\nx y\n')
+            with self.assertRaisesRegex(ValueError, 'cities.txt'):
+                TravelingSalesmanProblem.from_benchmark(str(path))
@@ -0,0 +1,34 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from local_search.problems.traveling_salesman_problem.tsplib import read_tsplib
+
+
+class ReadTsplibTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / 'instance.tsp'
+
+    def test_reads_node_coordinates(self):
+        self.path.write_text('NAME: square\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EUC_2D\n'
+                             'NODE_COORD_SECTION\n1 0 0\n2 3 0\n3 3 4\nEOF\n')
+        instance = read_tsplib(self.path)
+        self.assertEqual(instance.metric, 'euc_2d')
+        np.testing.assert_array_equal(instance.coordinates, [[0, 0], [3, 0], [3, 4]])
+
+    def test_rejects_truncated_node_coordinate_section(self):
+        self.path.write_text('NAME: square\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EUC_2D\n'
+                             'NODE_COORD_SECTION\n1 0 0\n2 3 0\nEOF\n')
+        with self.assertRaisesRegex(ValueError, 'NODE_COORD_SECTION should contain 9 numbers'):
+            read_tsplib(self.path)
+
+    def test_rejects_truncated_edge_weight_section(self):
+        self.path.write_text('NAME: triangle\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: EXPLICIT\n'
+                             'EDGE_WEIGHT_FORMAT: UPPER_ROW\nEDGE_WEIGHT_SECTION\n1 2\nEOF\n')
+        with self.assertRaisesRegex(ValueError, 'EDGE_WEIGHT_SECTION should contain 3 numbers'):
+            read_tsplib(self.path)